@@ -3,7 +3,7 @@ Main Controller
 """
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.config_manager import ConfigManager
@@ -151,6 +151,10 @@ class MainController:
         """Get a specific category by ID"""
         return self.config_manager.get_category(category_id)
 
+    def get_categories_bulk(self, category_ids: Iterable[str]) -> Dict[str, Category]:
+        """Get several categories by ID in one batch (dict keyed by str ID)"""
+        return self.config_manager.get_categories_bulk(category_ids)
+
     def set_current_category(self, category_id: str) -> bool:
         """Set the currently active category"""
         category = self.get_category(category_id)
@@ -257,6 +261,56 @@ class MainController:
         except Exception as e:
             logger.error(f"Error loading all categories: {e}", exc_info=True)
 
+    def reload_categories(self) -> List[Category]:
+        """
+        Reload all categories from database (invalidating caches)
+
+        Keeps active filters; returns the categories the sidebar should show.
+
+        Returns:
+            List of categories (filtered if filters are active)
+        """
+        self.invalidate_filter_cache()
+        self._all_categories = self.config_manager.load_default_categories()
+        self.categories = self._filtered_categories if self._filters_active else self._all_categories
+        logger.debug(f"Reloaded {len(self._all_categories)} categories from database")
+        return self.get_categories()
+
+    def reload_category(self, category_id) -> Optional[Category]:
+        """
+        Reload a single category (and its items) from database
+
+        Cheaper than a full reload when only one category changed (e.g. after
+        bulk-creating items in it). Replaces the category in the in-memory lists
+        and in the config manager cache.
+
+        Args:
+            category_id: Category ID (string or int)
+
+        Returns:
+            Optional[Category]: Reloaded category, or None if not found
+        """
+        category = self.config_manager.get_category(str(category_id))
+        if not category:
+            logger.warning(f"Category {category_id} not found while reloading")
+            return None
+
+        # Item counts changed - filter results may be stale
+        self.category_filter_engine.clear_cache()
+
+        lists = [self._all_categories, self._filtered_categories]
+        if self.config_manager._categories_cache is not None:
+            lists.append(self.config_manager._categories_cache)
+
+        for categories in lists:
+            for index, cat in enumerate(categories):
+                if cat.id == category.id:
+                    categories[index] = category
+                    break
+
+        logger.debug(f"Category {category.id} reloaded ({len(category.items)} items)")
+        return category
+
     def invalidate_filter_cache(self) -> None:
         """
         Invalidate filter engine cache when database changes
@@ -10,7 +10,7 @@ Responsabilidades:
 import logging
 import sys
 from pathlib import Path
-from typing import Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List
 from PyQt6.QtCore import QObject, pyqtSignal
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -82,6 +82,10 @@ class ProcessController(QObject):
         """Get process by ID"""
         return self.process_manager.get_process(process_id)
 
+    def get_processes_bulk(self, process_ids: List[int]) -> Dict[int, Process]:
+        """Get several processes by ID in one batch (dict keyed by process_id)"""
+        return self.process_manager.get_processes_bulk(process_ids)
+
     def get_process_steps(self, process_id: int) -> List:
         """Get all steps for a process"""
         process = self.process_manager.get_process(process_id)
@@ -89,13 +93,23 @@ class ProcessController(QObject):
             return process.steps
         return []
 
-    def get_all_processes(self, include_archived: bool = False, include_inactive: bool = False):
-        """Get all processes"""
+    def get_all_processes(self, include_archived: bool = False, include_inactive: bool = False,
+                          limit: Optional[int] = None, offset: int = 0,
+                          state: Optional[str] = None, search: Optional[str] = None):
+        """Get all processes (optionally one page of them, filtered by state/search)"""
         return self.process_manager.get_all_processes(
             include_archived=include_archived,
-            include_inactive=include_inactive
+            include_inactive=include_inactive,
+            limit=limit,
+            offset=offset,
+            state=state,
+            search=search
         )
 
+    def count_processes(self, state: Optional[str] = 'all', search: Optional[str] = None) -> int:
+        """Count processes matching a state filter and search text"""
+        return self.process_manager.count_processes(state=state, search=search)
+
     def delete_process(self, process_id: int) -> Tuple[bool, str]:
         """Delete a process"""
         return self.process_manager.delete_process(process_id)
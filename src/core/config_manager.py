@@ -155,6 +155,33 @@ class ConfigManager:
         except (ValueError, TypeError):
             return None
 
+    def get_categories_bulk(self, category_ids) -> Dict[str, Category]:
+        """
+        Get several categories (with their items) by ID using batched queries
+
+        Args:
+            category_ids: Iterable of numeric category IDs (string or int)
+
+        Returns:
+            Dict[str, Category]: Categories keyed by str(ID); missing IDs are skipped
+        """
+        try:
+            cat_ids = sorted({int(category_id) for category_id in category_ids})
+        except (ValueError, TypeError):
+            return {}
+
+        categories_data = self.db.get_categories_by_ids(cat_ids)
+        items_by_category = self.db.get_items_by_categories([cat_data['id'] for cat_data in categories_data])
+
+        categories = {}
+        for cat_data in categories_data:
+            category = self._dict_to_category(cat_data)
+            for item_data in items_by_category.get(cat_data['id'], []):
+                category.add_item(self._dict_to_item(item_data))
+            categories[str(cat_data['id'])] = category
+
+        return categories
+
     def add_category(self, category: Category) -> bool:
         """
         Add a new category
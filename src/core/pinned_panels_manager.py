@@ -21,8 +21,14 @@ class PinnedPanelsManager:
             db_manager: DBManager instance for database operations
         """
         self.db = db_manager
+        # Incremented on every write, lets views skip reloading unchanged data
+        self.revision = 0
         logger.info("PinnedPanelsManager initialized")
 
+    def mark_changed(self):
+        """Record that pinned panel data was written (bumps self.revision)"""
+        self.revision += 1
+
     def _serialize_filter_config(self, panel_widget) -> Optional[str]:
         """
         Serialize panel's filter configuration to JSON string
@@ -90,7 +96,7 @@ class PinnedPanelsManager:
                 filter_config.setdefault('state_filter', 'normal')
                 filter_config.setdefault('search_text', '')
 
-            logger.debug(f"Deserialized filter config: {filter_config}")
+            logger.debug("Deserialized filter config: %s", filter_config)
             return filter_config
 
         except json.JSONDecodeError as e:
@@ -100,6 +106,26 @@ class PinnedPanelsManager:
             logger.error(f"Unexpected error deserializing filter config: {e}", exc_info=True)
             return None
 
+    def _deserialize_filter_configs_bulk(self, panels: List[Dict]) -> Dict[int, Dict]:
+        """
+        Deserialize the filter configuration of several panels in one pass
+
+        Args:
+            panels: Panel rows (dicts with 'id' and 'filter_config')
+
+        Returns:
+            dict: panel_id -> filter configuration (panels without filters are omitted)
+        """
+        filter_configs = {}
+        for panel in panels:
+            raw_config = panel.get('filter_config')
+            if not raw_config:
+                continue
+            filter_config = self._deserialize_filter_config(raw_config)
+            if filter_config:
+                filter_configs[panel['id']] = filter_config
+        return filter_configs
+
     def _get_next_available_shortcut(self) -> str:
         """
         Get next available keyboard shortcut for a panel
@@ -143,6 +169,7 @@ class PinnedPanelsManager:
             int: Panel ID in database
         """
         try:
+            self.mark_changed()
             # Auto-assign keyboard shortcut if not provided
             if keyboard_shortcut is None:
                 keyboard_shortcut = self._get_next_available_shortcut()
@@ -180,6 +207,7 @@ class PinnedPanelsManager:
             include_filters: Whether to also update filter configuration (default True)
         """
         try:
+            self.mark_changed()
             update_data = {
                 'x_position': panel_widget.x(),
                 'y_position': panel_widget.y(),
@@ -222,11 +250,29 @@ class PinnedPanelsManager:
             panel_id: Panel ID in database
         """
         try:
+            self.mark_changed()
             self.db.update_panel_last_opened(panel_id)
             logger.debug(f"Panel {panel_id} marked as opened")
         except Exception as e:
             logger.error(f"Failed to mark panel as opened: {e}")
 
+    def mark_panels_opened_bulk(self, panel_ids: List[int]):
+        """
+        Update statistics for several opened panels at once (e.g. on startup restore)
+
+        Args:
+            panel_ids: List of panel IDs in database
+        """
+        if not panel_ids:
+            return
+
+        try:
+            self.mark_changed()
+            self.db.update_panels_last_opened(panel_ids)
+            logger.debug(f"{len(panel_ids)} panels marked as opened")
+        except Exception as e:
+            logger.error(f"Failed to mark panels as opened: {e}")
+
     def get_recent_history(self, limit: int = 10) -> List[Dict]:
         """
         Get recently used panels for history dropdown
@@ -253,6 +299,7 @@ class PinnedPanelsManager:
             panel_id: Panel ID to delete
         """
         try:
+            self.mark_changed()
             self.db.delete_pinned_panel(panel_id)
             logger.info(f"Panel {panel_id} deleted from database")
         except Exception as e:
@@ -267,6 +314,7 @@ class PinnedPanelsManager:
             panel_id: Panel ID to archive
         """
         try:
+            self.mark_changed()
             self.db.update_pinned_panel(panel_id, is_active=False)
             logger.info(f"Panel {panel_id} archived (marked as inactive)")
         except Exception as e:
@@ -281,6 +329,7 @@ class PinnedPanelsManager:
             panel_id: Panel ID to restore
         """
         try:
+            self.mark_changed()
             self.db.update_pinned_panel(panel_id, is_active=True)
             logger.info(f"Panel {panel_id} restored (marked as active)")
         except Exception as e:
@@ -293,6 +342,7 @@ class PinnedPanelsManager:
         This allows us to know which panels were active in the last session
         """
         try:
+            self.mark_changed()
             self.db.deactivate_all_panels()
             logger.info("All panels marked as inactive on application exit")
         except Exception as e:
@@ -310,6 +360,7 @@ class PinnedPanelsManager:
             keyboard_shortcut: New keyboard shortcut (None to keep unchanged)
         """
         try:
+            self.mark_changed()
             kwargs = {}
             if custom_name is not None:
                 kwargs['custom_name'] = custom_name
@@ -334,6 +385,7 @@ class PinnedPanelsManager:
             is_minimized: New minimized state
         """
         try:
+            self.mark_changed()
             self.db.update_pinned_panel(panel_id, is_minimized=is_minimized)
             logger.info(f"Updated panel {panel_id} minimize state to: {is_minimized}")
         except Exception as e:
@@ -430,6 +482,7 @@ class PinnedPanelsManager:
             int: Panel ID in database
         """
         try:
+            self.mark_changed()
             # Auto-assign keyboard shortcut if not provided
             if keyboard_shortcut is None:
                 keyboard_shortcut = self._get_next_available_shortcut()
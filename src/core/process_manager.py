@@ -11,7 +11,7 @@ Responsabilidades:
 import logging
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Add parent directories to path
@@ -119,14 +119,51 @@ class ProcessManager:
             logger.error(f"Error getting process {process_id}: {e}", exc_info=True)
             return None
 
+    def get_processes_bulk(self, process_ids: List[int]) -> Dict[int, Process]:
+        """
+        Get several processes with their steps using two queries in total
+
+        Args:
+            process_ids: List of process IDs
+
+        Returns:
+            Dict mapping process_id to Process (missing IDs are skipped)
+        """
+        try:
+            process_ids = list(process_ids)
+            processes_data = self.db.get_processes_by_ids(process_ids)
+            steps_by_process = self.db.get_process_steps_bulk(process_ids)
+
+            processes = {}
+            for process_data in processes_data:
+                process_id = process_data['id']
+                steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_by_process.get(process_id, [])]
+                processes[process_id] = Process.from_dict(process_data, steps=steps)
+
+            logger.debug(f"Retrieved {len(processes)}/{len(process_ids)} processes in bulk")
+            return processes
+
+        except Exception as e:
+            logger.error(f"Error getting processes in bulk: {e}", exc_info=True)
+            return {}
+
     def get_all_processes(self, include_archived: bool = False,
-                          include_inactive: bool = False) -> List[Process]:
+                          include_inactive: bool = False,
+                          limit: Optional[int] = None,
+                          offset: int = 0,
+                          state: Optional[str] = None,
+                          search: Optional[str] = None) -> List[Process]:
         """
         Get all processes with their steps
 
         Args:
             include_archived: Include archived processes
             include_inactive: Include inactive processes
+            limit: Max number of processes to return (None = all)
+            offset: Number of processes to skip (used with limit)
+            state: State filter ('normal', 'archived', 'inactive', 'all'),
+                overrides the include flags
+            search: Text to look for in name, description, tags and step labels
 
         Returns:
             List of Process objects
@@ -135,7 +172,11 @@ class ProcessManager:
             # Get all processes from database
             processes_data = self.db.get_all_processes(
                 include_archived=include_archived,
-                include_inactive=include_inactive
+                include_inactive=include_inactive,
+                limit=limit,
+                offset=offset,
+                state=state,
+                search=search
             )
 
             processes = []
@@ -157,6 +198,23 @@ class ProcessManager:
             logger.error(f"Error getting all processes: {e}", exc_info=True)
             return []
 
+    def count_processes(self, state: Optional[str] = 'all', search: Optional[str] = None) -> int:
+        """
+        Count processes matching a state filter and search text
+
+        Args:
+            state: State filter ('normal', 'archived', 'inactive', 'all')
+            search: Text to look for (see get_all_processes)
+
+        Returns:
+            Number of matching processes (0 on error)
+        """
+        try:
+            return self.db.count_processes(state=state, search=search)
+        except Exception as e:
+            logger.error(f"Error counting processes: {e}", exc_info=True)
+            return 0
+
     def update_process(self, process: Process) -> Tuple[bool, str]:
         """
         Update an existing process
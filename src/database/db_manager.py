@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
+    # Máximo de parámetros por consulta "IN (...)" (límite por defecto de SQLite)
+    MAX_QUERY_PARAMS = 999
+
     def __init__(self, db_path: str = "widget_sidebar.db"):
         """
         Initialize database manager
@@ -33,6 +36,21 @@ class DBManager:
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
+    def _id_chunks(self, ids):
+        """
+        Split IDs for "IN (...)" queries so none exceeds MAX_QUERY_PARAMS
+
+        Args:
+            ids: Iterable of IDs
+
+        Yields:
+            Tuple (placeholders string, tuple of IDs) per chunk
+        """
+        ids = list(ids)
+        for start in range(0, len(ids), self.MAX_QUERY_PARAMS):
+            chunk = tuple(ids[start:start + self.MAX_QUERY_PARAMS])
+            yield ','.join('?' * len(chunk)), chunk
+
     def _ensure_database(self):
         """Create database and tables if they don't exist"""
         # Check if it's an in-memory database or file doesn't exist
@@ -719,6 +737,31 @@ class DBManager:
 
         return None
 
+    def get_categories_by_ids(self, category_ids: List[int]) -> List[Dict]:
+        """
+        Get several categories by ID in a single query
+        Tags are loaded from the many-to-many relationship
+
+        Args:
+            category_ids: List of category IDs
+
+        Returns:
+            List[Dict]: Category dictionaries with 'tags' field (missing IDs are skipped)
+        """
+        if not category_ids:
+            return []
+
+        categories = []
+        for placeholders, chunk in self._id_chunks(category_ids):
+            query = f"SELECT * FROM categories WHERE id IN ({placeholders})"
+            categories.extend(self.execute_query(query, chunk))
+
+        tags_by_category = self.get_category_tags_bulk([category['id'] for category in categories])
+        for category in categories:
+            category['tags'] = tags_by_category.get(category['id'], [])
+
+        return categories
+
     def add_category(self, name: str, icon: str = None,
                      is_predefined: bool = False, order_index: int = None,
                      tags: List[str] = None) -> int:
@@ -1185,6 +1228,33 @@ class DBManager:
         result = self.execute_query(query, (category_id,))
         return [row['name'] for row in result]
 
+    def get_category_tags_bulk(self, category_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Get tag names for several categories in a single query
+
+        Args:
+            category_ids: List of category IDs
+
+        Returns:
+            Dict[int, List[str]]: Tag names (sorted alphabetically) keyed by
+            category_id. Categories without tags are omitted.
+        """
+        if not category_ids:
+            return {}
+
+        tags_by_category = {}
+        for placeholders, chunk in self._id_chunks(category_ids):
+            query = f"""
+                SELECT ctc.category_id, ct.name
+                FROM category_tags ct
+                INNER JOIN category_tags_category ctc ON ct.id = ctc.tag_id
+                WHERE ctc.category_id IN ({placeholders})
+                ORDER BY ct.name ASC
+            """
+            for row in self.execute_query(query, chunk):
+                tags_by_category.setdefault(row['category_id'], []).append(row['name'])
+        return tags_by_category
+
     # ========== ITEMS ==========
 
     def get_items_by_category(self, category_id: int) -> List[Dict]:
@@ -1203,15 +1273,57 @@ class DBManager:
             ORDER BY created_at
         """
         results = self.execute_query(query, (category_id,))
+        return self._load_item_details(results)
+
+    def get_items_by_categories(self, category_ids: List[int]) -> Dict[int, List[Dict]]:
+        """
+        Get the items of several categories in a single query
+
+        Args:
+            category_ids: List of category IDs
+
+        Returns:
+            Dict[int, List[Dict]]: Items grouped by category_id (content decrypted if sensitive)
+        """
+        items_by_category = {category_id: [] for category_id in category_ids}
+        if not category_ids:
+            return items_by_category
+
+        # Cada categoría cae entera en un solo chunk: su orden por created_at se conserva
+        results = []
+        for placeholders, chunk in self._id_chunks(category_ids):
+            query = f"""
+                SELECT * FROM items
+                WHERE category_id IN ({placeholders})
+                ORDER BY created_at
+            """
+            results.extend(self.execute_query(query, chunk))
+
+        for item in self._load_item_details(results):
+            items_by_category.setdefault(item['category_id'], []).append(item)
+
+        return items_by_category
 
+    def _load_item_details(self, results: List[Dict]) -> List[Dict]:
+        """
+        Load tags and decrypt sensitive content for a list of item rows
+
+        Args:
+            results: Item dictionaries as returned by execute_query
+
+        Returns:
+            List[Dict]: The same list, with 'tags' loaded and content decrypted
+        """
         # Initialize encryption manager for decrypting sensitive items
         from src.core.encryption_manager import EncryptionManager
         encryption_manager = EncryptionManager()
 
-        # Load tags from relational structure and decrypt sensitive content
+        # Load tags for all items in one query (tags and item_tags tables)
+        tags_by_item = self.get_tags_by_items([item['id'] for item in results])
+
+        # Attach tags and decrypt sensitive content
         for item in results:
-            # Load tags from relational structure (tags and item_tags tables)
-            item['tags'] = self.get_tags_by_item(item['id'])
+            item['tags'] = tags_by_item.get(item['id'], [])
 
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
@@ -1224,6 +1336,27 @@ class DBManager:
 
         return results
 
+    def get_items_by_ids(self, item_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Get several items by ID in a single query
+
+        Args:
+            item_ids: List of item IDs
+
+        Returns:
+            Dict[int, Dict]: Item dictionaries keyed by id (content decrypted if sensitive).
+            IDs that do not exist are omitted.
+        """
+        if not item_ids:
+            return {}
+
+        results = []
+        for placeholders, chunk in self._id_chunks(dict.fromkeys(item_ids)):
+            query = f"SELECT * FROM items WHERE id IN ({placeholders})"
+            results.extend(self.execute_query(query, chunk))
+
+        return {item['id']: item for item in self._load_item_details(results)}
+
     def get_item(self, item_id: int) -> Optional[Dict]:
         """
         Get item by ID
@@ -1927,6 +2060,33 @@ class DBManager:
         results = self.execute_query(query, (item_id,))
         return [row['name'] for row in results]
 
+    def get_tags_by_items(self, item_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Get tag names for several items in a single query
+
+        Args:
+            item_ids: List of item IDs
+
+        Returns:
+            Dict[int, List[str]]: Tag names (sorted alphabetically) keyed by item_id.
+            Items without tags are omitted.
+        """
+        if not item_ids:
+            return {}
+
+        tags_by_item = {}
+        for placeholders, chunk in self._id_chunks(item_ids):
+            query = f"""
+                SELECT it.item_id, t.name
+                FROM item_tags it
+                JOIN tags t ON it.tag_id = t.id
+                WHERE it.item_id IN ({placeholders})
+                ORDER BY t.name
+            """
+            for row in self.execute_query(query, chunk):
+                tags_by_item.setdefault(row['item_id'], []).append(row['name'])
+        return tags_by_item
+
     def add_tag_to_item(self, item_id: int, tag_name: str) -> None:
         """
         Add tag to item (get_or_create tag)
@@ -3313,6 +3473,27 @@ class DBManager:
         self.execute_update(query, (panel_id,))
         logger.debug(f"Panel {panel_id} opened - statistics updated")
 
+    def update_panels_last_opened(self, panel_ids: List[int]) -> None:
+        """
+        Update last_opened timestamp and increment open_count for several panels
+        in a single UPDATE
+
+        Args:
+            panel_ids: List of panel IDs
+        """
+        if not panel_ids:
+            return
+
+        for placeholders, chunk in self._id_chunks(panel_ids):
+            query = f"""
+                UPDATE pinned_panels
+                SET last_opened = CURRENT_TIMESTAMP,
+                    open_count = open_count + 1
+                WHERE id IN ({placeholders})
+            """
+            self.execute_update(query, chunk)
+        logger.debug(f"{len(panel_ids)} panels opened - statistics updated")
+
     def delete_pinned_panel(self, panel_id: int) -> bool:
         """
         Remove a pinned panel from database
@@ -3497,6 +3678,25 @@ class DBManager:
         logger.info(f"Pinned process panel updated: ID {panel_id}")
         return True
 
+    def update_pinned_process_panels_state(self, rows: List[tuple]) -> None:
+        """
+        Update position, size and minimized state of several process panels
+        in a single transaction
+
+        Args:
+            rows: List of (x_position, y_position, width, height, is_minimized, panel_id)
+        """
+        if not rows:
+            return
+
+        query = """
+            UPDATE pinned_process_panels
+            SET x_position = ?, y_position = ?, width = ?, height = ?, is_minimized = ?
+            WHERE id = ?
+        """
+        self.execute_many(query, rows)
+        logger.debug(f"{len(rows)} pinned process panels updated")
+
     def update_process_panel_last_opened(self, panel_id: int) -> None:
         """
         Update last_opened timestamp and increment open_count
@@ -3513,6 +3713,27 @@ class DBManager:
         self.execute_update(query, (panel_id,))
         logger.debug(f"Process panel {panel_id} opened - statistics updated")
 
+    def update_process_panels_last_opened(self, panel_ids: List[int]) -> None:
+        """
+        Update last_opened timestamp and increment open_count for several
+        process panels in a single UPDATE
+
+        Args:
+            panel_ids: List of panel IDs
+        """
+        if not panel_ids:
+            return
+
+        for placeholders, chunk in self._id_chunks(panel_ids):
+            query = f"""
+                UPDATE pinned_process_panels
+                SET last_opened = CURRENT_TIMESTAMP,
+                    open_count = open_count + 1
+                WHERE id IN ({placeholders})
+            """
+            self.execute_update(query, chunk)
+        logger.debug(f"{len(panel_ids)} process panels opened - statistics updated")
+
     def delete_pinned_process_panel(self, panel_id: int) -> bool:
         """
         Remove a pinned process panel from database
@@ -5170,34 +5391,124 @@ class DBManager:
             return dict(row)
         return None
 
+    def get_processes_by_ids(self, process_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get several processes by ID in a single query
+
+        Args:
+            process_ids: List of process IDs
+
+        Returns:
+            List of process dicts (missing IDs are skipped)
+        """
+        if not process_ids:
+            return []
+
+        conn = self.connect()
+        processes = []
+        for placeholders, chunk in self._id_chunks(process_ids):
+            cursor = conn.execute(f"""
+                SELECT * FROM processes WHERE id IN ({placeholders})
+            """, chunk)
+            processes.extend(dict(row) for row in cursor.fetchall())
+
+        return processes
+
+    def _processes_filter_clause(self, include_archived: bool, include_inactive: bool,
+                                 state: Optional[str], search: Optional[str]):
+        """
+        Build the WHERE clause shared by get_all_processes and count_processes
+
+        Args:
+            include_archived: Include archived processes (ignored if state is given)
+            include_inactive: Include inactive processes (ignored if state is given)
+            state: 'normal', 'archived', 'inactive' or 'all' (None = use the include flags)
+            search: Text to look for in name, description, tags and step item labels
+
+        Returns:
+            Tuple (where clause, params list)
+        """
+        where = "WHERE 1=1"
+        params = []
+
+        if state is None:
+            if not include_archived:
+                where += " AND is_archived = 0"
+            if not include_inactive:
+                where += " AND is_active = 1"
+        elif state == 'normal':
+            where += " AND is_active = 1 AND is_archived = 0"
+        elif state == 'archived':
+            where += " AND is_archived = 1"
+        elif state == 'inactive':
+            where += " AND is_active = 0"
+
+        if search:
+            # LIKE sin distinguir mayúsculas; % y _ del texto se buscan literalmente
+            pattern = '%' + search.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            where += r"""
+                AND (LOWER(name) LIKE ? ESCAPE '\'
+                     OR LOWER(COALESCE(description, '')) LIKE ? ESCAPE '\'
+                     OR LOWER(COALESCE(tags, '')) LIKE ? ESCAPE '\'
+                     OR EXISTS (
+                         SELECT 1 FROM process_items pi
+                         JOIN items i ON pi.item_id = i.id
+                         WHERE pi.process_id = processes.id
+                           AND LOWER(i.label) LIKE ? ESCAPE '\'
+                     ))
+            """
+            params.extend([pattern] * 4)
+
+        return where, params
+
     def get_all_processes(self, include_archived: bool = False,
-                          include_inactive: bool = False) -> List[Dict[str, Any]]:
+                          include_inactive: bool = False,
+                          limit: Optional[int] = None,
+                          offset: int = 0,
+                          state: Optional[str] = None,
+                          search: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all processes
 
         Args:
             include_archived: Include archived processes
             include_inactive: Include inactive processes
+            limit: Max number of rows to return (None = all)
+            offset: Number of rows to skip (used with limit)
+            state: State filter ('normal', 'archived', 'inactive', 'all'); overrides
+                the include flags
+            search: Text to look for in name, description, tags and step item labels
 
         Returns:
             List of process dicts
         """
         conn = self.connect()
 
-        query = "SELECT * FROM processes WHERE 1=1"
-        params = []
+        where, params = self._processes_filter_clause(include_archived, include_inactive, state, search)
+        query = f"SELECT * FROM processes {where} ORDER BY pinned_order ASC, order_index ASC, name ASC"
 
-        if not include_archived:
-            query += " AND is_archived = 0"
-
-        if not include_inactive:
-            query += " AND is_active = 1"
-
-        query += " ORDER BY pinned_order ASC, order_index ASC, name ASC"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
 
         cursor = conn.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    def count_processes(self, state: Optional[str] = 'all', search: Optional[str] = None) -> int:
+        """
+        Count processes matching a state filter and search text
+
+        Args:
+            state: State filter ('normal', 'archived', 'inactive', 'all')
+            search: Text to look for (see get_all_processes)
+
+        Returns:
+            int: Number of matching processes
+        """
+        where, params = self._processes_filter_clause(True, True, state, search)
+        cursor = self.connect().execute(f"SELECT COUNT(*) FROM processes {where}", params)
+        return cursor.fetchone()[0]
+
     def update_process(self, process_id: int, **kwargs) -> bool:
         """
         Update process fields
@@ -5346,6 +5657,42 @@ class DBManager:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_process_steps_bulk(self, process_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get the steps of several processes in a single query
+
+        Args:
+            process_ids: List of process IDs
+
+        Returns:
+            Dict mapping process_id to its steps (ordered by step_order)
+        """
+        steps_by_process = {process_id: [] for process_id in process_ids}
+        if not process_ids:
+            return steps_by_process
+
+        conn = self.connect()
+        for placeholders, chunk in self._id_chunks(process_ids):
+            cursor = conn.execute(f"""
+                SELECT
+                    pi.*,
+                    i.label as item_label,
+                    i.content as item_content,
+                    i.type as item_type,
+                    i.icon as item_icon,
+                    i.is_sensitive as item_is_sensitive
+                FROM process_items pi
+                JOIN items i ON pi.item_id = i.id
+                WHERE pi.process_id IN ({placeholders})
+                ORDER BY pi.process_id, pi.step_order ASC
+            """, chunk)
+
+            for row in cursor.fetchall():
+                step = dict(row)
+                steps_by_process.setdefault(step['process_id'], []).append(step)
+
+        return steps_by_process
+
     def update_process_step(self, step_id: int, **kwargs) -> bool:
         """
         Update a process step
@@ -74,10 +74,10 @@ class AIBulkWizard(QDialog):
     Wizard para creación masiva de items con IA.
 
     Señales:
-        items_created(int): Emitida cuando se crean items (con count)
+        items_created(int, int): Emitida cuando se crean items (count, category_id)
     """
 
-    items_created = pyqtSignal(int)  # Señal con count de items creados
+    items_created = pyqtSignal(int, int)  # (count de items creados, category_id)
 
     def __init__(self, db_manager: DBManager, parent=None):
         """
@@ -436,8 +436,8 @@ class AIBulkWizard(QDialog):
             result = self.creation_step.get_result()
 
             if result and result.success:
-                # Emitir señal con count
-                self.items_created.emit(result.created_count)
+                # Emitir señal con count y categoría destino
+                self.items_created.emit(result.created_count, result.category_id or 0)
 
                 # Cerrar wizard después de 2 segundos
                 from PyQt6.QtCore import QTimer
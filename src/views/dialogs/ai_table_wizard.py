@@ -38,10 +38,10 @@ class AITableCreatorWizard(QDialog):
     Wizard para creación de tablas con IA.
 
     Señales:
-        table_created(str, int): Emitida cuando se crea una tabla (nombre, items_count)
+        table_created(str, int, int): Emitida cuando se crea una tabla (nombre, items_count, category_id)
     """
 
-    table_created = pyqtSignal(str, int)  # (table_name, items_created)
+    table_created = pyqtSignal(str, int, int)  # (table_name, items_created, category_id)
 
     def __init__(self, db_manager: DBManager, controller=None, parent=None):
         """
@@ -320,7 +320,8 @@ class AITableCreatorWizard(QDialog):
         """
         if success:
             # Emitir señal
-            self.table_created.emit(self.ai_table.table_config.table_name, items_created)
+            table_config = self.ai_table.table_config
+            self.table_created.emit(table_config.table_name, items_created, table_config.category_id)
 
             # Cerrar wizard después de un delay
             from PyQt6.QtCore import QTimer
@@ -50,7 +50,7 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
     # Signal emitted when URL should be opened in embedded browser
     url_open_requested = pyqtSignal(str)
 
-    def __init__(self, config_manager=None, list_controller=None, panel_id=None, custom_name=None, custom_color=None, parent=None, main_window=None):
+    def __init__(self, config_manager=None, list_controller=None, panel_id=None, custom_name=None, custom_color=None, parent=None, main_window=None, keyboard_shortcut=None):
         super().__init__(parent)
         self.current_category = None
         self.config_manager = config_manager
@@ -74,6 +74,7 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.panel_id = panel_id  # ID del panel en la base de datos (None si no está guardado)
         self.custom_name = custom_name  # Nombre personalizado del panel
         self.custom_color = custom_color  # Color personalizado del header (hex format)
+        self.keyboard_shortcut = keyboard_shortcut  # Atajo de teclado asignado (copia del valor en BD)
 
         # Futuristic theme and effects
         self.theme = get_theme()
@@ -40,7 +40,8 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
     # Signal emitted when URL should be opened in embedded browser
     url_open_requested = pyqtSignal(str)
 
-    def __init__(self, db_manager=None, config_manager=None, list_controller=None, parent=None):
+    def __init__(self, db_manager=None, config_manager=None, list_controller=None, parent=None,
+                 panels_manager=None):
         super().__init__(parent)
         self.db_manager = db_manager
         self.config_manager = config_manager
@@ -78,9 +79,10 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         # FASE 4: Pin + minimize integration
         self.pinned_position = None  # Posición anclada para restaurar después de minimizar
 
-        # Pinned panels manager
-        self.panels_manager = None
-        if self.db_manager:
+        # Pinned panels manager (el compartido del controller, para que su
+        # revision refleje también los guardados de este panel)
+        self.panels_manager = panels_manager
+        if self.panels_manager is None and self.db_manager:
             self.panels_manager = PinnedPanelsManager(self.db_manager)
 
         # Get panel width from config (or use new default)
@@ -302,6 +304,11 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         self.state_filter_combo.addItem("⏸️ Inactivos", "inactive")
         self.state_filter_combo.addItem("📋 Todos", "all")
         self.state_filter_combo.setCurrentIndex(0)  # Default: Normal
+        # Mapa data -> índice para evitar findData() al restaurar paneles
+        self._state_data_to_index = {
+            self.state_filter_combo.itemData(i): i
+            for i in range(self.state_filter_combo.count())
+        }
         self.state_filter_combo.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.state_filter_combo.setStyleSheet("""
             QComboBox {
@@ -555,8 +562,15 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         self.scroll_area.setWidget(self.items_container)
         main_layout.addWidget(self.scroll_area)
 
-    def load_all_items(self):
-        """Load and display ALL items from ALL categories"""
+    def load_all_items(self, initial_query=None, initial_filters=None, show=True):
+        """Load and display ALL items from ALL categories
+
+        Args:
+            initial_query: Búsqueda a aplicar durante la carga (paneles restaurados)
+            initial_filters: Filtros avanzados a aplicar durante la carga
+            show: Mostrar y activar la ventana al terminar (False si el llamador
+                la muestra después, p. ej. la restauración de paneles)
+        """
         if not self.db_manager:
             logger.error("No database manager available")
             return
@@ -637,19 +651,33 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         self.filters_window.update_available_tags(self.all_items)
         logger.debug(f"Updated available tags from {len(self.all_items)} items")
 
-        # Clear search bar
-        self.search_bar.clear_search()
+        if initial_query or initial_filters:
+            # Poblar directamente con el resultado filtrado en lugar de
+            # mostrar los primeros 100 items y volver a filtrar después
+            if initial_query:
+                self.search_bar.search_input.blockSignals(True)
+                self.search_bar.search_input.setText(initial_query)
+                self.search_bar.search_input.blockSignals(False)
+                self.search_bar.current_query = initial_query
+            self.pending_search_query = initial_query or ""
+            if initial_filters:
+                self.current_filters = initial_filters
+            self._perform_search()
+        else:
+            # Clear search bar
+            self.search_bar.clear_search()
 
-        # Display only first 100 items initially (for performance)
-        # When user searches/filters, all matching items will be shown
-        initial_display_limit = 100
-        items_to_display = self.all_items[:initial_display_limit]
-        self.display_items(items_to_display, total_count=len(self.all_items))
+            # Display only first 100 items initially (for performance)
+            # When user searches/filters, all matching items will be shown
+            initial_display_limit = 100
+            items_to_display = self.all_items[:initial_display_limit]
+            self.display_items(items_to_display, total_count=len(self.all_items))
 
         # Show the window
-        self.show()
-        self.raise_()
-        self.activateWindow()
+        if show:
+            self.show()
+            self.raise_()
+            self.activateWindow()
 
     def display_items(self, items, total_count=None):
         """Display a list of items
@@ -1726,10 +1754,9 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
 
         # Reset state filter to normal
         self.current_state_filter = "normal"
-        for i in range(self.state_filter_combo.count()):
-            if self.state_filter_combo.itemData(i) == "normal":
-                self.state_filter_combo.setCurrentIndex(i)
-                break
+        index = self._state_data_to_index.get("normal", -1)
+        if index >= 0:
+            self.state_filter_combo.setCurrentIndex(index)
 
         # Update filter badge
         self.update_filter_badge()
@@ -1840,6 +1867,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
                  json.dumps(filter_config),
                  self.panel_id)
             )
+            self.panels_manager.mark_changed()
 
             logger.info(f"[AUTO-SAVE] Global search panel {self.panel_id} state saved successfully")
             logger.info(f"  - Position: {self.pos()}, Size: {self.size()}")
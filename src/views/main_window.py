@@ -2,14 +2,20 @@
 Main Window View
 """
 from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QMessageBox, QApplication
-from PyQt6.QtCore import Qt, QPoint, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QEvent, QPoint, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QScreen, QShortcut, QKeySequence
 import sys
 import logging
+import sqlite3
 import traceback
+from functools import lru_cache, partial
+import importlib
 from pathlib import Path
 import ctypes
 from ctypes import wintypes
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from views.sidebar import Sidebar
@@ -61,6 +67,198 @@ class APPBARDATA(ctypes.Structure):
     ]
 
 
+APPBARDATA_SIZE = ctypes.sizeof(APPBARDATA)  # Constante: evita introspección ctypes por llamada
+
+# SHAppBarMessage se resuelve una sola vez al importar el módulo (None fuera de Windows).
+# Declarar argtypes/restype evita que ctypes adivine los tipos en cada llamada.
+if sys.platform == 'win32':
+    _SHAppBarMessage = ctypes.windll.shell32.SHAppBarMessage
+    _SHAppBarMessage.argtypes = [wintypes.DWORD, ctypes.POINTER(APPBARDATA)]
+    _SHAppBarMessage.restype = ctypes.c_size_t
+else:
+    _SHAppBarMessage = None
+
+# Errores esperados en los slots más usados (RuntimeError: objeto Qt ya destruido,
+# sqlite3.Error: BD bloqueada o corrupta, OSError: portapapeles no disponible).
+# Cualquier otro error se propaga al sys.excepthook global instalado en main.py.
+_SLOT_ERRORS = (AttributeError, KeyError, RuntimeError, sqlite3.Error, OSError)
+
+# Mensajes estáticos: el detalle y el traceback quedan solo en el log
+_PROCESS_LOAD_ERROR_MSG = "Error al cargar proceso.\n\nRevisa widget_sidebar_error.log"
+_ITEM_COPY_ERROR_MSG = "Error al copiar item.\n\nRevisa widget_sidebar_error.log"
+
+# Aviso de la bandeja al cerrar la ventana por primera vez (título, mensaje)
+_TRAY_MINIMIZED_MSG = ("Widget Sidebar", "La aplicación sigue ejecutándose en la bandeja del sistema")
+
+# Header de un panel de proceso anclado (igual para todos los paneles restaurados)
+_PINNED_PROCESS_HEADER_QSS = """
+    QWidget {
+        background-color: #ff8800;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+    }
+"""
+
+
+@contextmanager
+def _updates_suspended(widget):
+    """
+    Disable repaints on a widget while it is being (re)built
+
+    Args:
+        widget: Widget whose updates are suspended
+    """
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _debug_exc_info(exc: BaseException):
+    """
+    exc_info for per-item failures that are skipped: the traceback is only
+    attached (and formatted) when DEBUG logging is enabled
+
+    Args:
+        exc: The caught exception
+    """
+    return exc if logger.isEnabledFor(logging.DEBUG) else None
+
+
+@lru_cache(maxsize=128)
+def _seq(shortcut_str: str) -> QKeySequence:
+    """Parse a shortcut string into a QKeySequence once (sequences are value objects)"""
+    return QKeySequence(shortcut_str)
+
+
+@lru_cache(maxsize=128)
+def _canonical_shortcut(shortcut_str: str) -> str:
+    """Normalized text of a shortcut as produced by QKeySequence (used as dict key)"""
+    return _seq(shortcut_str).toString()
+
+
+@lru_cache(maxsize=None)
+def _lazy_class(module_path: str, class_name: str):
+    """
+    Import a view class on first use and cache it
+
+    Heavy view modules are imported lazily (and to avoid circular imports);
+    caching the class skips the import machinery on every click.
+    """
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _create_category_manager_window(main_window):
+    """Create the category manager window (imported lazily to avoid circular imports)"""
+    from views.dialogs.category_manager_window import CategoryManagerWindow
+    return CategoryManagerWindow(
+        controller=main_window.controller,
+        parent=None  # Sin parent para que sea ventana independiente
+    )
+
+
+@dataclass(frozen=True)
+class PanelSpec:
+    """Describe un panel/ventana toggleable desde el sidebar"""
+
+    attr: str  # Atributo de MainWindow que guarda la instancia
+    factory: Callable  # factory(main_window) -> panel
+    connects: Tuple[Tuple[str, str], ...] = ()  # (señal del panel, handler de MainWindow)
+    positioner: str = 'sidebar'  # 'sidebar' (position_near_sidebar) o 'left' (a la izquierda)
+    refresh: bool = False  # Llamar panel.refresh() tras mostrar
+    activate: bool = False  # Llamar panel.activateWindow() tras mostrar
+    error_message: str = "Error al mostrar panel"
+
+
+PANEL_SPECS = {
+    'favorites': PanelSpec(
+        attr='favorites_panel',
+        factory=lambda mw: FavoritesFloatingPanel(),
+        connects=(
+            ('favorite_executed', 'on_favorite_executed'),
+            ('window_closed', 'on_favorites_panel_closed'),
+        ),
+        refresh=True,
+        error_message="Error al mostrar favoritos",
+    ),
+    'stats': PanelSpec(
+        attr='stats_panel',
+        factory=lambda mw: StatsFloatingPanel(),
+        connects=(
+            ('window_closed', 'on_stats_panel_closed'),
+        ),
+        refresh=True,
+        error_message="Error al mostrar estadísticas",
+    ),
+    'category_filter': PanelSpec(
+        attr='category_filter_window',
+        factory=lambda mw: CategoryFilterWindow(mw),
+        connects=(
+            ('filters_changed', 'on_category_filters_changed'),
+            ('filters_cleared', 'on_category_filters_cleared'),
+            ('window_closed', 'on_category_filter_window_closed'),
+        ),
+        positioner='left',
+        error_message="Error al mostrar filtros de categorías",
+    ),
+    'category_manager': PanelSpec(
+        attr='category_manager_window',
+        factory=_create_category_manager_window,
+        connects=(
+            ('categories_changed', 'on_categories_changed_from_manager'),
+        ),
+        positioner='left',
+        activate=True,
+        error_message="Error al mostrar gestor de categorías",
+    ),
+}
+
+
+class WindowDragFilter(QObject):
+    """
+    Event filter que permite arrastrar una ventana sin bordes
+
+    Al pulsar el botón izquierdo delega el arrastre al sistema de ventanas
+    (QWindow.startSystemMove), de modo que los eventos de movimiento no pasan
+    por Python. Si la plataforma no lo soporta, mueve la ventana manualmente.
+    """
+
+    def __init__(self, window: QWidget):
+        """
+        Args:
+            window: Ventana a arrastrar (el filtro se instala sobre ella)
+        """
+        super().__init__(window)
+        self.window = window
+        self.drag_position = None  # Solo se usa en el modo manual
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        event_type = event.type()
+
+        if event_type == QEvent.Type.MouseButtonPress:
+            if event.button() != Qt.MouseButton.LeftButton:
+                return False
+            handle = self.window.windowHandle()
+            if handle is not None and handle.startSystemMove():
+                self.drag_position = None
+            else:
+                self.drag_position = event.globalPosition().toPoint() - self.window.frameGeometry().topLeft()
+            return True
+
+        if event_type == QEvent.Type.MouseMove and self.drag_position is not None:
+            if event.buttons() == Qt.MouseButton.LeftButton:
+                self.window.move(event.globalPosition().toPoint() - self.drag_position)
+                return True
+            return False
+
+        if event_type == QEvent.Type.MouseButtonRelease:
+            self.drag_position = None
+
+        return False
+
+
 class MainWindow(QMainWindow):
     """Main application window - frameless, always-on-top sidebar"""
 
@@ -68,36 +266,65 @@ class MainWindow(QMainWindow):
     category_selected = pyqtSignal(str)  # category_id
     item_selected = pyqtSignal(object)  # Item
 
+    # (señal del panel, handler de MainWindow) - ver _wire_panel
+    _CATEGORY_PANEL_SIGNALS = (
+        ('item_clicked', 'on_item_clicked'),
+        ('window_closed', 'on_floating_panel_closed'),
+        ('pin_state_changed', 'on_panel_pin_changed'),
+        ('customization_requested', 'on_panel_customization_requested'),
+        ('url_open_requested', 'on_url_open_in_browser'),
+    )
+
+    _RESTORED_GLOBAL_SEARCH_PANEL_SIGNALS = (
+        ('item_clicked', 'on_item_clicked'),
+        ('window_closed', 'on_restored_global_search_panel_closed'),
+        ('pin_state_changed', 'on_global_search_pin_state_changed'),
+        ('url_open_requested', 'on_url_open_in_browser'),
+    )
+
+    _PROCESS_PANEL_SIGNALS = (
+        ('item_clicked', 'on_item_clicked'),
+        ('window_closed', 'on_process_panel_closed'),
+        ('pin_state_changed', 'on_process_panel_pin_changed'),
+    )
+
     def __init__(self, controller=None):
         super().__init__()
         self.controller = controller
         self.config_manager = controller.config_manager if controller else None
         self.sidebar = None
         self.floating_panel = None  # Panel flotante activo (no anclado) - compatibility
-        self.pinned_panels = []  # Lista de paneles anclados
-        self.pinned_global_search_panels = []  # Lista de paneles de búsqueda global anclados
+        self.pinned_panels = {}  # Dict[id(panel), FloatingPanel] - Paneles anclados
+        self.pinned_panels_by_id = {}  # Dict[panel_id, FloatingPanel] - Índice de pinned_panels (ver _add_pinned_panel)
+        self._panels_manager_dirty = True  # Paneles abiertos cambiaron desde el último refresh del gestor
+        self.pinned_global_search_panels = {}  # id(panel) -> GlobalSearchPanel anclado
         self.pinned_panels_window = None  # Ventana de gestión de paneles anclados
+        self.panels_manager_window = None  # PinnedPanelsManagerWindow (se crea al abrirla)
         self.global_search_panel = None  # Ventana flotante para búsqueda global
         self.advanced_search_window = None  # Ventana de búsqueda avanzada
         self.favorites_panel = None  # Ventana flotante para favoritos
         self.stats_panel = None  # Ventana flotante para estadísticas
         self.structure_dashboard = None  # Dashboard de estructura (no-modal)
         self.category_filter_window = None  # Ventana de filtros de categorías
+        self.category_manager_window = None  # Ventana de gestión de categorías
         self.current_category_id = None  # Para el toggle
 
         # Process panels
         self.current_process_panel = None  # Panel flotante activo (no anclado) para procesos
-        self.pinned_process_panels = []  # Lista de paneles de procesos anclados
+        self.pinned_process_panels = {}  # Dict[id(panel), panel] - Paneles de procesos anclados (orden de inserción)
         self.current_process_id = None  # Para el toggle de procesos
+        self._sidebar_process_active = {}  # Dict[process_id, is_active] - Procesos mostrados en el sidebar
 
         self.hotkey_manager = None
         self.tray_manager = None
         self.notification_manager = NotificationManager()
         self.is_visible = True
+        self._tray_notified = False  # El aviso de "sigue en la bandeja" se muestra una sola vez
 
         # Panel shortcuts management
         self.panel_shortcuts = {}  # Dict[panel_id, QShortcut] - Track keyboard shortcuts for panels
         self.panel_by_shortcut = {}  # Dict[shortcut_str, panel] - Quick lookup panel by shortcut
+        self.shortcut_by_panel_id = {}  # Dict[panel_id, shortcut_str] - Reverse of panel_by_shortcut
 
         # Minimizar/Maximizar estado
         self.is_minimized = False
@@ -106,6 +333,63 @@ class MainWindow(QMainWindow):
 
         # AppBar state (para reservar espacio en Windows)
         self.appbar_registered = False
+        self._abd = None  # APPBARDATA reutilizada (ver _init_appbar_data)
+
+        # Batched UI updates (see batch_updates)
+        self._batch_depth = 0
+        self._pending = set()  # Tags: 'sidebar', 'categories', 'processes_panel', 'favorites'
+
+        # Debounce timers: a burst of state changes collapses into one reload per frame
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(16)
+        self._reload_timer.timeout.connect(self.load_processes_to_sidebar)
+
+        self._processes_panel_reload_timer = QTimer(self)
+        self._processes_panel_reload_timer.setSingleShot(True)
+        self._processes_panel_reload_timer.setInterval(16)
+        self._processes_panel_reload_timer.timeout.connect(self._reload_processes_panel)
+
+        # Chequeo diferido de notificaciones (ver check_notifications_delayed)
+        self._notif_timer = QTimer(self)
+        self._notif_timer.setSingleShot(True)
+        self._notif_timer.setInterval(10000)  # 10 segundos
+        self._notif_timer.timeout.connect(self.check_notifications)
+
+        # Refresco diferido del gestor de paneles anclados (ver _schedule_panels_refresh)
+        self._refresh_pending = False
+        self._panels_refresh_timer = QTimer(self)
+        self._panels_refresh_timer.setSingleShot(True)
+        self._panels_refresh_timer.setInterval(0)
+        self._panels_refresh_timer.timeout.connect(self._flush_panels_refresh)
+
+        # Coalesced category reloads (see schedule_categories_reload)
+        self._categories_gen = 0  # Incremented on every real reload
+        self._pending_categories_reload = False
+
+        # Cache de screen().availableGeometry() - se invalida en screenChanged/resizeEvent
+        self._cached_geom = None
+        self._screen_signals_connected = False
+        self._tracked_screen = None  # Pantalla cuya availableGeometryChanged está conectada
+
+        # Cache de posiciones de paneles junto al sidebar
+        # Dict[(panel_key, panel_width), QPoint] - se invalida en moveEvent/resizeEvent
+        self._panel_pos_cache = {}
+        self._anchor = None  # (x, y) del sidebar - se invalida en moveEvent/resizeEvent
+
+        # Arrastre de la ventana (reemplaza mousePressEvent/mouseMoveEvent)
+        self._drag_filter = WindowDragFilter(self)
+
+        # Acciones de notificación -> handler (ver handle_notification_action)
+        self._action_dispatch = {
+            'show_favorite_suggestions': self.show_favorite_suggestions,
+            'show_cleanup_suggestions': self.show_forgotten_items,
+            'show_abandoned_items': self.show_forgotten_items,
+            # TODO: Crear diálogos específicos para estas acciones
+            'show_failing_items': partial(self._show_feature_in_development, "Items con Errores"),
+            'show_slow_items': partial(self._show_feature_in_development, "Items Lentos"),
+            'show_shortcut_suggestions': partial(self._show_feature_in_development, "Sugerencias de Atajos"),
+        }
 
         self.init_ui()
         self.position_window()
@@ -136,10 +420,9 @@ class MainWindow(QMainWindow):
         )
 
         # Calculate window height: 100% of screen height (toda la altura disponible menos barra de tareas)
-        screen = self.screen()
-        if screen:
-            screen_height = screen.availableGeometry().height()
-            window_height = screen_height  # 100% de la altura disponible (menos barra de tareas)
+        screen_geometry = self._geom()
+        if screen_geometry:
+            window_height = screen_geometry.height()  # 100% de la altura disponible (menos barra de tareas)
         else:
             window_height = 600  # Fallback
 
@@ -240,6 +523,87 @@ class MainWindow(QMainWindow):
         if self.sidebar:
             self.sidebar.load_categories(categories)
 
+    @contextmanager
+    def batch_updates(self):
+        """
+        Reentrant context manager that defers sidebar/panel reloads
+
+        Reload requests made inside the block are collected in self._pending
+        and dispatched once when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._flush_if_idle()
+
+    def _request_update(self, tag: str):
+        """Queue a reload tag and flush it unless a batch is in progress"""
+        self._pending.add(tag)
+        self._flush_if_idle()
+
+    def _flush_if_idle(self):
+        """Dispatch pending reloads when no batch_updates() block is active"""
+        if self._batch_depth > 0 or not self._pending:
+            return
+
+        pending, self._pending = self._pending, set()
+        handlers = {
+            'sidebar': self._reload_timer.start,
+            'categories': self.schedule_categories_reload,
+            'processes_panel': self._processes_panel_reload_timer.start,
+            'favorites': self._refresh_favorites_panel,
+        }
+        for tag in pending:
+            try:
+                handlers[tag]()
+            except Exception as e:
+                logger.error(f"Error dispatching pending update '{tag}': {e}", exc_info=True)
+
+    def _reload_processes_panel(self):
+        """Reload processes panel if it exists"""
+        if hasattr(self, 'processes_panel') and self.processes_panel:
+            # Silence the panel's signals while it rebuilds so intermediate
+            # emissions don't fan out to the connected slots
+            self.processes_panel.blockSignals(True)
+            try:
+                self.processes_panel.reload_processes()
+            finally:
+                self.processes_panel.blockSignals(False)
+
+    def _refresh_favorites_panel(self):
+        """Refresh favorites panel if it exists"""
+        if self.favorites_panel:
+            self.favorites_panel.refresh()
+
+    def schedule_categories_reload(self):
+        """
+        Schedule a coalesced reload of categories from database
+
+        Several callbacks may fire in a short window (e.g. bulk-create triggers
+        both items_created and tables_changed); they all share one reload.
+        """
+        if self._pending_categories_reload:
+            return
+        self._pending_categories_reload = True
+        QTimer.singleShot(30, self._flush_categories_reload)
+
+    def _flush_categories_reload(self):
+        """Run the pending categories reload once"""
+        if not self._pending_categories_reload:
+            return
+        self._pending_categories_reload = False
+
+        try:
+            if self.controller:
+                categories = self.controller.reload_categories()
+                self.load_categories(categories)
+                self._categories_gen += 1
+                logger.info(f"Sidebar reloaded with {len(categories)} categories (gen {self._categories_gen})")
+        except Exception as e:
+            logger.error(f"Error reloading categories: {e}", exc_info=True)
+
     def load_processes_to_sidebar(self):
         """Load active processes into sidebar"""
         if self.controller and self.sidebar:
@@ -249,6 +613,9 @@ class MainWindow(QMainWindow):
             )
             self.sidebar.load_active_processes(processes)
 
+            # Shadow state of what the sidebar shows (see on_process_state_changed)
+            self._sidebar_process_active = {process.id: True for process in processes}
+
     def on_category_clicked(self, category_id: str):
         """Handle category button click - toggle floating panel"""
         try:
@@ -275,8 +642,7 @@ class MainWindow(QMainWindow):
                     # Si el panel actual está anclado, agregarlo a la lista de pinned
                     if self.floating_panel and self.floating_panel.is_pinned:
                         logger.info(f"Current panel is pinned, adding to pinned_panels list")
-                        if self.floating_panel not in self.pinned_panels:
-                            self.pinned_panels.append(self.floating_panel)
+                        self._add_pinned_panel(self.floating_panel)
                         self.floating_panel = None  # Clear current panel
 
                     # Create floating panel if it doesn't exist or current one is pinned
@@ -286,11 +652,7 @@ class MainWindow(QMainWindow):
                             list_controller=self.controller.list_controller if self.controller else None,
                             main_window=self
                         )
-                        self.floating_panel.item_clicked.connect(self.on_item_clicked)
-                        self.floating_panel.window_closed.connect(self.on_floating_panel_closed)
-                        self.floating_panel.pin_state_changed.connect(self.on_panel_pin_changed)
-                        self.floating_panel.customization_requested.connect(self.on_panel_customization_requested)
-                        self.floating_panel.url_open_requested.connect(self.on_url_open_in_browser)
+                        self._wire_panel(self.floating_panel, self._CATEGORY_PANEL_SIGNALS)
                         logger.debug("New floating panel created")
 
                     # Load category into floating panel
@@ -318,6 +680,7 @@ class MainWindow(QMainWindow):
                 f"Error al cargar categoría:\n{str(e)}\n\nRevisa widget_sidebar_error.log"
             )
 
+    @pyqtSlot()
     def on_floating_panel_closed(self):
         """Handle floating panel closed"""
         logger.info("Floating panel closed")
@@ -335,11 +698,11 @@ class MainWindow(QMainWindow):
         else:
             # Es un panel anclado
             logger.info("Closing pinned panel")
-            if sender_panel in self.pinned_panels:
-                self.pinned_panels.remove(sender_panel)
+            if self._remove_pinned_panel(sender_panel):
                 sender_panel.deleteLater()
                 logger.info(f"Pinned panel removed. Remaining pinned panels: {len(self.pinned_panels)}")
 
+    @pyqtSlot(str)
     def on_url_open_in_browser(self, url: str):
         """Handle URL open request - open in embedded browser"""
         logger.info(f"Opening URL in embedded browser: {url}")
@@ -365,6 +728,7 @@ class MainWindow(QMainWindow):
         else:
             logger.warning("Browser manager not available")
 
+    @pyqtSlot(bool)
     def on_panel_pin_changed(self, is_pinned):
         """Handle when a panel's pin state changes"""
         sender_panel = self.sender()
@@ -390,6 +754,8 @@ class MainWindow(QMainWindow):
 
                     # Store panel_id in the FloatingPanel instance
                     sender_panel.panel_id = panel_id
+                    if panel_id and id(sender_panel) in self.pinned_panels:
+                        self.pinned_panels_by_id[panel_id] = sender_panel
                     logger.info(f"[SHORTCUT DEBUG] Panel anchored with panel_id: {panel_id}")
 
                     # Register keyboard shortcut if one was assigned
@@ -399,6 +765,7 @@ class MainWindow(QMainWindow):
 
                     if panel_data:
                         shortcut = panel_data.get('keyboard_shortcut')
+                        sender_panel.keyboard_shortcut = shortcut
                         logger.info(f"[SHORTCUT DEBUG] Keyboard shortcut from database: '{shortcut}'")
                         if shortcut:
                             logger.info(f"[SHORTCUT DEBUG] Registering shortcut '{shortcut}' for newly pinned panel {panel_id}")
@@ -414,13 +781,12 @@ class MainWindow(QMainWindow):
                     logger.error(f"Error auto-saving panel: {e}", exc_info=True)
         else:
             # Panel was unpinned
-            if sender_panel in self.pinned_panels:
-                # Remove from pinned list and make it the active panel
-                self.pinned_panels.remove(sender_panel)
+            if self._remove_pinned_panel(sender_panel):
+                # Removed from pinned list - make it the active panel
                 if self.floating_panel:
                     # Current active panel becomes pinned
                     if self.floating_panel.is_pinned:
-                        self.pinned_panels.append(self.floating_panel)
+                        self._add_pinned_panel(self.floating_panel)
                 self.floating_panel = sender_panel
                 logger.info(f"Panel unpinned and became active panel. Remaining pinned: {len(self.pinned_panels)}")
 
@@ -443,6 +809,41 @@ class MainWindow(QMainWindow):
         panel.position_near_sidebar(self)
         logger.info(f"Panel positioned at initial position next to sidebar")
 
+    def _position_panel_near_sidebar(self, panel_key: str, panel):
+        """
+        Position a panel next to the sidebar reusing the cached point when possible
+
+        The point only depends on the main window geometry and the panel width,
+        so it is computed once and reused until the main window moves or resizes.
+
+        Args:
+            panel_key: Cache key for the panel ('favorites', 'stats', 'processes')
+            panel: Panel instance exposing position_near_sidebar(main_window)
+        """
+        cache_key = (panel_key, panel.width())
+        pos = self._panel_pos_cache.get(cache_key)
+        if pos is None:
+            panel.position_near_sidebar(self)
+            self._panel_pos_cache[cache_key] = panel.pos()
+        else:
+            panel.move(pos)
+
+    def _position_panel_left_of_sidebar(self, panel_key: str, panel):
+        """
+        Position a window to the LEFT of the sidebar, top-aligned, reusing the cached point
+
+        Args:
+            panel_key: Cache key for the window ('category_filter', 'category_manager')
+            panel: Window instance
+        """
+        cache_key = (panel_key, panel.width())
+        pos = self._panel_pos_cache.get(cache_key)
+        if pos is None:
+            sidebar_rect = self.geometry()
+            pos = QPoint(sidebar_rect.left() - panel.width() - 10, sidebar_rect.top())
+            self._panel_pos_cache[cache_key] = pos
+        panel.move(pos)
+
     def on_global_search_clicked(self):
         """Handle global search button click - toggle global search panel"""
         try:
@@ -467,7 +868,8 @@ class MainWindow(QMainWindow):
                     db_manager=db_manager,
                     config_manager=self.config_manager,
                     list_controller=self.controller.list_controller,
-                    parent=self
+                    parent=self,
+                    panels_manager=self.controller.pinned_panels_manager
                 )
                 self.global_search_panel.item_clicked.connect(self.on_item_clicked)
                 self.global_search_panel.window_closed.connect(self.on_global_search_panel_closed)
@@ -499,6 +901,7 @@ class MainWindow(QMainWindow):
             self.global_search_panel.deleteLater()
             self.global_search_panel = None
 
+    @pyqtSlot(bool)
     def on_global_search_pin_state_changed(self, is_pinned: bool):
         """Handle global search panel pin state change via signal"""
         panel = self.sender()  # Get the panel that emitted the signal
@@ -507,11 +910,15 @@ class MainWindow(QMainWindow):
         else:
             self.on_global_search_panel_unpinned(panel)
 
-    def on_restored_global_search_panel_closed(self, panel):
+    @pyqtSlot()
+    def on_restored_global_search_panel_closed(self):
         """Handle when a restored global search panel is closed"""
-        logger.info(f"Restored global search panel {panel.panel_id} closed")
-        if panel in self.pinned_global_search_panels:
-            self.pinned_global_search_panels.remove(panel)
+        panel = self.sender()
+        if panel is None:
+            return
+        logger.info("Restored global search panel %s closed", panel.panel_id)
+        if self.pinned_global_search_panels.pop(id(panel), None) is not None:
+            self._panels_manager_dirty = True
         panel.deleteLater()
 
     def on_screenshot_clicked(self):
@@ -810,38 +1217,7 @@ class MainWindow(QMainWindow):
 
     def on_favorites_clicked(self):
         """Handle favorites button click - show favorites panel"""
-        try:
-            logger.info("Favorites button clicked")
-
-            # Toggle: Si ya está visible, ocultarlo
-            if self.favorites_panel and self.favorites_panel.isVisible():
-                logger.info("Hiding favorites panel")
-                self.favorites_panel.hide()
-                return
-
-            # Crear panel si no existe
-            if not self.favorites_panel:
-                self.favorites_panel = FavoritesFloatingPanel()
-                self.favorites_panel.favorite_executed.connect(self.on_favorite_executed)
-                self.favorites_panel.window_closed.connect(self.on_favorites_panel_closed)
-                logger.debug("Favorites panel created")
-
-            # Posicionar cerca del sidebar
-            self.favorites_panel.position_near_sidebar(self)
-
-            # Mostrar panel
-            self.favorites_panel.show()
-            self.favorites_panel.refresh()
-
-            logger.info("Favorites panel shown")
-
-        except Exception as e:
-            logger.error(f"Error in on_favorites_clicked: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error al mostrar favoritos:\n{str(e)}"
-            )
+        self._toggle_panel('favorites')
 
     def on_refresh_clicked(self):
         """Handle refresh button click - reload all categories and items from database"""
@@ -886,37 +1262,7 @@ class MainWindow(QMainWindow):
 
     def on_stats_clicked(self):
         """Handle stats button click - show stats panel"""
-        try:
-            logger.info("Stats button clicked")
-
-            # Toggle: Si ya está visible, ocultarlo
-            if self.stats_panel and self.stats_panel.isVisible():
-                logger.info("Hiding stats panel")
-                self.stats_panel.hide()
-                return
-
-            # Crear panel si no existe
-            if not self.stats_panel:
-                self.stats_panel = StatsFloatingPanel()
-                self.stats_panel.window_closed.connect(self.on_stats_panel_closed)
-                logger.debug("Stats panel created")
-
-            # Posicionar cerca del sidebar
-            self.stats_panel.position_near_sidebar(self)
-
-            # Mostrar panel
-            self.stats_panel.show()
-            self.stats_panel.refresh()
-
-            logger.info("Stats panel shown")
-
-        except Exception as e:
-            logger.error(f"Error in on_stats_clicked: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error al mostrar estadísticas:\n{str(e)}"
-            )
+        self._toggle_panel('stats')
 
     def on_stats_panel_closed(self):
         """Handle stats panel closed"""
@@ -1040,19 +1386,16 @@ class MainWindow(QMainWindow):
                 f"Error al abrir el wizard de creación de tabla con IA:\n{str(e)}"
             )
 
-    def on_ai_table_created(self, table_name: str, items_count: int):
+    def on_ai_table_created(self, table_name: str, items_count: int, category_id: int):
         """Callback when AI table is created"""
         try:
             logger.info(f"AI Table created: {table_name} with {items_count} items")
 
-            # Refresh categories
-            if self.controller:
-                self.controller.load_categories()
-                self.controller.invalidate_filter_cache()
+            # Refresh only the target category
+            self.reload_category_in_sidebar(category_id)
 
-            # Show success notification
-            QMessageBox.information(
-                self,
+            # Show success notification (non-blocking)
+            self.show_success_message(
                 "Tabla Creada",
                 f"Tabla '{table_name}' creada exitosamente con {items_count} items."
             )
@@ -1060,6 +1403,22 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error in on_ai_table_created: {e}", exc_info=True)
 
+    def show_success_message(self, title: str, message: str, duration: int = 3000):
+        """
+        Show a non-blocking success message via the system tray
+
+        Unlike QMessageBox.information this does not spin a nested event loop,
+        so the sidebar stays responsive after bulk operations.
+
+        Args:
+            title: Message title
+            message: Message text
+            duration: Duration in milliseconds (default 3000)
+        """
+        logger.info(f"{title}: {message}")
+        if self.tray_manager:
+            self.tray_manager.show_message(title, message, duration)
+
     def on_table_creator_clicked(self):
         """Handle Table Creator button click - open wizard"""
         try:
@@ -1103,15 +1462,8 @@ class MainWindow(QMainWindow):
         try:
             logger.info(f"Table created: {table_name} with {items_created} items")
 
-            # Refresh UI - recargar categorías
-            if self.controller:
-                self.controller.load_categories()
-                logger.debug("Categories reloaded after table creation")
-
-                # Refresh sidebar para mostrar categorías actualizadas
-                if hasattr(self, 'sidebar'):
-                    self.sidebar.load_categories(self.controller.categories)
-                    logger.debug("Sidebar categories refreshed")
+            # Refresh UI - recargar categorías (coalescido)
+            self.schedule_categories_reload()
 
             logger.info(f"Table '{table_name}' created successfully with {items_created} items")
 
@@ -1158,42 +1510,33 @@ class MainWindow(QMainWindow):
         try:
             logger.info("Tables changed - refreshing UI")
 
-            # Refresh UI - recargar categorías
-            if self.controller:
-                self.controller.load_categories()
-                logger.debug("Categories reloaded after tables change")
-
-                # Refresh sidebar para mostrar categorías actualizadas
-                if hasattr(self, 'sidebar'):
-                    self.sidebar.load_categories(self.controller.categories)
-                    logger.debug("Sidebar categories refreshed")
+            # Refresh UI - recargar categorías (coalescido)
+            self.schedule_categories_reload()
 
-                # Si hay un panel flotante abierto, recargarlo
-                if hasattr(self, 'current_panel') and self.current_panel:
-                    self.current_panel.refresh_items()
-                    logger.debug("Current panel refreshed")
+            # Si hay un panel flotante abierto, recargarlo
+            if hasattr(self, 'current_panel') and self.current_panel:
+                self.current_panel.refresh_items()
+                logger.debug("Current panel refreshed")
 
         except Exception as e:
             logger.error(f"Error after tables change: {e}", exc_info=True)
 
-    def on_bulk_items_created(self, count: int):
+    def on_bulk_items_created(self, count: int, category_id: int):
         """
         Callback después de crear items bulk.
 
         Args:
             count: Número de items creados
+            category_id: ID de la categoría donde se crearon
         """
         try:
             logger.info(f"Bulk items created: {count}")
 
-            # Refresh UI - recargar categorías
-            if self.controller:
-                self.controller.load_categories()
-                logger.debug("Categories reloaded after bulk creation")
+            # Refresh UI - recargar solo la categoría afectada
+            self.reload_category_in_sidebar(category_id)
 
-            # Mostrar notificación de éxito
-            QMessageBox.information(
-                self,
+            # Mostrar notificación de éxito (no bloqueante)
+            self.show_success_message(
                 "Éxito",
                 f"Se crearon {count} items exitosamente."
             )
@@ -1201,6 +1544,26 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error in on_bulk_items_created: {e}", exc_info=True)
 
+    def reload_category_in_sidebar(self, category_id):
+        """
+        Reload a single category from database and update its sidebar button
+
+        Falls back to a full refresh when the category id is unknown.
+
+        Args:
+            category_id: ID de la categoría modificada
+        """
+        if not self.controller:
+            return
+
+        category = self.controller.reload_category(category_id) if category_id else None
+        if category:
+            self.sidebar.update_category(category)
+            logger.debug(f"Category {category_id} reloaded in sidebar")
+        else:
+            self.controller.refresh_ui()
+            logger.debug("Full UI refresh after category change")
+
     def on_bulk_items_saved(self, count: int):
         """
         Callback después de guardar items desde el Creador Masivo.
@@ -1216,10 +1579,10 @@ class MainWindow(QMainWindow):
                 self.controller.load_categories()
                 logger.debug("Categories reloaded after bulk item creation")
 
-            # Mostrar notificación de éxito
-            self.notification_manager.show_notification(
-                f"✅ {count} items guardados exitosamente",
-                duration=3000
+            # Mostrar notificación de éxito (no bloqueante)
+            self.show_success_message(
+                "Creador Masivo",
+                f"✅ {count} items guardados exitosamente"
             )
 
         except Exception as e:
@@ -1297,83 +1660,62 @@ class MainWindow(QMainWindow):
 
     def on_category_filter_clicked(self):
         """Handle category filter button click - show filter window"""
-        try:
-            logger.info("Category filter button clicked")
-
-            # Toggle: Si ya está visible, ocultarlo
-            if self.category_filter_window and self.category_filter_window.isVisible():
-                logger.info("Hiding category filter window")
-                self.category_filter_window.hide()
-                return
+        self._toggle_panel('category_filter')
 
-            # Crear ventana si no existe
-            if not self.category_filter_window:
-                self.category_filter_window = CategoryFilterWindow(self)
-                self.category_filter_window.filters_changed.connect(self.on_category_filters_changed)
-                self.category_filter_window.filters_cleared.connect(self.on_category_filters_cleared)
-                self.category_filter_window.window_closed.connect(self.on_category_filter_window_closed)
-                logger.debug("Category filter window created")
-
-            # Posicionar a la IZQUIERDA del sidebar
-            sidebar_rect = self.geometry()
-            filter_window_width = self.category_filter_window.width()
-            window_x = sidebar_rect.left() - filter_window_width - 10
-            window_y = sidebar_rect.top()
-            self.category_filter_window.move(window_x, window_y)
+    def on_category_manager_clicked(self):
+        """Handle category manager button click - show category manager window"""
+        self._toggle_panel('category_manager')
 
-            # Mostrar ventana
-            self.category_filter_window.show()
+    def _toggle_panel(self, panel_key: str):
+        """
+        Toggle a sidebar panel described in PANEL_SPECS
 
-            logger.info("Category filter window shown")
+        Hides the panel if visible; otherwise creates it lazily (wiring its
+        signals once), positions it next to the sidebar and shows it.
 
-        except Exception as e:
-            logger.error(f"Error in on_category_filter_clicked: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error al mostrar filtros de categorías:\n{str(e)}"
-            )
-
-    def on_category_manager_clicked(self):
-        """Handle category manager button click - show category manager window"""
+        Args:
+            panel_key: Key in PANEL_SPECS ('favorites', 'stats', ...)
+        """
+        spec = PANEL_SPECS[panel_key]
         try:
-            logger.info("Category manager button clicked")
+            logger.info(f"Toggle panel requested: {panel_key}")
+            panel = getattr(self, spec.attr)
 
             # Toggle: Si ya está visible, ocultarlo
-            if hasattr(self, 'category_manager_window') and self.category_manager_window and self.category_manager_window.isVisible():
-                logger.info("Hiding category manager window")
-                self.category_manager_window.hide()
+            if panel and panel.isVisible():
+                logger.info(f"Hiding {panel_key} panel")
+                panel.hide()
                 return
 
-            # Crear ventana si no existe
-            if not hasattr(self, 'category_manager_window') or not self.category_manager_window:
-                from views.dialogs.category_manager_window import CategoryManagerWindow
-                self.category_manager_window = CategoryManagerWindow(
-                    controller=self.controller,
-                    parent=None  # Sin parent para que sea ventana independiente
-                )
-                self.category_manager_window.categories_changed.connect(self.on_categories_changed_from_manager)
-                logger.debug("Category manager window created")
-
-            # Posicionar a la IZQUIERDA del sidebar
-            sidebar_rect = self.geometry()
-            manager_window_width = self.category_manager_window.width()
-            window_x = sidebar_rect.left() - manager_window_width - 10
-            window_y = sidebar_rect.top()
-            self.category_manager_window.move(window_x, window_y)
+            # Crear panel si no existe
+            if not panel:
+                panel = spec.factory(self)
+                for signal_name, handler_name in spec.connects:
+                    getattr(panel, signal_name).connect(getattr(self, handler_name))
+                setattr(self, spec.attr, panel)
+                logger.debug(f"{panel_key} panel created")
+
+            # Posicionar junto al sidebar
+            if spec.positioner == 'sidebar':
+                self._position_panel_near_sidebar(panel_key, panel)
+            else:
+                self._position_panel_left_of_sidebar(panel_key, panel)
 
-            # Mostrar ventana
-            self.category_manager_window.show()
-            self.category_manager_window.activateWindow()
+            # Mostrar panel
+            panel.show()
+            if spec.activate:
+                panel.activateWindow()
+            if spec.refresh:
+                panel.refresh()
 
-            logger.info("Category manager window shown")
+            logger.info(f"{panel_key} panel shown")
 
         except Exception as e:
-            logger.error(f"Error in on_category_manager_clicked: {e}", exc_info=True)
+            logger.error(f"Error toggling {panel_key} panel: {e}", exc_info=True)
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Error al mostrar gestor de categorías:\n{str(e)}"
+                f"{spec.error_message}:\n{str(e)}"
             )
 
     def on_categories_changed_from_manager(self):
@@ -1381,16 +1723,8 @@ class MainWindow(QMainWindow):
         try:
             logger.info("Categories changed from manager, reloading sidebar")
 
-            # Invalidar caché de filtros
-            if self.controller and hasattr(self.controller, 'invalidate_filter_cache'):
-                self.controller.invalidate_filter_cache()
-                logger.debug("Filter cache invalidated")
-
-            # Recargar categorías en el sidebar
-            if self.controller:
-                categories = self.controller.get_categories()
-                self.load_categories(categories)
-                logger.info(f"Sidebar reloaded with {len(categories)} categories")
+            # Invalidar caché y recargar categorías en el sidebar (coalescido)
+            self.schedule_categories_reload()
 
         except Exception as e:
             logger.error(f"Error reloading categories: {e}", exc_info=True)
@@ -1497,11 +1831,8 @@ class MainWindow(QMainWindow):
         try:
             logger.info("Quick create data changed, reloading categories")
 
-            if self.controller:
-                # Reload categories from database
-                categories = self.controller.config_manager.get_categories()
-                self.load_categories(categories)
-                logger.info("Categories reloaded successfully")
+            # Reload categories from database (coalesced)
+            self.schedule_categories_reload()
 
         except Exception as e:
             logger.error(f"Error reloading categories after quick create: {e}", exc_info=True)
@@ -1530,8 +1861,8 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            # Import ProcessBuilderWindow
-            from views.process_builder_window import ProcessBuilderWindow
+            # Import ProcessBuilderWindow (cached after first use)
+            ProcessBuilderWindow = _lazy_class('views.process_builder_window', 'ProcessBuilderWindow')
 
             # Create and show process builder window
             builder_window = ProcessBuilderWindow(
@@ -1592,8 +1923,8 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            # Import ProcessesFloatingPanel
-            from views.processes_floating_panel import ProcessesFloatingPanel
+            # Import ProcessesFloatingPanel (cached after first use)
+            ProcessesFloatingPanel = _lazy_class('views.processes_floating_panel', 'ProcessesFloatingPanel')
 
             # Check if panel already exists and is not pinned
             if hasattr(self, 'processes_panel') and self.processes_panel and not self.processes_panel.is_pinned:
@@ -1610,14 +1941,14 @@ class MainWindow(QMainWindow):
                 config_manager=self.controller.config_manager,
                 process_controller=self.controller.process_controller,
                 parent=self,
-                main_window=self
+                main_window=self,
+                panels_manager=self.controller.pinned_panels_manager
             )
 
             # Position near sidebar
-            self.processes_panel.position_near_sidebar(self)
+            self._position_panel_near_sidebar('processes', self.processes_panel)
 
-            # Load all processes
-            self.processes_panel.load_all_processes()
+            # Processes are fetched lazily by the panel's ProcessesModel on show
 
             # Connect signals
             self.processes_panel.process_executed.connect(self.on_process_executed_from_panel)
@@ -1641,15 +1972,17 @@ class MainWindow(QMainWindow):
     def on_process_clicked(self, process_id: int):
         """Handle process button click from sidebar - show floating panel for specific process"""
         try:
-            logger.info(f"Process button clicked: {process_id}")
+            logger.info("Process button clicked: %s", process_id)
 
             # Toggle: if same process and panel not pinned, hide it
-            if (self.current_process_id == process_id and
-                self.current_process_panel and
-                self.current_process_panel.isVisible() and
-                not self.current_process_panel.is_pinned):
-                logger.info(f"Toggling off - hiding process panel: {process_id}")
-                self.current_process_panel.hide()
+            # (cheapest checks first; isVisible() is a C++ call and goes last)
+            panel = self.current_process_panel
+            if (panel is not None and
+                self.current_process_id == process_id and
+                not panel.is_pinned and
+                panel.isVisible()):
+                logger.info("Toggling off - hiding process panel: %s", process_id)
+                panel.hide()
                 self.current_process_id = None
                 return
 
@@ -1661,21 +1994,21 @@ class MainWindow(QMainWindow):
             process = self.controller.process_controller.get_process(process_id)
 
             if not process:
-                logger.warning(f"Process {process_id} not found")
+                logger.warning("Process %s not found", process_id)
                 return
 
-            logger.info(f"Process found: {process.name}")
+            logger.info("Process found: %s", process.name)
 
             # If current panel is pinned, add to pinned list
             if self.current_process_panel and self.current_process_panel.is_pinned:
                 logger.info("Current process panel is pinned, adding to pinned_process_panels list")
-                if self.current_process_panel not in self.pinned_process_panels:
-                    self.pinned_process_panels.append(self.current_process_panel)
+                self.pinned_process_panels[id(self.current_process_panel)] = self.current_process_panel
                 self.current_process_panel = None
 
-            # Create new panel if needed
-            if not self.current_process_panel:
-                from views.process_floating_panel import ProcessFloatingPanel
+            # Create new panel only if the pool is empty (closed panels are
+            # hidden and reused; a new one is only needed after a pin promotion)
+            if self.current_process_panel is None:
+                ProcessFloatingPanel = _lazy_class('views.process_floating_panel', 'ProcessFloatingPanel')
 
                 self.current_process_panel = ProcessFloatingPanel(
                     process_controller=self.controller.process_controller,
@@ -1683,30 +2016,34 @@ class MainWindow(QMainWindow):
                     main_window=self,
                     parent=self
                 )
-                self.current_process_panel.item_clicked.connect(self.on_item_clicked)
-                self.current_process_panel.window_closed.connect(self.on_process_panel_closed)
-                self.current_process_panel.pin_state_changed.connect(self.on_process_panel_pin_changed)
+                self._wire_panel(self.current_process_panel, self._PROCESS_PANEL_SIGNALS)
                 logger.debug("New process floating panel created")
 
-            # Load process into panel
-            self.current_process_panel.load_process(process)
+            # Position, show and fill the panel in one batch: moving it before
+            # load_process() (which shows it) avoids a show at the stale position,
+            # and disabling updates lets Qt coalesce the repaints into one
+            panel = self.current_process_panel
+            panel.setUpdatesEnabled(False)
+            try:
+                # Position near sidebar (with offset if pinned panels exist)
+                self.position_process_panel(panel)
 
-            # Position near sidebar (with offset if pinned panels exist)
-            self.position_process_panel(self.current_process_panel)
+                # Load process into panel
+                panel.load_process(process)
+            finally:
+                panel.setUpdatesEnabled(True)
 
             # Update current process
             self.current_process_id = process_id
 
             logger.debug("Process loaded into floating panel")
 
-        except Exception as e:
-            logger.error(f"Error in on_process_clicked: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error al cargar proceso:\n{str(e)}\n\nRevisa widget_sidebar_error.log"
-            )
+        except _SLOT_ERRORS as e:
+            # Traceback solo al log; errores inesperados llegan a sys.excepthook (main.py)
+            logger.error("Error in on_process_clicked: %s", e, exc_info=True)
+            QMessageBox.critical(self, "Error", _PROCESS_LOAD_ERROR_MSG)
 
+    @pyqtSlot()
     def on_process_panel_closed(self):
         """Handle process panel closed"""
         logger.info("Process panel closed")
@@ -1717,15 +2054,19 @@ class MainWindow(QMainWindow):
         if sender_panel == self.current_process_panel:
             logger.info("Closing active (non-pinned) process panel")
             self.current_process_id = None
-            self.current_process_panel = None
+            # Keep the hidden widget for reuse on the next click; a pinned
+            # panel that gets closed is released instead
+            if sender_panel.is_pinned:
+                self.current_process_panel = None
             # Clear active process button in sidebar
             if self.sidebar:
                 self.sidebar.clear_active_process()
         # If it's a pinned panel
-        elif sender_panel in self.pinned_process_panels:
+        elif id(sender_panel) in self.pinned_process_panels:
             logger.info("Closing pinned process panel")
-            self.pinned_process_panels.remove(sender_panel)
+            self.pinned_process_panels.pop(id(sender_panel), None)
 
+    @pyqtSlot(bool)
     def on_process_panel_pin_changed(self, is_pinned: bool):
         """Handle process panel pin state changed"""
         logger.info(f"Process panel pin state changed: {is_pinned}")
@@ -1734,18 +2075,27 @@ class MainWindow(QMainWindow):
     def on_process_state_changed(self, process_id: int, is_active: bool):
         """Handle process state change - refresh sidebar"""
         logger.info(f"Process state changed: {process_id} -> is_active={is_active}")
+
+        # Skip the rebuild if the sidebar already shows this state
+        if self._sidebar_process_active.get(process_id, False) == is_active:
+            return
+        self._sidebar_process_active[process_id] = is_active
+
         # Refresh sidebar to show/hide process button
-        self.load_processes_to_sidebar()
+        self._request_update('sidebar')
+
+    def _sidebar_anchor(self):
+        """Return the cached (x, y) of the sidebar, used to place process panels"""
+        if self._anchor is None:
+            self._anchor = (self.x(), self.y())
+        return self._anchor
 
     def position_process_panel(self, panel):
         """Position process panel near sidebar with offset for pinned panels"""
-        # Position to the left of sidebar
-        panel_x = self.x() - panel.width()
-
-        # Calculate offset based on number of pinned process panels
-        offset = len(self.pinned_process_panels) * 20
+        ax, ay = self._sidebar_anchor()
 
-        panel.move(panel_x - offset, self.y())
+        # Position to the left of sidebar, offset by the number of pinned process panels
+        panel.move(ax - panel.width() - 20 * len(self.pinned_process_panels), ay)
         panel.show()
 
     def on_process_executed_from_panel(self, process_id: int):
@@ -1761,8 +2111,8 @@ class MainWindow(QMainWindow):
         try:
             logger.info(f"Edit requested for process {process_id}")
 
-            # Import ProcessBuilderWindow
-            from views.process_builder_window import ProcessBuilderWindow
+            # Import ProcessBuilderWindow (cached after first use)
+            ProcessBuilderWindow = _lazy_class('views.process_builder_window', 'ProcessBuilderWindow')
 
             # Create builder window in edit mode
             builder_window = ProcessBuilderWindow(
@@ -1780,8 +2130,8 @@ class MainWindow(QMainWindow):
             # Show window
             builder_window.show()
 
-        except Exception as e:
-            logger.error(f"Error opening process editor: {e}", exc_info=True)
+        except _SLOT_ERRORS as e:
+            logger.error("Error opening process editor: %s", e, exc_info=True)
 
     def on_process_updated(self, process_id: int):
         """Handle process updated event"""
@@ -1789,11 +2139,10 @@ class MainWindow(QMainWindow):
             logger.info(f"Process {process_id} updated")
 
             # Reload processes panel if exists
-            if hasattr(self, 'processes_panel') and self.processes_panel:
-                self.processes_panel.reload_processes()
+            self._request_update('processes_panel')
 
-        except Exception as e:
-            logger.error(f"Error handling process update: {e}", exc_info=True)
+        except _SLOT_ERRORS as e:
+            logger.error("Error handling process update: %s", e, exc_info=True)
 
     def on_processes_panel_pin_changed(self, is_pinned: bool):
         """Handle processes panel pin state change"""
@@ -1811,6 +2160,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error handling panel close: {e}", exc_info=True)
 
+    @pyqtSlot(object)
     def on_item_clicked(self, item: Item):
         """Handle item button click"""
         try:
@@ -1825,33 +2175,89 @@ class MainWindow(QMainWindow):
             # Emit signal
             self.item_selected.emit(item)
 
-        except Exception as e:
-            logger.error(f"Error in on_item_clicked: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error al copiar item:\n{str(e)}\n\nRevisa widget_sidebar_error.log"
-            )
+        except _SLOT_ERRORS as e:
+            logger.error("Error in on_item_clicked: %s", e, exc_info=True)
+            QMessageBox.critical(self, "Error", _ITEM_COPY_ERROR_MSG)
+
+    def _geom(self):
+        """
+        Return the available geometry of the window's screen (cached)
+
+        Querying the screen crosses to the window system, so the value is kept
+        until the window changes screen, the screen geometry changes or the
+        window is resized.
+        """
+        # Connect invalidation signals once the native window exists
+        if not self._screen_signals_connected:
+            window_handle = self.windowHandle()
+            if window_handle and window_handle.screen():
+                window_handle.screenChanged.connect(self._on_screen_changed)
+                self._track_screen(window_handle.screen())
+                self._screen_signals_connected = True
+
+        if self._cached_geom is None:
+            screen = self.screen()
+            if screen is None:
+                return None
+            self._cached_geom = screen.availableGeometry()
+        return self._cached_geom
+
+    def _invalidate_geom(self, *args):
+        """Drop the cached screen geometry"""
+        self._cached_geom = None
+
+    def _on_screen_changed(self, screen):
+        """Window moved to another screen - invalidate and track the new screen"""
+        self._cached_geom = None
+        self._track_screen(screen)
+
+    def _track_screen(self, screen):
+        """
+        Watch the available geometry of a screen, releasing the previous one
+
+        Args:
+            screen: QScreen the window is on (may be None)
+        """
+        if self._tracked_screen is not None:
+            try:
+                self._tracked_screen.availableGeometryChanged.disconnect(self._invalidate_geom)
+            except (TypeError, RuntimeError):
+                # Pantalla ya desconectada o destruida (monitor desenchufado)
+                pass
+        self._tracked_screen = screen
+        if screen is not None:
+            screen.availableGeometryChanged.connect(self._invalidate_geom)
 
     def position_window(self):
         """Position window on the right edge of the screen, ocupando toda la altura"""
-        # Get primary screen
-        screen = self.screen()
-        if screen is None:
+        # Get primary screen geometry
+        screen_geometry = self._geom()
+        if screen_geometry is None:
             return
 
-        screen_geometry = screen.availableGeometry()
-
         # Position on right edge, arriba del todo (y=0)
         x = screen_geometry.width() - self.width()
         y = screen_geometry.y()  # Arriba del todo (puede ser 0 o el offset si hay barra superior)
 
         self.move(x, y)
 
+    def _init_appbar_data(self, hwnd: int):
+        """
+        Build the APPBARDATA structure once
+
+        Register/unregister reuse the same structure and only mutate its fields.
+        """
+        if self._abd is None:
+            self._abd = APPBARDATA()
+            self._abd.cbSize = APPBARDATA_SIZE
+
+        self._abd.hWnd = hwnd
+        return self._abd
+
     def register_appbar(self):
         """Registrar la ventana como AppBar de Windows para reservar espacio permanentemente"""
         try:
-            if sys.platform != 'win32':
+            if _SHAppBarMessage is None:
                 logger.warning("AppBar solo funciona en Windows")
                 return
 
@@ -1862,16 +2268,12 @@ class MainWindow(QMainWindow):
                 return
 
             # Get screen geometry
-            screen = self.screen()
-            if not screen:
+            screen_geometry = self._geom()
+            if not screen_geometry:
                 return
 
-            screen_geometry = screen.availableGeometry()
-
-            # Create APPBARDATA structure
-            abd = APPBARDATA()
-            abd.cbSize = ctypes.sizeof(APPBARDATA)
-            abd.hWnd = hwnd
+            # Reuse APPBARDATA structure
+            abd = self._init_appbar_data(hwnd)
             abd.uCallbackMessage = 0
             abd.uEdge = ABE_RIGHT  # Lado derecho
 
@@ -1882,14 +2284,15 @@ class MainWindow(QMainWindow):
             abd.rc.bottom = screen_geometry.y() + screen_geometry.height()
 
             # Register the AppBar
-            result = ctypes.windll.shell32.SHAppBarMessage(ABM_NEW, ctypes.byref(abd))
+            abd_ref = ctypes.byref(abd)
+            result = _SHAppBarMessage(ABM_NEW, abd_ref)
             if result:
                 logger.info("AppBar registrada exitosamente - espacio reservado en el escritorio")
                 self.appbar_registered = True
 
                 # Query and set position to reserve space
-                ctypes.windll.shell32.SHAppBarMessage(ABM_QUERYPOS, ctypes.byref(abd))
-                ctypes.windll.shell32.SHAppBarMessage(ABM_SETPOS, ctypes.byref(abd))
+                _SHAppBarMessage(ABM_QUERYPOS, abd_ref)
+                _SHAppBarMessage(ABM_SETPOS, abd_ref)
             else:
                 logger.warning("No se pudo registrar AppBar")
 
@@ -1903,37 +2306,36 @@ class MainWindow(QMainWindow):
             if not self.appbar_registered:
                 return
 
-            if sys.platform != 'win32':
+            if _SHAppBarMessage is None:
                 return
 
             hwnd = int(self.winId())
             if not hwnd:
                 return
 
-            # Create APPBARDATA structure
-            abd = APPBARDATA()
-            abd.cbSize = ctypes.sizeof(APPBARDATA)
-            abd.hWnd = hwnd
+            # Reuse APPBARDATA structure
+            abd = self._init_appbar_data(hwnd)
 
             # Unregister the AppBar
-            ctypes.windll.shell32.SHAppBarMessage(ABM_REMOVE, ctypes.byref(abd))
+            _SHAppBarMessage(ABM_REMOVE, ctypes.byref(abd))
             self.appbar_registered = False
             logger.info("AppBar desregistrada")
 
         except Exception as e:
             logger.error(f"Error al desregistrar AppBar: {e}")
 
-    def mousePressEvent(self, event):
-        """Handle mouse press for dragging"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-            event.accept()
+    def moveEvent(self, event):
+        """Invalidate cached panel positions when the sidebar moves"""
+        self._panel_pos_cache.clear()
+        self._anchor = None
+        super().moveEvent(event)
 
-    def mouseMoveEvent(self, event):
-        """Handle mouse move for dragging"""
-        if event.buttons() == Qt.MouseButton.LeftButton:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
-            event.accept()
+    def resizeEvent(self, event):
+        """Invalidate cached panel positions and screen geometry when the sidebar resizes"""
+        self._panel_pos_cache.clear()
+        self._cached_geom = None
+        self._anchor = None
+        super().resizeEvent(event)
 
     def setup_hotkeys(self):
         """Setup global hotkeys"""
@@ -2060,7 +2462,7 @@ class MainWindow(QMainWindow):
     def open_component_manager(self):
         """Open component manager dialog"""
         print("Opening component manager...")
-        from views.dialogs.component_manager_dialog import ComponentManagerDialog
+        ComponentManagerDialog = _lazy_class('views.dialogs.component_manager_dialog', 'ComponentManagerDialog')
 
         dialog = ComponentManagerDialog(
             component_manager=self.controller.component_manager,
@@ -2080,9 +2482,7 @@ class MainWindow(QMainWindow):
         print("Settings changed - reloading...")
 
         # Reload categories in sidebar
-        if self.controller:
-            categories = self.controller.get_categories()
-            self.sidebar.load_categories(categories)
+        self._request_update('categories')
 
         # Apply appearance settings (opacity, etc.)
         if self.config_manager:
@@ -2135,6 +2535,13 @@ class MainWindow(QMainWindow):
         if self.tray_manager:
             self.tray_manager.cleanup()
 
+        # Guardar en una sola transacción la geometría pendiente (debounce) de
+        # los paneles de proceso anclados; al salir no reciben closeEvent
+        if self.pinned_process_panels:
+            ProcessFloatingPanel = _lazy_class('views.process_floating_panel', 'ProcessFloatingPanel')
+            ProcessFloatingPanel.flush_pending_states(self.config_manager.db,
+                                                      self.pinned_process_panels.values())
+
         # Close window
         self.close()
 
@@ -2143,9 +2550,8 @@ class MainWindow(QMainWindow):
         QApplication.quit()
 
     def check_notifications_delayed(self):
-        """Verificar notificaciones 10 segundos después de abrir"""
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(10000, self.check_notifications)  # 10 segundos
+        """Verificar notificaciones 10 segundos después de abrir (reinicia si ya estaba pendiente)"""
+        self._notif_timer.start()
 
     def check_notifications(self):
         """Verificar y mostrar notificaciones pendientes"""
@@ -2190,42 +2596,21 @@ class MainWindow(QMainWindow):
     def handle_notification_action(self, action: str):
         """Manejar acción de notificación"""
         try:
-            if action == 'show_favorite_suggestions':
-                self.show_favorite_suggestions()
-
-            elif action == 'show_cleanup_suggestions':
-                self.show_forgotten_items()
-
-            elif action == 'show_abandoned_items':
-                self.show_forgotten_items()
-
-            elif action == 'show_failing_items':
-                # TODO: Crear diálogo específico para items con errores
-                QMessageBox.information(
-                    self,
-                    "Items con Errores",
-                    "Funcionalidad en desarrollo"
-                )
-
-            elif action == 'show_slow_items':
-                # TODO: Crear diálogo específico para items lentos
-                QMessageBox.information(
-                    self,
-                    "Items Lentos",
-                    "Funcionalidad en desarrollo"
-                )
+            handler = self._action_dispatch.get(action)
+            if handler is None:
+                logger.warning(f"Unknown notification action: '{action}'")
+                return
 
-            elif action == 'show_shortcut_suggestions':
-                # TODO: Crear diálogo para asignar atajos
-                QMessageBox.information(
-                    self,
-                    "Sugerencias de Atajos",
-                    "Funcionalidad en desarrollo"
-                )
+            with self.batch_updates():
+                handler()
 
         except Exception as e:
             logger.error(f"Error handling notification action '{action}': {e}")
 
+    def _show_feature_in_development(self, title: str):
+        """Aviso para acciones de notificación aún no implementadas"""
+        QMessageBox.information(self, title, "Funcionalidad en desarrollo")
+
     def show_popular_items(self):
         """Mostrar diálogo de items populares"""
         try:
@@ -2242,9 +2627,7 @@ class MainWindow(QMainWindow):
             dialog = ForgottenItemsDialog(self)
             if dialog.exec():
                 # Recargar categorías si se eliminaron items
-                if self.controller:
-                    categories = self.controller.get_categories()
-                    self.sidebar.load_categories(categories)
+                self._request_update('categories')
         except Exception as e:
             logger.error(f"Error showing forgotten items: {e}")
             QMessageBox.critical(self, "Error", f"Error al mostrar items olvidados:\n{str(e)}")
@@ -2264,8 +2647,7 @@ class MainWindow(QMainWindow):
             dialog = FavoriteSuggestionsDialog(self)
             if dialog.exec():
                 # Refrescar panel de favoritos si existe
-                if self.favorites_panel:
-                    self.favorites_panel.refresh()
+                self._request_update('favorites')
         except Exception as e:
             logger.error(f"Error showing favorite suggestions: {e}")
             QMessageBox.critical(self, "Error", f"Error al mostrar sugerencias:\n{str(e)}")
@@ -2275,6 +2657,7 @@ class MainWindow(QMainWindow):
         logger.info(f"Popular item selected: {item_id}")
         # TODO: Abrir el item o mostrarlo en la lista principal
 
+    @pyqtSlot()
     def on_panel_customization_requested(self):
         """Handle customization request from a pinned panel"""
         sender_panel = self.sender()
@@ -2285,12 +2668,8 @@ class MainWindow(QMainWindow):
         current_color = sender_panel.custom_color or "#007acc"
         category_name = sender_panel.current_category.name if sender_panel.current_category else ""
 
-        # Get current keyboard shortcut from database if panel is saved
-        current_shortcut = ""
-        if sender_panel.panel_id and self.controller:
-            panel_data = self.controller.pinned_panels_manager.get_panel_by_id(sender_panel.panel_id)
-            if panel_data:
-                current_shortcut = panel_data.get('keyboard_shortcut', '')
+        # Current keyboard shortcut is kept on the panel (no DB round-trip)
+        current_shortcut = getattr(sender_panel, 'keyboard_shortcut', '') or ''
 
         # Open config dialog
         dialog = PanelConfigDialog(
@@ -2302,39 +2681,60 @@ class MainWindow(QMainWindow):
         )
 
         # Connect save signal
-        dialog.config_saved.connect(lambda name, color, shortcut: self.on_panel_customized(sender_panel, name, color, shortcut))
+        dialog.config_saved.connect(partial(self.on_panel_customized, sender_panel))
 
         # Show dialog
         dialog.exec()
 
     def on_panel_customized(self, panel, custom_name: str, custom_color: str, keyboard_shortcut: str):
         """Handle panel customization save"""
-        logger.info(f"[SHORTCUT DEBUG] on_panel_customized called with shortcut: '{keyboard_shortcut}'")
-        logger.info(f"Applying customization - Name: '{custom_name}', Color: {custom_color}, Shortcut: '{keyboard_shortcut}'")
-        logger.info(f"[SHORTCUT DEBUG] Panel has panel_id: {panel.panel_id}")
+        logger.info("Applying customization - Name: '%s', Color: %s, Shortcut: '%s'",
+                    custom_name, custom_color, keyboard_shortcut)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SHORTCUT DEBUG] on_panel_customized called with shortcut: '%s', panel_id: %s",
+                         keyboard_shortcut, panel.panel_id)
+
+        # Skip the repaint and the DB UPDATE when the dialog was saved unchanged
+        if ((custom_name or None) == (panel.custom_name or None) and
+                custom_color == panel.custom_color and
+                (keyboard_shortcut or None) == (getattr(panel, 'keyboard_shortcut', None) or None)):
+            logger.debug("Panel customization unchanged, nothing to apply")
+            return
+
+        # Rechazar atajos ya asignados a otro panel antes de tocar panel o BD
+        if keyboard_shortcut:
+            owner = self.panel_by_shortcut.get(_canonical_shortcut(keyboard_shortcut))
+            if owner is not None and owner is not panel:
+                logger.warning("Shortcut %s already assigned to panel %s, customization of panel %s not applied",
+                               keyboard_shortcut, owner.panel_id, panel.panel_id)
+                QMessageBox.warning(
+                    self,
+                    "Atajo en uso",
+                    f"El atajo {keyboard_shortcut} ya está asignado a otro panel.\n"
+                    "Elige un atajo diferente."
+                )
+                return
 
         # Update panel appearance
         panel.update_customization(custom_name=custom_name, custom_color=custom_color)
 
         # If panel has panel_id (saved in database), update there too
         if panel.panel_id and self.controller:
-            logger.info(f"[SHORTCUT DEBUG] Updating panel {panel.panel_id} in database with shortcut: '{keyboard_shortcut}'")
             self.controller.pinned_panels_manager.update_panel_customization(
                 panel_id=panel.panel_id,
                 custom_name=custom_name if custom_name else None,
                 custom_color=custom_color,
                 keyboard_shortcut=keyboard_shortcut if keyboard_shortcut else None
             )
-            logger.info(f"Updated panel {panel.panel_id} in database")
+            panel.keyboard_shortcut = keyboard_shortcut or None
+            logger.info("Updated panel %s in database", panel.panel_id)
 
-            # Update keyboard shortcut registration
-            logger.info(f"[SHORTCUT DEBUG] About to unregister old shortcut for panel {panel.panel_id}")
-            self.unregister_panel_shortcut(panel)  # Remove old shortcut if exists
-            if keyboard_shortcut:  # Register new shortcut if provided
-                logger.info(f"[SHORTCUT DEBUG] About to register new shortcut '{keyboard_shortcut}' for panel {panel.panel_id}")
+            # Update keyboard shortcut registration (re-keys the existing QShortcut)
+            if keyboard_shortcut:
                 self.register_panel_shortcut(panel, keyboard_shortcut)
             else:
-                logger.info(f"[SHORTCUT DEBUG] No shortcut to register (empty string)")
+                self.unregister_panel_shortcut(panel)
+                logger.debug("[SHORTCUT DEBUG] No shortcut to register (empty string)")
 
     def register_panel_shortcut(self, panel, shortcut_str: str):
         """
@@ -2344,43 +2744,72 @@ class MainWindow(QMainWindow):
             panel: FloatingPanel instance
             shortcut_str: Keyboard shortcut string (e.g., 'Ctrl+Shift+1')
         """
-        logger.info(f"[SHORTCUT DEBUG] register_panel_shortcut called with: '{shortcut_str}', panel_id: {panel.panel_id}")
-
         if not shortcut_str:
-            logger.warning(f"[SHORTCUT DEBUG] Empty shortcut_str, not registering")
+            logger.warning("[SHORTCUT DEBUG] Empty shortcut_str, not registering")
             return
 
         if not panel.panel_id:
-            logger.warning(f"[SHORTCUT DEBUG] Panel has no panel_id, not registering")
+            logger.warning("[SHORTCUT DEBUG] Panel has no panel_id, not registering")
+            return
+
+        # Canonical form (e.g. 'ctrl+shift+1' -> 'Ctrl+Shift+1') used as dict key
+        key_sequence = _seq(shortcut_str)
+        shortcut_str = _canonical_shortcut(shortcut_str)
+
+        shortcut = self.panel_shortcuts.get(panel.panel_id)
+        old_shortcut_str = self.shortcut_by_panel_id.get(panel.panel_id)
+
+        # Same binding already registered - nothing to do
+        if shortcut is not None and old_shortcut_str == shortcut_str:
+            return
+
+        # Reject shortcuts already bound to another panel
+        owner = self.panel_by_shortcut.get(shortcut_str)
+        if owner is not None and owner is not panel:
+            logger.warning("Shortcut %s already assigned to panel %s, not registering for panel %s",
+                           shortcut_str, owner.panel_id, panel.panel_id)
             return
 
         try:
-            # Remove old shortcut if panel already has one
-            logger.info(f"[SHORTCUT DEBUG] Removing old shortcut if exists")
-            self.unregister_panel_shortcut(panel)
-
-            # Create QShortcut
-            logger.info(f"[SHORTCUT DEBUG] Creating QShortcut for '{shortcut_str}'")
-            key_sequence = QKeySequence(shortcut_str)
-            logger.info(f"[SHORTCUT DEBUG] QKeySequence created: {key_sequence.toString()}")
-
-            shortcut = QShortcut(key_sequence, self)
-            # CRITICAL: Set context to ApplicationShortcut so it works even when panel is minimized
-            from PyQt6.QtCore import Qt
-            shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
-            logger.info(f"[SHORTCUT DEBUG] QShortcut object created with ApplicationShortcut context")
-            logger.info(f"[SHORTCUT DEBUG] Connecting to activation handler")
-            shortcut.activated.connect(lambda: self.on_panel_shortcut_activated(panel))
+            if shortcut is not None:
+                # Reuse the panel's QShortcut, just re-key it
+                shortcut.setKey(key_sequence)
+                if old_shortcut_str and self.panel_by_shortcut.get(old_shortcut_str) is panel:
+                    del self.panel_by_shortcut[old_shortcut_str]
+            else:
+                # Create QShortcut
+                shortcut = QShortcut(key_sequence, self)
+                # CRITICAL: Set context to ApplicationShortcut so it works even when panel is minimized
+                shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+                shortcut.activated.connect(lambda: self.on_panel_shortcut_activated(panel))
+                self.panel_shortcuts[panel.panel_id] = shortcut
 
             # Store references
-            self.panel_shortcuts[panel.panel_id] = shortcut
             self.panel_by_shortcut[shortcut_str] = panel
+            self.shortcut_by_panel_id[panel.panel_id] = shortcut_str
 
-            logger.info(f"[SHORTCUT DEBUG] Successfully registered shortcut {shortcut_str} for panel {panel.panel_id}")
-            logger.info(f"[SHORTCUT DEBUG] Total registered shortcuts: {len(self.panel_shortcuts)}")
-            logger.info(f"[SHORTCUT DEBUG] Shortcuts dict: {list(self.panel_shortcuts.keys())}")
+            logger.debug("Registered shortcut %s for panel %s", shortcut_str, panel.panel_id)
         except Exception as e:
-            logger.error(f"[SHORTCUT DEBUG] Failed to register shortcut {shortcut_str}: {e}", exc_info=True)
+            logger.error("[SHORTCUT DEBUG] Failed to register shortcut %s: %s", shortcut_str, e, exc_info=True)
+
+    def register_panel_shortcuts_bulk(self, pairs):
+        """
+        Register keyboard shortcuts for several panels at once (e.g. on startup)
+
+        Args:
+            pairs: List of (FloatingPanel, shortcut_str) tuples
+        """
+        if not pairs:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            for panel, shortcut_str in pairs:
+                self.register_panel_shortcut(panel, shortcut_str)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        logger.info("Registered %d panel shortcuts", len(pairs))
 
     def unregister_panel_shortcut(self, panel):
         """
@@ -2397,19 +2826,16 @@ class MainWindow(QMainWindow):
             if panel.panel_id in self.panel_shortcuts:
                 shortcut = self.panel_shortcuts[panel.panel_id]
 
-                # Find shortcut string to remove from lookup dict
-                shortcut_str = None
-                for key, value in self.panel_by_shortcut.items():
-                    if value == panel:
-                        shortcut_str = key
-                        break
+                # Shortcut string to remove from lookup dict
+                shortcut_str = self.shortcut_by_panel_id.pop(panel.panel_id, None)
 
                 # Disconnect and delete shortcut
                 shortcut.setEnabled(False)
                 shortcut.activated.disconnect()
+                shortcut.deleteLater()
                 del self.panel_shortcuts[panel.panel_id]
 
-                if shortcut_str:
+                if shortcut_str and self.panel_by_shortcut.get(shortcut_str) is panel:
                     del self.panel_by_shortcut[shortcut_str]
 
                 logger.info(f"Unregistered shortcut for panel {panel.panel_id}")
@@ -2424,24 +2850,15 @@ class MainWindow(QMainWindow):
             panel: FloatingPanel instance
         """
         try:
-            logger.info(f"[SHORTCUT DEBUG] ========== SHORTCUT ACTIVATED ==========")
-            logger.info(f"[SHORTCUT DEBUG] Shortcut activated for panel {panel.panel_id}")
-            logger.info(f"[SHORTCUT DEBUG] Panel minimized state: {panel.is_minimized}")
-            logger.info(f"[SHORTCUT DEBUG] Panel visible: {panel.isVisible()}")
-
             # Toggle minimize/maximize state
-            logger.info(f"[SHORTCUT DEBUG] Calling panel.toggle_minimize()")
             panel.toggle_minimize()
-            logger.info(f"[SHORTCUT DEBUG] After toggle, minimized state: {panel.is_minimized}")
+            logger.debug("Shortcut activated for panel %s (minimized: %s)", panel.panel_id, panel.is_minimized)
 
             # Make sure panel is visible and on top
             if not panel.isVisible():
-                logger.info(f"[SHORTCUT DEBUG] Panel not visible, showing it")
                 panel.show()
-            logger.info(f"[SHORTCUT DEBUG] Raising panel to front")
             panel.raise_()
             panel.activateWindow()
-            logger.info(f"[SHORTCUT DEBUG] ========== SHORTCUT ACTIVATION COMPLETE ==========")
 
         except Exception as e:
             logger.error(f"[SHORTCUT DEBUG] Error handling shortcut activation for panel {panel.panel_id}: {e}", exc_info=True)
@@ -2457,9 +2874,12 @@ class MainWindow(QMainWindow):
             logger.warning("No controller available - skipping panel restoration")
             return
 
+        # Bind frequently used collaborators once for the whole restore loop
+        panels_manager = self.controller.pinned_panels_manager
+
         try:
             # Get all active panels from database
-            active_panels = self.controller.pinned_panels_manager.restore_panels_on_startup()
+            active_panels = panels_manager.restore_panels_on_startup()
 
             if not active_panels:
                 logger.info("No active panels to restore")
@@ -2467,6 +2887,17 @@ class MainWindow(QMainWindow):
 
             logger.info(f"Restoring {len(active_panels)} active panels from database...")
 
+            # (panel, shortcut) pairs registered together once all panels are restored
+            pending_shortcuts = []
+            opened_ids = []  # last_opened se actualiza en un solo UPDATE al final
+
+            # Prefetch all needed categories in one batch (avoids one lookup per panel)
+            category_ids = {str(p['category_id']) for p in active_panels if p['category_id'] is not None}
+            categories_by_id = self.controller.get_categories_bulk(category_ids)
+
+            # Deserialize all saved filter configurations in one pass
+            filter_configs = panels_manager._deserialize_filter_configs_bulk(active_panels)
+
             # Restore each panel
             for panel_data in active_panels:
                 try:
@@ -2479,81 +2910,112 @@ class MainWindow(QMainWindow):
                         continue
 
                     # Get category
-                    category = self.controller.get_category(str(category_id))
+                    category = categories_by_id.get(str(category_id))
                     if not category:
                         logger.warning(f"Category {category_id} not found for panel {panel_id} - skipping")
                         continue
 
                     # Create new floating panel with saved configuration
-                    restored_panel = FloatingPanel(
-                        config_manager=self.config_manager,
-                        list_controller=self.controller.list_controller if self.controller else None,
-                        panel_id=panel_id,
-                        custom_name=panel_data.get('custom_name'),
-                        custom_color=panel_data.get('custom_color'),
-                        main_window=self
+                    restored_panel = self._build_category_panel(
+                        panel_data, category, filter_configs.get(panel_id)
                     )
 
-                    # Connect signals
-                    restored_panel.item_clicked.connect(self.on_item_clicked)
-                    restored_panel.window_closed.connect(self.on_floating_panel_closed)
-                    restored_panel.pin_state_changed.connect(self.on_panel_pin_changed)
-                    restored_panel.customization_requested.connect(self.on_panel_customization_requested)
-                    restored_panel.url_open_requested.connect(self.on_url_open_in_browser)
-
-                    # Load category
-                    restored_panel.load_category(category)
-
-                    # Restore position and size
-                    restored_panel.move(panel_data['x_position'], panel_data['y_position'])
-                    restored_panel.resize(panel_data['width'], panel_data['height'])
-
-                    # Apply custom styling
-                    restored_panel.apply_custom_styling()
-
-                    # Set as pinned
-                    restored_panel.is_pinned = True
-                    restored_panel.pin_button.setText("📍")
-                    restored_panel.minimize_button.setVisible(True)
-                    restored_panel.config_button.setVisible(True)
-
-                    # Restore minimized state if needed
-                    if panel_data.get('is_minimized'):
-                        restored_panel.toggle_minimize()
-
-                    # Restore filter configuration if available
-                    if panel_data.get('filter_config'):
-                        filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
-                            panel_data['filter_config']
-                        )
-                        if filter_config:
-                            restored_panel.apply_filter_config(filter_config)
-                            logger.debug(f"Applied saved filters to panel {panel_id}")
-
                     # Add to pinned panels list
-                    self.pinned_panels.append(restored_panel)
+                    self._add_pinned_panel(restored_panel)
 
-                    # Update last_opened in database
-                    self.controller.pinned_panels_manager.mark_panel_opened(panel_id)
+                    # Update last_opened in database (batched after the loop)
+                    opened_ids.append(panel_id)
 
-                    # Register keyboard shortcut if one is assigned
+                    # Queue keyboard shortcut if one is assigned
                     if panel_data.get('keyboard_shortcut'):
-                        self.register_panel_shortcut(restored_panel, panel_data['keyboard_shortcut'])
+                        pending_shortcuts.append((restored_panel, panel_data['keyboard_shortcut']))
 
-                    # Show panel
-                    restored_panel.show()
+                    # Show panel from the event loop so the next panel is built meanwhile
+                    QTimer.singleShot(0, restored_panel.show)
 
                     logger.info(f"Panel {panel_id} (Category: {category.name}) restored successfully")
 
                 except Exception as e:
-                    logger.error(f"Error restoring panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
+                    logger.warning("Error restoring panel %s: %s", panel_data.get('id', 'unknown'), e,
+                                   exc_info=_debug_exc_info(e))
                     continue
 
+            # Register all restored shortcuts and update last_opened in one batch
+            self.register_panel_shortcuts_bulk(pending_shortcuts)
+            panels_manager.mark_panels_opened_bulk(opened_ids)
+
             logger.info(f"Panel restoration complete: {len(self.pinned_panels)}/{len(active_panels)} panels restored")
 
         except Exception as e:
             logger.error(f"Error during panel restoration on startup: {e}", exc_info=True)
 
+    def _wire_panel(self, panel, signals):
+        """
+        Connect a panel's signals to MainWindow handlers from a fixed table
+
+        Args:
+            panel: Panel instance
+            signals: Tuple of (signal name, handler name) pairs
+        """
+        for signal_name, handler_name in signals:
+            getattr(panel, signal_name).connect(getattr(self, handler_name))
+
+    def _build_category_panel(self, panel_data: dict, category, filter_config: dict = None) -> FloatingPanel:
+        """
+        Build a pinned FloatingPanel from its saved database row
+
+        Args:
+            panel_data: Panel row from pinned_panels
+            category: Category to load into the panel
+            filter_config: Already deserialized filter configuration (None = no filters)
+
+        Returns:
+            The configured (not yet shown) FloatingPanel
+        """
+        panel_id = panel_data['id']
+
+        panel = FloatingPanel(
+            config_manager=self.config_manager,
+            list_controller=self.controller.list_controller if self.controller else None,
+            panel_id=panel_id,
+            custom_name=panel_data.get('custom_name'),
+            custom_color=panel_data.get('custom_color'),
+            main_window=self,
+            keyboard_shortcut=panel_data.get('keyboard_shortcut')
+        )
+
+        # Connect signals
+        self._wire_panel(panel, self._CATEGORY_PANEL_SIGNALS)
+
+        # Build without intermediate repaints
+        with _updates_suspended(panel):
+            # Load category
+            panel.load_category(category)
+
+            # Restore position and size
+            panel.move(panel_data['x_position'], panel_data['y_position'])
+            panel.resize(panel_data['width'], panel_data['height'])
+
+            # Apply custom styling
+            panel.apply_custom_styling()
+
+            # Set as pinned
+            panel.is_pinned = True
+            panel.pin_button.setText("📍")
+            panel.minimize_button.setVisible(True)
+            panel.config_button.setVisible(True)
+
+            # Restore minimized state if needed
+            if panel_data.get('is_minimized'):
+                panel.toggle_minimize()
+
+            # Restore filter configuration if available
+            if filter_config:
+                panel.apply_filter_config(filter_config)
+                logger.debug("Applied saved filters to panel %s", panel_id)
+
+        return panel
+
     def restore_pinned_global_search_panels(self):
         """Restaurar paneles de búsqueda global anclados desde la BD"""
         logger.info("=== [GLOBAL SEARCH RESTORE] Starting restore_pinned_global_search_panels() ===")
@@ -2562,9 +3024,14 @@ class MainWindow(QMainWindow):
             logger.warning("[GLOBAL SEARCH RESTORE] No controller available - skipping global search panels restoration")
             return
 
+        # Bind frequently used collaborators once for the whole restore loop
+        panels_manager = self.controller.pinned_panels_manager
+        list_controller = self.controller.list_controller
+        db = self.config_manager.db if self.config_manager else None
+
         try:
             logger.info("[GLOBAL SEARCH RESTORE] Calling get_global_search_panels(active_only=True)...")
-            global_panels_data = self.controller.pinned_panels_manager.get_global_search_panels(active_only=True)
+            global_panels_data = panels_manager.get_global_search_panels(active_only=True)
             logger.info(f"[GLOBAL SEARCH RESTORE] Retrieved {len(global_panels_data)} panels from database")
 
             if not global_panels_data:
@@ -2573,25 +3040,24 @@ class MainWindow(QMainWindow):
 
             logger.info(f"[GLOBAL SEARCH RESTORE] Restoring {len(global_panels_data)} global search panels...")
 
+            opened_ids = []  # last_opened se actualiza en un solo UPDATE al final
+
             for panel_data in global_panels_data:
                 try:
                     # Extraer configuración del panel
-                    config = self.controller.pinned_panels_manager.restore_global_search_panel(panel_data)
+                    config = panels_manager.restore_global_search_panel(panel_data)
 
                     # Crear nuevo panel de búsqueda global
-                    from views.global_search_panel import GlobalSearchPanel
                     restored_panel = GlobalSearchPanel(
-                        db_manager=self.config_manager.db if self.config_manager else None,
+                        db_manager=db,
                         config_manager=self.config_manager,
-                        list_controller=self.controller.list_controller if self.controller else None,
-                        parent=self  # Conectar como hijo de MainWindow para señales
+                        list_controller=list_controller,
+                        parent=self,  # Conectar como hijo de MainWindow para señales
+                        panels_manager=panels_manager
                     )
 
                     # Conectar señales
-                    restored_panel.item_clicked.connect(self.on_item_clicked)
-                    restored_panel.window_closed.connect(lambda p=restored_panel: self.on_restored_global_search_panel_closed(p))
-                    restored_panel.pin_state_changed.connect(self.on_global_search_pin_state_changed)
-                    restored_panel.url_open_requested.connect(self.on_url_open_in_browser)
+                    self._wire_panel(restored_panel, self._RESTORED_GLOBAL_SEARCH_PANEL_SIGNALS)
 
                     # Restaurar propiedades
                     restored_panel.panel_id = config['panel_id']
@@ -2606,57 +3072,72 @@ class MainWindow(QMainWindow):
                     # Restaurar título
                     restored_panel.setWindowTitle(f"🔍 {config['custom_name']}")
 
-                    # Restaurar filtros si existen
-                    if config['search_query']:
-                        restored_panel.search_bar.search_input.setText(config['search_query'])
-                        restored_panel.pending_search_query = config['search_query']
-
-                    if config['advanced_filters']:
-                        restored_panel.current_filters = config['advanced_filters']
-
-                    if config['state_filter']:
-                        restored_panel.current_state_filter = config['state_filter']
-                        # Establecer combo box de estado
-                        index = restored_panel.state_filter_combo.findData(config['state_filter'])
-                        if index >= 0:
-                            restored_panel.state_filter_combo.setCurrentIndex(index)
-
-                    # Actualizar UI
-                    restored_panel.update_pin_button_style()
-                    restored_panel.update_filter_badge()
-
-                    # IMPORTANTE: Cargar todos los items primero
-                    restored_panel.load_all_items()
-
-                    # Realizar búsqueda inicial si hay query (después de cargar items)
-                    if config['search_query']:
-                        restored_panel._perform_search()
+                    with _updates_suspended(restored_panel):
+                        if config['state_filter']:
+                            restored_panel.current_state_filter = config['state_filter']
+                            # Establecer combo box de estado
+                            index = restored_panel._state_data_to_index.get(config['state_filter'], -1)
+                            if index >= 0:
+                                restored_panel.state_filter_combo.blockSignals(True)
+                                restored_panel.state_filter_combo.setCurrentIndex(index)
+                                restored_panel.state_filter_combo.blockSignals(False)
+
+                        # Actualizar UI
+                        restored_panel.update_pin_button_style()
+                        restored_panel.update_filter_badge()
+
+                        # Cargar items aplicando query y filtros en la misma pasada
+                        # (sin señales: no debe disparar el auto-save)
+                        # (sin mostrar: _show_restored_global_search_panel lo hace
+                        # desde el event loop)
+                        restored_panel.load_all_items(
+                            initial_query=config['search_query'],
+                            initial_filters=config['advanced_filters'],
+                            show=False
+                        )
 
                     # Agregar a lista
-                    self.pinned_global_search_panels.append(restored_panel)
-
-                    # Actualizar last_opened en BD
-                    self.controller.pinned_panels_manager.mark_panel_opened(config['panel_id'])
+                    self.pinned_global_search_panels[id(restored_panel)] = restored_panel
+                    self._panels_manager_dirty = True
 
-                    # IMPORTANTE: Mostrar panel ANTES de minimizar (si no, el estado minimizado no se mantiene)
-                    restored_panel.show()
+                    # Actualizar last_opened en BD (en lote al final)
+                    opened_ids.append(config['panel_id'])
 
-                    # Restaurar estado minimizado (DESPUÉS de show() para que funcione correctamente)
-                    if config['is_minimized']:
-                        restored_panel.is_minimized = False  # Asegurar que empieza en False
-                        restored_panel.toggle_minimize()
+                    # Mostrar (y minimizar si corresponde) desde el event loop,
+                    # mientras se construye el siguiente panel
+                    QTimer.singleShot(0, partial(self._show_restored_global_search_panel,
+                                                 restored_panel, config['is_minimized']))
 
                     logger.info(f"Global search panel {config['panel_id']} ({config['custom_name']}) restored successfully")
 
                 except Exception as e:
-                    logger.error(f"Failed to restore global search panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
+                    logger.warning("Failed to restore global search panel %s: %s", panel_data.get('id', 'unknown'), e,
+                                   exc_info=_debug_exc_info(e))
                     continue
 
+            panels_manager.mark_panels_opened_bulk(opened_ids)
+
             logger.info(f"Global search panel restoration complete: {len(self.pinned_global_search_panels)} panels restored")
 
         except Exception as e:
             logger.error(f"Failed to restore pinned global search panels: {e}", exc_info=True)
 
+    def _show_restored_global_search_panel(self, panel, is_minimized: bool):
+        """
+        Show a restored global search panel and re-apply its minimized state
+
+        Args:
+            panel: GlobalSearchPanel instance
+            is_minimized: Saved minimized state
+        """
+        # IMPORTANTE: Mostrar panel ANTES de minimizar (si no, el estado minimizado no se mantiene)
+        panel.show()
+
+        # Restaurar estado minimizado (DESPUÉS de show() para que funcione correctamente)
+        if is_minimized:
+            panel.is_minimized = False  # Asegurar que empieza en False
+            panel.toggle_minimize()
+
     def restore_pinned_process_panels(self):
         """Restore pinned process panels from database on startup"""
         logger.info("=== [PROCESS PANELS RESTORE] Starting restore_pinned_process_panels() ===")
@@ -2668,6 +3149,7 @@ class MainWindow(QMainWindow):
         try:
             # Get all active process panels from database
             db = self.controller.config_manager.db
+            process_controller = self.controller.process_controller
             active_panels = db.get_pinned_process_panels(active_only=True)
 
             if not active_panels:
@@ -2676,6 +3158,15 @@ class MainWindow(QMainWindow):
 
             logger.info(f"[PROCESS PANELS RESTORE] Restoring {len(active_panels)} process panels...")
 
+            # Prefetch all needed processes in one batch (avoids one lookup per panel)
+            processes_by_id = process_controller.get_processes_bulk(
+                {p['process_id'] for p in active_panels}
+            )
+            opened_ids = []  # last_opened se actualiza en un solo UPDATE al final
+
+            # Resolve the panel class once for the whole loop
+            ProcessFloatingPanel = _lazy_class('views.process_floating_panel', 'ProcessFloatingPanel')
+
             # Restore each panel
             for panel_data in active_panels:
                 try:
@@ -2685,70 +3176,70 @@ class MainWindow(QMainWindow):
                     logger.info(f"[PROCESS PANELS RESTORE] Restoring panel {panel_id} for process {process_id}")
 
                     # Get process
-                    process = self.controller.process_controller.get_process(process_id)
+                    process = processes_by_id.get(process_id)
                     if not process:
                         logger.warning(f"Process {process_id} not found for panel {panel_id} - skipping")
                         continue
 
                     # Create new process floating panel
-                    from views.process_floating_panel import ProcessFloatingPanel
-
                     restored_panel = ProcessFloatingPanel(
-                        process_controller=self.controller.process_controller,
+                        process_controller=process_controller,
                         config_manager=self.config_manager,
                         main_window=self,
                         parent=self
                     )
 
-                    # Set panel_id for persistence
+                    # Set panel_id for persistence (and the state already in DB,
+                    # so only real changes are written back)
                     restored_panel.panel_id = panel_id
+                    restored_panel._saved_panel_state = {
+                        field: panel_data.get(field)
+                        for field in ('x_position', 'y_position', 'width', 'height', 'is_minimized')
+                    }
 
                     # Connect signals
-                    restored_panel.item_clicked.connect(self.on_item_clicked)
-                    restored_panel.window_closed.connect(self.on_process_panel_closed)
-                    restored_panel.pin_state_changed.connect(self.on_process_panel_pin_changed)
-
-                    # Load process
-                    restored_panel.load_process(process)
-
-                    # Restore position and size
-                    restored_panel.move(panel_data['x_position'], panel_data['y_position'])
-                    restored_panel.resize(panel_data['width'], panel_data['height'])
-
-                    # Set as pinned
-                    restored_panel.is_pinned = True
-                    restored_panel.pin_button.setText("📌")
-                    restored_panel.pin_button.setToolTip("Desanclar panel")
-                    restored_panel.minimize_button.setVisible(True)
-                    # Update header color for pinned state
-                    restored_panel.header_widget.setStyleSheet("""
-                        QWidget {
-                            background-color: #ff8800;
-                            border-top-left-radius: 10px;
-                            border-top-right-radius: 10px;
-                        }
-                    """)
-
-                    # Restore minimized state if needed
-                    if panel_data.get('is_minimized'):
-                        restored_panel.is_minimized = False  # Start as not minimized
-                        restored_panel.on_minimize_clicked()  # Toggle to minimized
+                    self._wire_panel(restored_panel, self._PROCESS_PANEL_SIGNALS)
+
+                    # Build without intermediate repaints
+                    with _updates_suspended(restored_panel):
+                        # Load process
+                        restored_panel.load_process(process)
+
+                        # Restore position and size
+                        restored_panel.move(panel_data['x_position'], panel_data['y_position'])
+                        restored_panel.resize(panel_data['width'], panel_data['height'])
+
+                        # Set as pinned
+                        restored_panel.is_pinned = True
+                        restored_panel.pin_button.setText("📌")
+                        restored_panel.pin_button.setToolTip("Desanclar panel")
+                        restored_panel.minimize_button.setVisible(True)
+                        # Update header color for pinned state
+                        restored_panel.header_widget.setStyleSheet(_PINNED_PROCESS_HEADER_QSS)
+
+                        # Restore minimized state if needed
+                        if panel_data.get('is_minimized'):
+                            restored_panel.is_minimized = False  # Start as not minimized
+                            restored_panel.on_minimize_clicked()  # Toggle to minimized
 
                     # Add to pinned panels list
-                    self.pinned_process_panels.append(restored_panel)
+                    self.pinned_process_panels[id(restored_panel)] = restored_panel
 
-                    # Update last_opened in database
-                    db.update_process_panel_last_opened(panel_id)
+                    # Update last_opened in database (batched after the loop)
+                    opened_ids.append(panel_id)
 
-                    # Show panel
-                    restored_panel.show()
+                    # Show panel from the event loop so the next panel is built meanwhile
+                    QTimer.singleShot(0, restored_panel.show)
 
                     logger.info(f"[PROCESS PANELS RESTORE] Panel {panel_id} for process '{process.name}' restored successfully")
 
                 except Exception as e:
-                    logger.error(f"Failed to restore process panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
+                    logger.warning("Failed to restore process panel %s: %s", panel_data.get('id', 'unknown'), e,
+                                   exc_info=_debug_exc_info(e))
                     continue
 
+            db.update_process_panels_last_opened(opened_ids)
+
             logger.info(f"[PROCESS PANELS RESTORE] Restoration complete: {len(self.pinned_process_panels)} panels restored")
 
         except Exception as e:
@@ -2762,6 +3253,17 @@ class MainWindow(QMainWindow):
             logger.error("[MAIN WINDOW] No controller available")
             return
 
+        # If the panel is already open just focus it (no DB round-trip needed)
+        existing_panel = self.pinned_panels_by_id.get(panel_id) or next(
+            (p for p in self.pinned_global_search_panels.values() if p.panel_id == panel_id), None
+        )
+        if existing_panel:
+            logger.info(f"[MAIN WINDOW] Panel {panel_id} already open, focusing")
+            existing_panel.show()
+            existing_panel.raise_()
+            existing_panel.activateWindow()
+            return
+
         # Get panel data from database
         panel_data = self.controller.pinned_panels_manager.get_panel_by_id(panel_id)
         logger.debug(f"[MAIN WINDOW] Panel data retrieved: {panel_data is not None}")
@@ -2783,22 +3285,13 @@ class MainWindow(QMainWindow):
             # ===== PANEL DE BÚSQUEDA GLOBAL =====
             logger.info(f"[MAIN WINDOW] Restoring global search panel {panel_id}")
 
-            # Check if panel is already open in pinned_global_search_panels
-            for existing_panel in self.pinned_global_search_panels:
-                if existing_panel.panel_id == panel_id:
-                    logger.info(f"[MAIN WINDOW] Global search panel {panel_id} already open, focusing")
-                    existing_panel.show()
-                    existing_panel.raise_()
-                    existing_panel.activateWindow()
-                    return
-
             # Create new global search panel
-            from views.global_search_panel import GlobalSearchPanel
             restored_panel = GlobalSearchPanel(
                 db_manager=self.config_manager.db if self.config_manager else None,
                 config_manager=self.config_manager,
                 list_controller=self.controller.list_controller if self.controller else None,
-                parent=self
+                parent=self,
+                panels_manager=self.controller.pinned_panels_manager if self.controller else None
             )
 
             # Set panel properties
@@ -2808,10 +3301,7 @@ class MainWindow(QMainWindow):
             restored_panel.is_pinned = True
 
             # Connect signals
-            restored_panel.item_clicked.connect(self.on_item_clicked)
-            restored_panel.window_closed.connect(lambda p=restored_panel: self.on_restored_global_search_panel_closed(p))
-            restored_panel.pin_state_changed.connect(self.on_global_search_pin_state_changed)
-            restored_panel.url_open_requested.connect(self.on_url_open_in_browser)
+            self._wire_panel(restored_panel, self._RESTORED_GLOBAL_SEARCH_PANEL_SIGNALS)
 
             # Restore position and size
             restored_panel.move(panel_data['x_position'], panel_data['y_position'])
@@ -2830,7 +3320,8 @@ class MainWindow(QMainWindow):
                 restored_panel.toggle_minimize()
 
             # Add to pinned global search panels list
-            self.pinned_global_search_panels.append(restored_panel)
+            self.pinned_global_search_panels[id(restored_panel)] = restored_panel
+            self._panels_manager_dirty = True
             logger.debug(f"[MAIN WINDOW] Global search panel {panel_id} added to list. Total: {len(self.pinned_global_search_panels)}")
 
             # Update last_opened in database
@@ -2862,52 +3353,13 @@ class MainWindow(QMainWindow):
                 return
 
             # Create new floating panel with saved configuration
-            restored_panel = FloatingPanel(
-                config_manager=self.config_manager,
-                list_controller=self.controller.list_controller if self.controller else None,
-                panel_id=panel_id,
-                custom_name=panel_data.get('custom_name'),
-                custom_color=panel_data.get('custom_color'),
-                main_window=self
+            filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
+                panel_data.get('filter_config')
             )
-
-            # Connect signals
-            restored_panel.item_clicked.connect(self.on_item_clicked)
-            restored_panel.window_closed.connect(self.on_floating_panel_closed)
-            restored_panel.pin_state_changed.connect(self.on_panel_pin_changed)
-            restored_panel.customization_requested.connect(self.on_panel_customization_requested)
-
-            # Load category
-            restored_panel.load_category(category)
-
-            # Restore position and size
-            restored_panel.move(panel_data['x_position'], panel_data['y_position'])
-            restored_panel.resize(panel_data['width'], panel_data['height'])
-
-            # Apply custom styling
-            restored_panel.apply_custom_styling()
-
-            # Set as pinned
-            restored_panel.is_pinned = True
-            restored_panel.pin_button.setText("📍")
-            restored_panel.minimize_button.setVisible(True)
-            restored_panel.config_button.setVisible(True)
-
-            # Restore minimized state if needed
-            if panel_data.get('is_minimized'):
-                restored_panel.toggle_minimize()
-
-            # Restore filter configuration if available
-            if panel_data.get('filter_config'):
-                filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
-                    panel_data['filter_config']
-                )
-                if filter_config:
-                    restored_panel.apply_filter_config(filter_config)
-                    logger.debug(f"Applied saved filters to panel {panel_id}")
+            restored_panel = self._build_category_panel(panel_data, category, filter_config)
 
             # Add to pinned panels list
-            self.pinned_panels.append(restored_panel)
+            self._add_pinned_panel(restored_panel)
             logger.debug(f"[MAIN WINDOW] Panel {panel_id} added to pinned_panels list. Total panels: {len(self.pinned_panels)}")
 
             # Update last_opened in database
@@ -2921,35 +3373,60 @@ class MainWindow(QMainWindow):
 
             logger.info(f"[MAIN WINDOW] Panel {panel_id} restored and shown successfully")
 
+    def _add_pinned_panel(self, panel):
+        """
+        Add a panel to pinned_panels and index it by panel_id
+
+        Args:
+            panel: FloatingPanel instance
+        """
+        self.pinned_panels[id(panel)] = panel
+        self._panels_manager_dirty = True
+        if panel.panel_id:
+            self.pinned_panels_by_id[panel.panel_id] = panel
+
+    def _remove_pinned_panel(self, panel) -> bool:
+        """
+        Remove a panel from pinned_panels and its panel_id index
+
+        Args:
+            panel: FloatingPanel instance
+
+        Returns:
+            True if the panel was in the pinned list
+        """
+        if panel.panel_id and self.pinned_panels_by_id.get(panel.panel_id) is panel:
+            del self.pinned_panels_by_id[panel.panel_id]
+        self._panels_manager_dirty = True
+        return self.pinned_panels.pop(id(panel), None) is not None
+
     def on_panel_deleted_from_window(self, panel_id: int):
         """Handle panel deletion from management window"""
         logger.info(f"Panel {panel_id} deleted from window - checking if currently open")
 
         # Check if this panel is currently open and close it
-        for panel in self.pinned_panels[:]:
-            if panel.panel_id == panel_id:
-                logger.info(f"Closing currently open panel {panel_id}")
-                self.pinned_panels.remove(panel)
-                panel.close()
-                panel.deleteLater()
-                break
+        panel = self.pinned_panels_by_id.get(panel_id)
+        if panel:
+            logger.info(f"Closing currently open panel {panel_id}")
+            self._remove_pinned_panel(panel)
+            panel.close()
+            panel.deleteLater()
 
     def on_panel_updated_from_window(self, panel_id: int, custom_name: str, custom_color: str):
         """Handle panel update from management window"""
         logger.info(f"Panel {panel_id} updated from window")
 
         # Update currently open panel if found
-        for panel in self.pinned_panels:
-            if panel.panel_id == panel_id:
-                logger.info(f"Updating currently open panel {panel_id}")
-                panel.update_customization(custom_name=custom_name, custom_color=custom_color)
-                break
+        panel = self.pinned_panels_by_id.get(panel_id)
+        if panel:
+            logger.info(f"Updating currently open panel {panel_id}")
+            panel.update_customization(custom_name=custom_name, custom_color=custom_color)
 
     def show_pinned_panels_manager(self):
         """Mostrar ventana de gestión de paneles anclados"""
         try:
             # Crear ventana si no existe
-            if not hasattr(self, 'panels_manager_window') or not self.panels_manager_window:
+            if self.panels_manager_window is None:
                 self.panels_manager_window = PinnedPanelsManagerWindow(
                     config_manager=self.config_manager,
                     pinned_panels_manager=self.controller.pinned_panels_manager,
@@ -2962,8 +3439,11 @@ class MainWindow(QMainWindow):
                 self.panels_manager_window.panel_deleted.connect(self.on_panel_deleted_from_manager)
                 self.panels_manager_window.panel_updated.connect(self.on_panel_updated_from_manager)
 
-            # Refrescar y mostrar
-            self.panels_manager_window.refresh_panel_list()
+            # Refrescar solo si cambiaron los datos o los paneles abiertos
+            if (self._panels_manager_dirty or
+                    self.panels_manager_window.loaded_revision != self.controller.pinned_panels_manager.revision):
+                self.panels_manager_window.refresh_panel_list()
+                self._panels_manager_dirty = False
             self.panels_manager_window.show()
             self.panels_manager_window.raise_()
             self.panels_manager_window.activateWindow()
@@ -2978,12 +3458,12 @@ class MainWindow(QMainWindow):
         """Handle cuando un panel es eliminado desde el manager"""
         try:
             # Remover panel de la lista si está abierto
-            for i, panel in enumerate(self.pinned_panels):
-                if panel.panel_id == panel_id:
-                    panel.close()
-                    self.pinned_panels.pop(i)
-                    logger.info(f"Closed panel {panel_id} after deletion")
-                    break
+            panel = self.pinned_panels_by_id.get(panel_id)
+            if panel:
+                self._remove_pinned_panel(panel)
+                panel.close()
+                panel.deleteLater()
+                logger.info(f"Closed panel {panel_id} after deletion")
         except Exception as e:
             logger.error(f"Error handling panel deletion: {e}")
 
@@ -2991,54 +3471,72 @@ class MainWindow(QMainWindow):
         """Handle cuando un panel es actualizado desde el manager"""
         try:
             # Actualizar panel si está abierto
-            for panel in self.pinned_panels:
-                if panel.panel_id == panel_id:
-                    # Recargar datos del panel
-                    panel_data = self.controller.pinned_panels_manager.get_panel_by_id(panel_id)
-                    if panel_data:
-                        panel.custom_name = panel_data.get('custom_name')
-                        panel.custom_color = panel_data.get('custom_color')
-                        panel.apply_custom_styling()
-                        logger.info(f"Updated panel {panel_id} styling")
-                    break
+            panel = self.pinned_panels_by_id.get(panel_id)
+            if panel:
+                # Recargar datos del panel
+                panel_data = self.controller.pinned_panels_manager.get_panel_by_id(panel_id)
+                if panel_data:
+                    panel.custom_name = panel_data.get('custom_name')
+                    panel.custom_color = panel_data.get('custom_color')
+                    panel.keyboard_shortcut = panel_data.get('keyboard_shortcut')
+                    panel.apply_custom_styling()
+                    logger.info(f"Updated panel {panel_id} styling")
         except Exception as e:
             logger.error(f"Error handling panel update: {e}")
 
+    def _schedule_panels_refresh(self):
+        """Programar un único refresco del gestor de paneles para el siguiente ciclo"""
+        if self._refresh_pending:
+            return
+        if self.panels_manager_window is not None and self.panels_manager_window.isVisible():
+            self._refresh_pending = True
+            self._panels_refresh_timer.start()
+        else:
+            # Oculto: se refresca una sola vez al mostrarlo (show_pinned_panels_manager)
+            self._panels_manager_dirty = True
+
+    def _flush_panels_refresh(self):
+        """Refrescar el gestor de paneles una sola vez por ráfaga de cambios"""
+        self._refresh_pending = False
+        if self.panels_manager_window is not None and self.panels_manager_window.isVisible():
+            self.panels_manager_window.refresh_panel_list()
+            self._panels_manager_dirty = False
+
     def on_global_search_panel_pinned(self, panel):
         """Callback cuando se ancla un panel de búsqueda global"""
-        if panel not in self.pinned_global_search_panels:
-            self.pinned_global_search_panels.append(panel)
-            logger.info(f"Added global search panel {panel.panel_id} to pinned list")
+        pinned = self.pinned_global_search_panels
+        key = id(panel)
+        if key not in pinned:
+            pinned[key] = panel
+            self._panels_manager_dirty = True
+            logger.info("Added global search panel %s to pinned list", panel.panel_id)
 
             # IMPORTANTE: Limpiar self.global_search_panel para permitir crear nuevos paneles flotantes
             # Similar al comportamiento de FloatingPanel
-            if self.global_search_panel == panel:
+            if self.global_search_panel is panel:
                 self.global_search_panel = None
                 logger.debug("Cleared self.global_search_panel reference after pinning")
 
-            # Actualizar gestor de paneles si está abierto
-            if hasattr(self, 'pinned_panels_window') and self.pinned_panels_window and self.pinned_panels_window.isVisible():
-                self.pinned_panels_window.refresh_panels_list()
+            # Actualizar gestor de paneles si está abierto (una vez por ciclo del event loop)
+            self._schedule_panels_refresh()
 
     def on_global_search_panel_unpinned(self, panel):
         """Callback cuando se desancla un panel de búsqueda global"""
-        if panel in self.pinned_global_search_panels:
-            self.pinned_global_search_panels.remove(panel)
-            logger.info(f"Removed global search panel {panel.panel_id} from pinned list")
+        if self.pinned_global_search_panels.pop(id(panel), None) is not None:
+            self._panels_manager_dirty = True
+            logger.info("Removed global search panel %s from pinned list", panel.panel_id)
 
-            # Actualizar gestor de paneles si está abierto
-            if hasattr(self, 'pinned_panels_window') and self.pinned_panels_window and self.pinned_panels_window.isVisible():
-                self.pinned_panels_window.refresh_panels_list()
+            # Actualizar gestor de paneles si está abierto (una vez por ciclo del event loop)
+            self._schedule_panels_refresh()
 
     def closeEvent(self, event):
         """Override close event to minimize to tray instead of closing"""
         # Minimize to tray instead of closing
         event.ignore()
+        was_visible = self.is_visible
         self.hide_window()
 
         # Show notification on first minimize
-        if self.tray_manager and self.is_visible:
-            self.tray_manager.show_message(
-                "Widget Sidebar",
-                "La aplicación sigue ejecutándose en la bandeja del sistema"
-            )
+        if self.tray_manager and was_visible and not self._tray_notified:
+            self.tray_manager.show_message(*_TRAY_MINIMIZED_MSG)
+            self._tray_notified = True
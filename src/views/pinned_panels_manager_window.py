@@ -49,6 +49,7 @@ class PinnedPanelsManagerWindow(QWidget):
 
         self.current_selected_panel_id = None
         self.all_panels = []  # Lista de todos los paneles
+        self.loaded_revision = None  # panels_manager.revision de la última carga
 
         self.init_ui()
         self.load_panels()
@@ -257,6 +258,7 @@ class PinnedPanelsManagerWindow(QWidget):
         """Cargar todos los paneles desde la base de datos"""
         try:
             # Obtener todos los paneles (activos e inactivos)
+            self.loaded_revision = self.panels_manager.revision
             self.all_panels = self.panels_manager.get_all_panels(active_only=False)
 
             logger.info(f"Loaded {len(self.all_panels)} panels")
@@ -726,14 +728,13 @@ class PinnedPanelsManagerWindow(QWidget):
             if not self.main_window:
                 return False
 
-            # Verificar en paneles de categoría (FloatingPanel)
-            for panel in self.main_window.pinned_panels:
-                if panel.panel_id == panel_id:
-                    return True
+            # Verificar en paneles de categoría (FloatingPanel) - índice por panel_id
+            if panel_id in self.main_window.pinned_panels_by_id:
+                return True
 
             # IMPORTANTE: También verificar en paneles de búsqueda global (GlobalSearchPanel)
             if hasattr(self.main_window, 'pinned_global_search_panels'):
-                for panel in self.main_window.pinned_global_search_panels:
+                for panel in self.main_window.pinned_global_search_panels.values():
                     if panel.panel_id == panel_id:
                         return True
 
@@ -751,7 +752,7 @@ class PinnedPanelsManagerWindow(QWidget):
                 return
 
             # Buscar en paneles de categoría (FloatingPanel)
-            for panel in self.main_window.pinned_panels:
+            for panel in self.main_window.pinned_panels.values():
                 if panel.panel_id == panel_id:
                     logger.info(f"[PANEL MANAGER] Found category panel {panel_id}, focusing...")
 
@@ -775,7 +776,7 @@ class PinnedPanelsManagerWindow(QWidget):
 
             # IMPORTANTE: También buscar en paneles de búsqueda global (GlobalSearchPanel)
             if hasattr(self.main_window, 'pinned_global_search_panels'):
-                for panel in self.main_window.pinned_global_search_panels:
+                for panel in self.main_window.pinned_global_search_panels.values():
                     if panel.panel_id == panel_id:
                         logger.info(f"[PANEL MANAGER] Found global search panel {panel_id}, focusing...")
 
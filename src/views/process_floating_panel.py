@@ -3,11 +3,14 @@ Process Floating Panel - Displays all items and lists from a process
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                               QScrollArea, QPushButton, QMessageBox, QCheckBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QEvent, QTimer
-from PyQt6.QtGui import QFont, QCursor
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QPoint, QEvent, QTimer, QUrl
+from PyQt6.QtGui import QFont, QCursor, QDesktopServices
 import sys
 import logging
-import webbrowser
+import os
+import importlib
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,6 +27,136 @@ from core.taskbar_minimizable_mixin import TaskbarMinimizableMixin
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Flag para ejecutar comandos sin abrir consola (solo existe en Windows)
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+@lru_cache(maxsize=None)
+def _lazy_attr(module_path: str, name: str):
+    """
+    Import a module attribute on first use and cache it
+
+    Component widgets and the process builder are imported lazily (heavy
+    modules, and the builder would be a circular import); caching the
+    attribute skips the import machinery on every rendered step or click.
+    """
+    return getattr(importlib.import_module(module_path), name)
+
+
+@lru_cache(maxsize=None)
+def _display_options_qss(palette):
+    """
+    Build the display-options row stylesheets for a theme palette
+
+    Args:
+        palette: ColorPalette of the current theme (cache key, so switching
+            palettes builds new sheets instead of reusing stale colors)
+
+    Returns:
+        Tuple (row QSS, "Mostrar:" label QSS, checkbox QSS)
+    """
+    # Snapshot de la paleta: un solo acceso al tema para todas las hojas
+    colors = get_theme().get_all_colors()
+    options_qss = f"""
+        QWidget {{
+            background-color: {colors['background_mid']};
+            border-bottom: 1px solid {colors['surface']};
+        }}
+    """
+    label_qss = f"""
+        QLabel {{
+            color: {colors['text_secondary']};
+            font-size: 9pt;
+            font-weight: bold;
+        }}
+    """
+    checkbox_qss = f"""
+        QCheckBox {{
+            color: {colors['text_primary']};
+            font-size: 9pt;
+            spacing: 5px;
+        }}
+        QCheckBox::indicator {{
+            width: 16px;
+            height: 16px;
+            border: 2px solid {colors['primary']};
+            border-radius: 3px;
+            background-color: {colors['background_deep']};
+        }}
+        QCheckBox::indicator:checked {{
+            background-color: {colors['primary']};
+            border-color: {colors['primary']};
+        }}
+        QCheckBox::indicator:hover {{
+            border-color: {colors['accent']};
+        }}
+    """
+    return options_qss, label_qss, checkbox_qss
+
+
+# Estilos de los widgets de cada paso, aplicados una sola vez sobre content_widget
+# (los widgets por paso solo llevan objectName, sin setStyleSheet propio)
+_STEP_WIDGETS_QSS = """
+    QLabel#stepHeader {
+        color: #00ff88;
+        font-size: 10pt;
+        font-weight: bold;
+        padding: 5px;
+        border-bottom: 1px solid #3d3d3d;
+        background-color: transparent;
+    }
+    QPushButton#embeddedUrlButton {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+        border-radius: 4px;
+        font-size: 16pt;
+    }
+    QPushButton#embeddedUrlButton:hover {
+        background-color: #005a9e;
+    }
+    QPushButton#embeddedUrlButton:pressed {
+        background-color: #004578;
+    }
+    QPushButton#externalUrlButton {
+        background-color: #0078d4;
+        color: #ffffff;
+        border: none;
+        border-radius: 4px;
+        font-size: 16pt;
+    }
+    QPushButton#externalUrlButton:hover {
+        background-color: #106ebe;
+    }
+    QPushButton#externalUrlButton:pressed {
+        background-color: #005a9e;
+    }
+    QPushButton#codeActionButton {
+        background-color: #3d3d3d;
+        color: #00ff88;
+        border: 1px solid #555555;
+        border-radius: 16px;
+        font-size: 12pt;
+    }
+    QPushButton#codeActionButton:hover {
+        background-color: #00ff88;
+        color: #000000;
+        border-color: #00ff88;
+    }
+    QPushButton#pathActionButton {
+        background-color: #3d3d3d;
+        color: #ff6b00;
+        border: 1px solid #555555;
+        border-radius: 16px;
+        font-size: 12pt;
+    }
+    QPushButton#pathActionButton:hover {
+        background-color: #ff6b00;
+        color: #000000;
+        border-color: #ff6b00;
+    }
+"""
+
 
 class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
     """Floating panel to display all items and lists from a process"""
@@ -35,6 +168,71 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
     process_executed = pyqtSignal(int)  # Process ID when executing all steps
     customization_requested = pyqtSignal()
 
+    # Pasos que se renderizan por tanda; el resto se agrega al hacer scroll
+    STEP_PAGE_SIZE = 30
+
+    # Diferencias de geometría menores a esto (px) no se guardan en BD
+    GEOMETRY_JITTER_PX = 2
+
+    # Hojas de estilo fijas (se construyen una vez al importar el módulo)
+    _HEADER_QSS_PINNED = """
+        QWidget {
+            background-color: #ff8800;
+            border-top-left-radius: 10px;
+            border-top-right-radius: 10px;
+        }
+    """
+
+    _HEADER_QSS_UNPINNED = """
+        QWidget {
+            background-color: #007acc;
+            border-top-left-radius: 10px;
+            border-top-right-radius: 10px;
+        }
+    """
+
+    _ACTION_BAR_QSS = """
+        QWidget {
+            background-color: #1e1e1e;
+            border-bottom: 1px solid #3d3d3d;
+        }
+    """
+
+    _STEPS_LABEL_QSS = """
+        QLabel {
+            color: #00ff88;
+            font-size: 9pt;
+            font-weight: bold;
+            background-color: transparent;
+        }
+    """
+
+    # Botones de acción por tipo de item:
+    # (icono, tamaño, objectName, kind para _on_action_button_clicked, tooltip)
+    _ACTION_BUTTONS = {
+        "URL": (
+            ("🌐", 35, "embeddedUrlButton", "embedded_url", "Abrir en navegador embebido"),
+            ("🔗", 35, "externalUrlButton", "external_url", "Abrir en navegador predeterminado del sistema"),
+        ),
+        "CODE": (
+            ("▶️", 32, "codeActionButton", "code", "Ejecutar comando: {content}"),
+        ),
+        "PATH": (
+            ("📁", 32, "pathActionButton", "path", "Abrir ruta: {content}"),
+        ),
+    }
+
+    _TOAST_QSS = """
+        QLabel#panelToast {
+            background-color: rgba(30, 30, 30, 230);
+            color: #00ff88;
+            border: 1px solid #00ff88;
+            border-radius: 6px;
+            padding: 8px;
+            font-size: 9pt;
+        }
+    """
+
     def __init__(self, process_controller, config_manager, parent=None, main_window=None):
         super().__init__(parent)
         self.current_process = None
@@ -55,6 +253,19 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.all_items = []
         self.all_lists = []
         self.all_steps = []  # Store all steps for filtering
+        self._item_cache = {}  # item_id -> item dict de los pasos (se llena en load_process)
+        self._item_objects = {}  # item_id -> Item construido a partir de _item_cache
+        self._pending_steps = []  # (step, step_number, item_dict) aún sin renderizar
+        self._rendered_step_widgets = {}  # id(step) -> widget ya creado (visible u oculto)
+        self._step_search_keys = {}  # id(step) -> texto en minúsculas donde se busca
+        self._last_query = ""  # Query del último filtrado (ver _build_visible_steps)
+        self._last_matches = []  # Pasos que coincidieron con _last_query, en orden
+        self._loaded_steps_signature = ()  # Ver _steps_signature (evita recargas tras editar)
+
+        # Aviso no bloqueante (ver _show_toast), creado al primer uso
+        self._toast_label = None
+        self._toast_timer = None
+        self._visible_step_count = 0  # Widgets de pasos visibles al inicio del layout
 
         # Search state
         self.search_query = ""
@@ -76,9 +287,11 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
 
         # Panel persistence attributes
         self.panel_id = None
+        self._saved_panel_state = {}  # Columnas ya guardadas en BD (ver _save_panel_state_to_db)
 
         # Flag para animación de entrada (primera vez)
         self._first_show = True
+        self._closing_with_animation = False
 
         # AUTO-UPDATE: Timer for debounced panel state updates
         self.update_timer = QTimer(self)
@@ -151,52 +364,22 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
 
         # Display options row with checkboxes
         self.display_options_widget = QWidget()
-        self.display_options_widget.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.theme.get_color('background_mid')};
-                border-bottom: 1px solid {self.theme.get_color('surface')};
-            }}
-        """)
+        options_qss, display_label_qss, checkbox_qss = _display_options_qss(self.theme.current_palette)
+        self.display_options_widget.setStyleSheet(options_qss)
         display_options_layout = QHBoxLayout(self.display_options_widget)
         display_options_layout.setContentsMargins(15, 5, 15, 5)
         display_options_layout.setSpacing(15)
 
         # Label for the section
         display_label = QLabel("Mostrar:")
-        display_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.theme.get_color('text_secondary')};
-                font-size: 9pt;
-                font-weight: bold;
-            }}
-        """)
+        display_label.setStyleSheet(display_label_qss)
         display_options_layout.addWidget(display_label)
 
         # Checkbox: Mostrar Labels (checked by default)
         self.show_labels_checkbox = QCheckBox("Labels")
         self.show_labels_checkbox.setChecked(True)  # Default: ON
         self.show_labels_checkbox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.show_labels_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {self.theme.get_color('text_primary')};
-                font-size: 9pt;
-                spacing: 5px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 2px solid {self.theme.get_color('primary')};
-                border-radius: 3px;
-                background-color: {self.theme.get_color('background_deep')};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.theme.get_color('primary')};
-                border-color: {self.theme.get_color('primary')};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.theme.get_color('accent')};
-            }}
-        """)
+        self.show_labels_checkbox.setStyleSheet(checkbox_qss)
         self.show_labels_checkbox.stateChanged.connect(self.on_display_options_changed)
         display_options_layout.addWidget(self.show_labels_checkbox)
 
@@ -204,27 +387,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.show_tags_checkbox = QCheckBox("Tags")
         self.show_tags_checkbox.setChecked(False)  # Default: OFF
         self.show_tags_checkbox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.show_tags_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {self.theme.get_color('text_primary')};
-                font-size: 9pt;
-                spacing: 5px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 2px solid {self.theme.get_color('primary')};
-                border-radius: 3px;
-                background-color: {self.theme.get_color('background_deep')};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.theme.get_color('primary')};
-                border-color: {self.theme.get_color('primary')};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.theme.get_color('accent')};
-            }}
-        """)
+        self.show_tags_checkbox.setStyleSheet(checkbox_qss)
         self.show_tags_checkbox.stateChanged.connect(self.on_display_options_changed)
         display_options_layout.addWidget(self.show_tags_checkbox)
 
@@ -232,27 +395,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.show_content_checkbox = QCheckBox("Contenido")
         self.show_content_checkbox.setChecked(False)  # Default: OFF
         self.show_content_checkbox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.show_content_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {self.theme.get_color('text_primary')};
-                font-size: 9pt;
-                spacing: 5px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 2px solid {self.theme.get_color('primary')};
-                border-radius: 3px;
-                background-color: {self.theme.get_color('background_deep')};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.theme.get_color('primary')};
-                border-color: {self.theme.get_color('primary')};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.theme.get_color('accent')};
-            }}
-        """)
+        self.show_content_checkbox.setStyleSheet(checkbox_qss)
         self.show_content_checkbox.stateChanged.connect(self.on_display_options_changed)
         display_options_layout.addWidget(self.show_content_checkbox)
 
@@ -260,27 +403,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.show_description_checkbox = QCheckBox("Descripción")
         self.show_description_checkbox.setChecked(False)  # Default: OFF
         self.show_description_checkbox.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.show_description_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {self.theme.get_color('text_primary')};
-                font-size: 9pt;
-                spacing: 5px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 2px solid {self.theme.get_color('primary')};
-                border-radius: 3px;
-                background-color: {self.theme.get_color('background_deep')};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.theme.get_color('primary')};
-                border-color: {self.theme.get_color('primary')};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.theme.get_color('accent')};
-            }}
-        """)
+        self.show_description_checkbox.setStyleSheet(checkbox_qss)
         self.show_description_checkbox.stateChanged.connect(self.on_display_options_changed)
         display_options_layout.addWidget(self.show_description_checkbox)
 
@@ -291,7 +414,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
 
         # Content area (scrollable) with new optimized spacing
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet(PanelStyles.get_body_style())
+        self.content_widget.setStyleSheet(PanelStyles.get_body_style() + _STEP_WIDGETS_QSS)
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(
             PanelStyles.BODY_PADDING,
@@ -303,16 +426,22 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.content_layout.addStretch()
 
         # Scroll area with new optimized scrollbars
-        scroll_area = QScrollArea()
-        scroll_area.setWidget(self.content_widget)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(f"""
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidget(self.content_widget)
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scroll_area.setStyleSheet(f"""
             {PanelStyles.get_scroll_area_style()}
             {PanelStyles.get_scrollbar_style()}
         """)
-        main_layout.addWidget(scroll_area)
+        # Al agrandar el panel solo se repinta el área nueva del viewport
+        self.scroll_area.viewport().setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+        # Renderizar más pasos al acercarse al final de la lista (o mientras
+        # la lista no llegue a tener scroll, p. ej. panel alto o pasos bajos)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_steps_scrolled)
+        self.scroll_area.verticalScrollBar().rangeChanged.connect(self._on_steps_range_changed)
+        main_layout.addWidget(self.scroll_area)
 
     def create_header(self):
         """Create header with title and control buttons - New optimized design"""
@@ -396,12 +525,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         """Create action bar below header"""
         action_bar = QWidget()
         action_bar.setFixedHeight(50)
-        action_bar.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                border-bottom: 1px solid #3d3d3d;
-            }
-        """)
+        action_bar.setStyleSheet(self._ACTION_BAR_QSS)
 
         layout = QHBoxLayout(action_bar)
         layout.setContentsMargins(10, 5, 10, 5)
@@ -409,14 +533,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
 
         # Steps counter label
         self.steps_label = QLabel("0 pasos")
-        self.steps_label.setStyleSheet("""
-            QLabel {
-                color: #00ff88;
-                font-size: 9pt;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
+        self.steps_label.setStyleSheet(self._STEPS_LABEL_QSS)
         layout.addWidget(self.steps_label)
 
         # Search bar
@@ -429,37 +546,44 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
 
         return action_bar
 
-    def load_process(self, process: Process):
-        """Load process and all its items/lists"""
+    def load_process(self, process: Process, steps=None):
+        """Load process and all its items/lists
+
+        Args:
+            process: Process to display
+            steps: Already fetched steps of the process (queried if None)
+        """
         try:
             logger.info(f"Loading process: {process.name} (ID: {process.id})")
 
-            # Actualizar atributos de entidad para taskbar
-            self.entity_name = f"⚙️ {process.name}"
-            self.entity_icon = "⚙️"
-            self.current_process = process
-
-            # Update header
-            self.process_name_label.setText(process.name)
+            self._set_current_process(process)
 
             # Get all steps
-            steps = self.process_controller.get_process_steps(process.id)
+            if steps is None:
+                steps = self.process_controller.get_process_steps(process.id)
             logger.info(f"Found {len(steps)} steps")
 
             # Store all steps for filtering
             self.all_steps = steps
+            self._loaded_steps_signature = self._steps_signature(steps)
 
-            # Update steps counter
-            self.steps_label.setText(f"{len(steps)} paso{'s' if len(steps) != 1 else ''}")
+            # Cargar los items de todos los pasos en una sola consulta
+            # (los IDs inexistentes quedan en None para no volver a consultarlos)
+            item_ids = [step.item_id for step in steps if step.item_id]
+            self._item_cache = dict.fromkeys(item_ids)
+            self._item_objects = {}
+            self._item_cache.update(self.config_manager.db.get_items_by_ids(item_ids))
 
-            # Clear existing content
-            self.clear_content()
+            # Texto de búsqueda de cada paso, en minúsculas (una vez por carga)
+            self._step_search_keys = {id(step): self._build_step_search_key(step) for step in steps}
+            self._last_query = ""
+            self._last_matches = []
 
-            # Extract and display items/lists from steps
-            self.all_items = []
-            self.all_lists = []
+            # Update steps counter
+            self.steps_label.setText(f"{len(steps)} paso{'s' if len(steps) != 1 else ''}")
 
-            # Display steps (apply current search if any)
+            # Display steps (apply current search if any); clears the
+            # previous content and builds the new one with updates disabled
             self.apply_search_filter()
 
             # Show panel
@@ -473,15 +597,63 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                 f"Error al cargar proceso:\n{str(e)}"
             )
 
-    def display_step(self, step, step_number=None):
+    def _get_step_item(self, item_id):
+        """
+        Get the item dict of a step, querying the database only once per item
+
+        Args:
+            item_id: Item ID of the step (may be None)
+
+        Returns:
+            Item dictionary or None
+        """
+        if not item_id:
+            return None
+        if item_id not in self._item_cache:
+            self._item_cache[item_id] = self.config_manager.db.get_item(item_id)
+        return self._item_cache[item_id]
+
+    def _set_current_process(self, process: Process):
+        """Update the current process and everything derived from its name"""
+        # Actualizar atributos de entidad para taskbar
+        self.entity_name = f"⚙️ {process.name}"
+        self.entity_icon = "⚙️"
+        self.current_process = process
+
+        # Update header
+        self.process_name_label.setText(process.name)
+
+    @staticmethod
+    def _steps_signature(steps) -> tuple:
+        """
+        Summarize what the panel renders from a list of steps
+
+        Args:
+            steps: List of ProcessStep objects
+
+        Returns:
+            Tuple that changes whenever the rendered steps would change
+        """
+        return tuple(
+            (step.item_id, step.item_type, step.item_content, step.custom_label, step.group_name)
+            for step in steps
+        )
+
+    def display_step(self, step, step_number=None, item_dict=None, index=None):
         """Display a single step with its item or list
 
         Args:
             step: ProcessStep object
             step_number: Display number for the step (1-based). If None, uses step.step_order + 1
+            item_dict: Preloaded item dict of the step (looked up in the cache if None)
+            index: Position in the content layout (default: after the last step)
+
+        Returns:
+            The created step widget
         """
         # Create step container
         step_widget = QWidget()
+        step_widget.step_header = None  # QLabel "Paso N" (los componentes no tienen)
         step_layout = QVBoxLayout(step_widget)
         step_layout.setContentsMargins(0, 0, 0, 10)
         step_layout.setSpacing(5)
@@ -497,7 +669,8 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
 
         # Display item for this step
         if step.item_id:
-            item_dict = self.config_manager.db.get_item(step.item_id)
+            if item_dict is None:
+                item_dict = self._get_step_item(step.item_id)
             if item_dict:
                 # Check if item is a component
                 is_component = item_dict.get('is_component', False)
@@ -509,10 +682,8 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                     label = item_dict.get('label', '')
                     content = item_dict.get('content', '')
 
-                    # Import component widgets
-                    from views.widgets.component_widgets import create_component_widget
-
                     # Create component widget
+                    create_component_widget = _lazy_attr('views.widgets.component_widgets', 'create_component_widget')
                     component_widget = create_component_widget(
                         component_type=component_type,
                         config=component_config,
@@ -524,17 +695,9 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                 else:
                     # Step header for regular items
                     step_header = QLabel(f"Paso {step_number}")
-                    step_header.setStyleSheet("""
-                        QLabel {
-                            color: #00ff88;
-                            font-size: 10pt;
-                            font-weight: bold;
-                            padding: 5px;
-                            border-bottom: 1px solid #3d3d3d;
-                            background-color: transparent;
-                        }
-                    """)
+                    step_header.setObjectName("stepHeader")
                     step_layout.addWidget(step_header)
+                    step_widget.step_header = step_header
 
                     # Create horizontal layout for item and action buttons
                     item_row_widget = QWidget()
@@ -542,8 +705,10 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                     item_row_layout.setContentsMargins(0, 0, 0, 0)
                     item_row_layout.setSpacing(8)
 
-                    # Convert dict to Item object and display as regular item
-                    item = Item.from_dict(item_dict)
+                    # Convert dict to Item object (once per item) and display as regular item
+                    item = self._item_objects.get(step.item_id)
+                    if item is None:
+                        item = self._item_objects[step.item_id] = Item.from_dict(item_dict)
                     self.all_items.append(item)
 
                     # Get display options from checkboxes
@@ -561,112 +726,31 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                         show_description=show_description,
                         parent=self
                     )
-                    item_widget.item_clicked.connect(lambda i=item: self.on_item_clicked(i))
+                    item_widget.item_clicked.connect(self.on_item_clicked)
                     item_widget.item_edit_requested.connect(self.on_item_edit_requested)
                     item_row_layout.addWidget(item_widget, stretch=1)
 
-                    # Add action buttons based on item type
-                    item_type = step.item_type  # Get item type from ProcessStep
-
-                    if item_type == "URL":
-                        # Open in embedded browser button
-                        embedded_url_button = QPushButton("🌐")
-                        embedded_url_button.setFixedSize(35, 35)
-                        embedded_url_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-                        embedded_url_button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #007acc;
-                                color: #ffffff;
-                                border: none;
-                                border-radius: 4px;
-                                font-size: 16pt;
-                            }
-                            QPushButton:hover {
-                                background-color: #005a9e;
-                            }
-                            QPushButton:pressed {
-                                background-color: #004578;
-                            }
-                        """)
-                        embedded_url_button.setToolTip("Abrir en navegador embebido")
-                        embedded_url_button.clicked.connect(lambda checked, content=step.item_content: self.on_embedded_url_button_clicked(content))
-                        item_row_layout.addWidget(embedded_url_button)
-
-                        # Open in system browser button
-                        external_url_button = QPushButton("🔗")
-                        external_url_button.setFixedSize(35, 35)
-                        external_url_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-                        external_url_button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #0078d4;
-                                color: #ffffff;
-                                border: none;
-                                border-radius: 4px;
-                                font-size: 16pt;
-                            }
-                            QPushButton:hover {
-                                background-color: #106ebe;
-                            }
-                            QPushButton:pressed {
-                                background-color: #005a9e;
-                            }
-                        """)
-                        external_url_button.setToolTip("Abrir en navegador predeterminado del sistema")
-                        external_url_button.clicked.connect(lambda checked, content=step.item_content: self.on_external_url_button_clicked(content))
-                        item_row_layout.addWidget(external_url_button)
-
-                    elif item_type == "CODE":
-                        # CODE button - execute command
-                        code_button = QPushButton("▶️")
-                        code_button.setFixedSize(32, 32)
-                        code_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-                        code_button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #3d3d3d;
-                                color: #00ff88;
-                                border: 1px solid #555555;
-                                border-radius: 16px;
-                                font-size: 12pt;
-                            }
-                            QPushButton:hover {
-                                background-color: #00ff88;
-                                color: #000000;
-                                border-color: #00ff88;
-                            }
-                        """)
-                        code_button.setToolTip(f"Ejecutar comando: {step.item_content}")
-                        code_button.clicked.connect(lambda checked, content=step.item_content: self.on_code_button_clicked(content))
-                        item_row_layout.addWidget(code_button)
-
-                    elif item_type == "PATH":
-                        # PATH button - open file/folder
-                        path_button = QPushButton("📁")
-                        path_button.setFixedSize(32, 32)
-                        path_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-                        path_button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #3d3d3d;
-                                color: #ff6b00;
-                                border: 1px solid #555555;
-                                border-radius: 16px;
-                                font-size: 12pt;
-                            }
-                            QPushButton:hover {
-                                background-color: #ff6b00;
-                                color: #000000;
-                                border-color: #ff6b00;
-                            }
-                        """)
-                        path_button.setToolTip(f"Abrir ruta: {step.item_content}")
-                        path_button.clicked.connect(lambda checked, content=step.item_content: self.on_path_button_clicked(content))
-                        item_row_layout.addWidget(path_button)
+                    # Add action buttons based on item type (ver _ACTION_BUTTONS)
+                    for icon, size, object_name, kind, tooltip in self._ACTION_BUTTONS.get(step.item_type, ()):
+                        action_button = QPushButton(icon)
+                        action_button.setFixedSize(size, size)
+                        action_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+                        action_button.setObjectName(object_name)  # Estilo en _STEP_WIDGETS_QSS
+                        action_button.setToolTip(tooltip.format(content=step.item_content))
+                        action_button.setProperty("kind", kind)
+                        action_button.setProperty("content", step.item_content)
+                        action_button.clicked.connect(self._on_action_button_clicked)
+                        item_row_layout.addWidget(action_button)
 
                     step_layout.addWidget(item_row_widget)
             else:
                 logger.warning(f"Item {step.item_id} not found for step {step.id}")
 
         # Add to main content
-        self.content_layout.insertWidget(self.content_layout.count() - 1, step_widget)
+        if index is None:
+            index = self.content_layout.count() - 1
+        self.content_layout.insertWidget(index, step_widget)
+        return step_widget
 
     def clear_content(self):
         """Clear all content widgets"""
@@ -675,14 +759,18 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
             if item.widget():
                 item.widget().deleteLater()
 
+        self._rendered_step_widgets = {}
+        self._visible_step_count = 0
         self.all_items = []
         self.all_lists = []
 
+    @pyqtSlot(object)
     def on_item_clicked(self, item: Item):
         """Handle item click"""
         logger.info(f"Item clicked: {item.label}")
         self.item_clicked.emit(item)
 
+    @pyqtSlot(object)
     def on_item_edit_requested(self, item):
         """Handle item edit request from ItemButton"""
         logger.info(f"Edit requested for item: {item.label}")
@@ -707,7 +795,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
             )
 
             # Connect signals to refresh panel after edit
-            dialog.item_updated.connect(lambda item_id, cat_id: self.reload_process())
+            dialog.item_updated.connect(self._on_linked_item_updated)
 
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 logger.info(f"Item '{item.label}' edited successfully from ProcessFloatingPanel")
@@ -718,6 +806,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Error al abrir editor de item:\n\n{str(e)}")
 
+    @pyqtSlot(bool)
     def on_copy_all_clicked(self, checked: bool):
         """Copy all items from the process to clipboard"""
         if not self.current_process:
@@ -731,12 +820,8 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
 
             if success:
                 logger.info("Process executed successfully")
-                # Show visual feedback
-                QMessageBox.information(
-                    self,
-                    "Éxito",
-                    f"✓ Proceso '{self.current_process.name}' ejecutado\nTodo copiado al portapapeles"
-                )
+                # Show visual feedback (sin bloquear el event loop)
+                self._show_toast(f"✓ Proceso '{self.current_process.name}' ejecutado - todo copiado al portapapeles")
                 # Emit signal
                 self.process_executed.emit(self.current_process.id)
             else:
@@ -758,6 +843,34 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
             # Uncheck button
             self.copy_all_button.setChecked(False)
 
+    def _show_toast(self, text: str, duration_ms: int = 1500):
+        """
+        Show a non-blocking message over the bottom of the panel
+
+        Args:
+            text: Message to display
+            duration_ms: Time before the message hides itself
+        """
+        if self._toast_label is None:
+            self._toast_label = QLabel(self)
+            self._toast_label.setObjectName("panelToast")
+            self._toast_label.setStyleSheet(self._TOAST_QSS)
+            self._toast_label.setWordWrap(True)
+            self._toast_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._toast_timer = QTimer(self)
+            self._toast_timer.setSingleShot(True)
+            self._toast_timer.timeout.connect(self._toast_label.hide)
+
+        label = self._toast_label
+        label.setText(text)
+        label.setFixedWidth(max(self.width() - 40, 100))
+        label.adjustSize()
+        label.move((self.width() - label.width()) // 2, self.height() - label.height() - 20)
+        label.raise_()
+        label.show()
+        self._toast_timer.start(duration_ms)
+
+    @pyqtSlot()
     def on_pin_clicked(self):
         """Toggle pin state"""
         self.is_pinned = not self.is_pinned
@@ -771,26 +884,14 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
             self.pin_button.setText("📍")
             self.pin_button.setToolTip("Desanclar panel")
             # Update header color
-            self.header_widget.setStyleSheet("""
-                QWidget {
-                    background-color: #ff8800;
-                    border-top-left-radius: 10px;
-                    border-top-right-radius: 10px;
-                }
-            """)
+            self.header_widget.setStyleSheet(self._HEADER_QSS_PINNED)
             # Show minimize button
             self.minimize_button.setVisible(True)
         else:
             self.pin_button.setText("📌")
             self.pin_button.setToolTip("Anclar panel")
             # Restore header color
-            self.header_widget.setStyleSheet("""
-                QWidget {
-                    background-color: #007acc;
-                    border-top-left-radius: 10px;
-                    border-top-right-radius: 10px;
-                }
-            """)
+            self.header_widget.setStyleSheet(self._HEADER_QSS_UNPINNED)
             # Hide minimize button
             self.minimize_button.setVisible(False)
             # Restore if minimized
@@ -808,6 +909,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         else:
             self.delete_from_database()
 
+    @pyqtSlot()
     def on_minimize_clicked(self):
         """
         Minimizar panel a la barra de tareas avanzada (solo para paneles anclados)
@@ -826,6 +928,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         if self.panel_id:
             self.schedule_panel_update()
 
+    @pyqtSlot()
     def on_edit_process_clicked(self):
         """Open ProcessBuilderWindow to edit current process"""
         if not self.current_process:
@@ -834,8 +937,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         try:
             logger.info(f"Editing process: {self.current_process.name}")
 
-            # Import ProcessBuilderWindow
-            from views.process_builder_window import ProcessBuilderWindow
+            ProcessBuilderWindow = _lazy_attr('views.process_builder_window', 'ProcessBuilderWindow')
 
             # Create and show edit window (pass process_id, not process object)
             edit_window = ProcessBuilderWindow(
@@ -859,18 +961,33 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                 f"Error al abrir editor de proceso:\n{str(e)}"
             )
 
+    @pyqtSlot(int)
     def on_process_edited(self, process_id: int):
         """Handle process edited - reload panel"""
         try:
-            logger.info(f"Process {process_id} was edited, reloading panel")
+            logger.info(f"Process {process_id} was edited")
 
             # Get updated process
             process = self.process_controller.get_process(process_id)
-            if process:
-                # Reload panel with updated process
-                self.load_process(process)
-            else:
+            if not process:
                 logger.warning(f"Process {process_id} not found after edit")
+                return
+
+            # El editor guarda recreando todos los pasos (IDs nuevos), así que se
+            # compara lo que el panel muestra: si no cambió, basta con el nombre
+            steps = self.process_controller.get_process_steps(process_id)
+            if (self.current_process and self.current_process.id == process_id and
+                    self._steps_signature(steps) == self._loaded_steps_signature):
+                logger.info(f"Steps of process {process_id} unchanged, updating header only")
+                self._set_current_process(process)
+                return
+
+            # Los items de los pasos pudieron cambiar
+            self._item_cache = {}
+            self._item_objects = {}
+
+            # Reload panel with updated process
+            self.load_process(process, steps)
 
         except Exception as e:
             logger.error(f"Error reloading process after edit: {e}", exc_info=True)
@@ -879,8 +996,11 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         """Handler al mostrar ventana - aplicar animación de entrada"""
         super().showEvent(event)
 
-        if self._first_show:
+        # Primera apertura, o reapertura tras un cierre (el panel se reutiliza
+        # y quedó con opacidad 0 por la animación de fade-out)
+        if self._first_show or self._closing_with_animation:
             self._first_show = False
+            self._closing_with_animation = False
             # Aplicar animación de fade-in con las nuevas animaciones de PanelStyles
             animation = PanelStyles.create_fade_in_animation(self, duration=200)
             animation.start()
@@ -892,6 +1012,10 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         # Si ya estamos cerrando con animación, aceptar y salir
         if hasattr(self, '_closing_with_animation') and self._closing_with_animation:
             logger.info("Process panel closing (animation complete)")
+            # No perder un guardado pendiente del debounce
+            if self.update_timer.isActive():
+                self.update_timer.stop()
+                self._save_panel_state_to_db()
             self.window_closed.emit()
             event.accept()
             return
@@ -918,12 +1042,18 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         self._close_animation = animation
 
     # Search functionality
+    @pyqtSlot(str)
     def on_search_changed(self, query: str):
         """Handle search query change"""
-        self.search_query = query.lower().strip()
-        logger.info(f"Search query changed: '{self.search_query}'")
-        self.apply_search_filter()
+        query = query.lower().strip()
+        # SearchBar ya aplica debounce; evitar reconstruir si la query normalizada no cambió
+        if query == self.search_query:
+            return
+        self.search_query = query
+        logger.info("Search query changed: '%s'", query)
+        self.apply_search_filter(rebuild=False)
 
+    @pyqtSlot()
     def on_display_options_changed(self):
         """Handle changes in display options checkboxes - refresh item widgets"""
         logger.info("Display options changed - refreshing items")
@@ -939,75 +1069,179 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         # Re-render all items with new display options
         self.apply_search_filter()
 
-    def apply_search_filter(self):
-        """Apply search filter to steps"""
-        # Clear current content
-        while self.content_layout.count() > 1:  # Keep the stretch
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def apply_search_filter(self, rebuild=True):
+        """Apply search filter to steps
 
-        self.all_items = []
-        self.all_lists = []
+        Args:
+            rebuild: Recreate every step widget. With False (search changes) the
+                widgets already created are reused: matching steps are shown and
+                renumbered, the rest are hidden, and only new steps are built.
+        """
+        # Sin repintar mientras se actualiza el contenido:
+        # un solo relayout/paint al final en lugar de uno por paso
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            if rebuild:
+                self.clear_content()
+            else:
+                for widget in self._rendered_step_widgets.values():
+                    widget.hide()
+                self._visible_step_count = 0
+            self._build_visible_steps()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+
+    def _build_visible_steps(self):
+        """Resolve the steps matching the search and render the first page"""
+        # Render plan: (step, step_number, item_dict) for the matching steps
+        # (all if no search query), numbered consecutively except components
+        query = self.search_query
+        # Si la query extiende la anterior ("tes" -> "test"), sus coincidencias
+        # son un subconjunto de las previas: filtrar solo entre esas
+        if query and self._last_query and query.startswith(self._last_query):
+            candidates = self._last_matches
+        else:
+            candidates = self.all_steps
+        matches = self.step_matches_search
+        matched_steps = [step for step in candidates if matches(step)]
+        self._last_query = query
+        self._last_matches = matched_steps
 
-        # If no search query, show all steps with consecutive numbering
-        if not self.search_query:
-            step_counter = 1
-            for step in self.all_steps:
-                # Only increment counter for non-component steps
-                item_dict = self.config_manager.db.get_item(step.item_id) if step.item_id else None
-                is_component = item_dict.get('is_component', False) if item_dict else False
+        render_plan = []
+        step_counter = 1
+        get_item = self._get_step_item
+        for step in matched_steps:
+            item_dict = get_item(step.item_id)
+            if item_dict and item_dict.get('is_component', False):
+                render_plan.append((step, None, item_dict))
+            else:
+                render_plan.append((step, step_counter, item_dict))
+                step_counter += 1
 
-                if is_component:
-                    # Components don't get numbered
-                    self.display_step(step, step_number=None)
-                else:
-                    # Regular items get consecutive numbering
-                    self.display_step(step, step_number=step_counter)
-                    step_counter += 1
-            return
+        # Only the first page gets widgets now; the rest is rendered on scroll
+        self._pending_steps = render_plan
+        self._render_next_steps()
+        if self._pending_steps:
+            # Tras el relayout: seguir si la primera tanda no llena el viewport
+            QTimer.singleShot(0, self._fill_steps_viewport)
 
-        # Filter steps based on search query with consecutive numbering
-        step_counter = 1
-        for step in self.all_steps:
-            if self.step_matches_search(step):
-                # Check if it's a component
-                item_dict = self.config_manager.db.get_item(step.item_id) if step.item_id else None
-                is_component = item_dict.get('is_component', False) if item_dict else False
+    def _render_next_steps(self):
+        """Create widgets for the next page of pending steps"""
+        page = self._pending_steps[:self.STEP_PAGE_SIZE]
+        del self._pending_steps[:self.STEP_PAGE_SIZE]
 
-                if is_component:
-                    # Components don't get numbered
-                    self.display_step(step, step_number=None)
-                else:
-                    # Regular items get consecutive numbering
-                    self.display_step(step, step_number=step_counter)
-                    step_counter += 1
+        for step, step_number, item_dict in page:
+            self._place_step(step, step_number, item_dict)
+
+    def _place_step(self, step, step_number, item_dict):
+        """
+        Show a step after the visible ones, reusing its widget if it exists
+
+        Args:
+            step: ProcessStep object
+            step_number: Display number (None for components)
+            item_dict: Item dict of the step
+        """
+        index = self._visible_step_count
+        widget = self._rendered_step_widgets.get(id(step))
+        if widget is None:
+            widget = self.display_step(step, step_number=step_number, item_dict=item_dict, index=index)
+            self._rendered_step_widgets[id(step)] = widget
+        else:
+            if widget.step_header is not None:
+                widget.step_header.setText(f"Paso {step_number}")
+            if self.content_layout.indexOf(widget) != index:
+                self.content_layout.removeWidget(widget)
+                self.content_layout.insertWidget(index, widget)
+            widget.show()
+        self._visible_step_count += 1
+
+    @pyqtSlot(int)
+    def _on_steps_scrolled(self, value: int):
+        """Render more steps when the list is scrolled near the bottom"""
+        self._fill_steps_viewport()
+
+    @pyqtSlot(int, int)
+    def _on_steps_range_changed(self, minimum: int, maximum: int):
+        """Render more steps when the scroll range changes (relayout or panel resize)"""
+        self._fill_steps_viewport()
+
+    @pyqtSlot()
+    def _fill_steps_viewport(self):
+        """Render the next page of steps if the end of the list is in view
+
+        Also covers lists that do not overflow the viewport (no scroll range, so
+        valueChanged never fires): rendering continues on the next event loop
+        pass, after the relayout, until the list scrolls or nothing is pending.
+        """
+        if not self._pending_steps:
+            return
+        scrollbar = self.scroll_area.verticalScrollBar()
+        if scrollbar.value() < scrollbar.maximum() - 200:
+            return
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            self._render_next_steps()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+        if self._pending_steps:
+            QTimer.singleShot(0, self._fill_steps_viewport)
 
     def step_matches_search(self, step) -> bool:
         """Check if step matches search query"""
         if not self.search_query:
             return True
 
-        # Search in step group name
-        if step.group_name and self.search_query in step.group_name.lower():
-            return True
+        key = self._step_search_keys.get(id(step))
+        if key is None:
+            key = self._step_search_keys[id(step)] = self._build_step_search_key(step)
+        return self.search_query in key
 
-        # Search in custom label
-        if step.custom_label and self.search_query in step.custom_label.lower():
-            return True
+    @pyqtSlot(str, str)
+    def _on_linked_item_updated(self, item_id: str, category_id: str):
+        """
+        Refresh the steps linked to an item edited from this panel
 
-        # Search in item if this step has an item
-        if step.item_id:
-            item_dict = self.config_manager.db.get_item(step.item_id)
-            if item_dict:
-                # Search in item label (dict access)
-                if item_dict.get('label') and self.search_query in item_dict.get('label', '').lower():
-                    return True
-                # Search in item content (dict access)
-                if item_dict.get('content') and self.search_query in item_dict.get('content', '').lower():
-                    return True
+        Args:
+            item_id: ID of the edited item (as emitted by ItemEditorDialog)
+            category_id: Category ID of the item (unused)
+        """
+        try:
+            item_id = int(item_id)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid item ID in item update: {item_id!r}")
+            return
+
+        # Descartar el item cacheado y recalcular el texto de búsqueda de sus pasos
+        self._item_cache.pop(item_id, None)
+        self._item_objects.pop(item_id, None)
+        for step in self.all_steps:
+            if step.item_id == item_id:
+                self._step_search_keys[id(step)] = self._build_step_search_key(step)
+
+        # Las coincidencias previas ya no sirven como base del filtrado incremental
+        self._last_query = ""
+        self._last_matches = []
+        self.apply_search_filter()
+
+    def _build_step_search_key(self, step) -> str:
+        """
+        Build the lowercase text a step is searched in
+
+        Args:
+            step: ProcessStep object
 
-        return False
+        Returns:
+            Group name, custom label, item label and item content, lowercased and
+            separated by newlines (the query never contains one, so matches cannot
+            span two fields)
+        """
+        parts = [step.group_name or '', step.custom_label or '']
+        item_dict = self._get_step_item(step.item_id)
+        if item_dict:
+            parts.append(item_dict.get('label') or '')
+            parts.append(item_dict.get('content') or '')
+        return '\n'.join(parts).lower()
 
     # Panel persistence methods
     def _save_panel_state_to_db(self):
@@ -1015,33 +1249,111 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         if not self.is_pinned or not self.current_process:
             return
 
+        state = {
+            'x_position': self.x(),
+            'y_position': self.y(),
+            'width': self.width(),
+            'height': self.height(),
+            'is_minimized': self.is_minimized,
+        }
+
         try:
             if self.panel_id:
-                # Update existing panel
-                self.config_manager.db.update_pinned_process_panel(
-                    self.panel_id,
-                    x_position=self.x(),
-                    y_position=self.y(),
-                    width=self.width(),
-                    height=self.height(),
-                    is_minimized=self.is_minimized
-                )
-                logger.debug(f"Process panel state updated in DB: {self.panel_id}")
+                # Update existing panel: un solo UPDATE con las columnas que
+                # cambiaron desde el último guardado (arrastres, resize y
+                # minimizar dentro de la ventana de debounce se agrupan aquí)
+                changes = {k: v for k, v in state.items() if self._state_field_changed(k, v)}
+                if not changes:
+                    # Sin cambios reales (p. ej. soltar tras un arrastre nulo): sin SQL
+                    return
+                self.config_manager.db.update_pinned_process_panel(self.panel_id, **changes)
+                self._saved_panel_state.update(changes)
+                logger.debug(f"Process panel state updated in DB: {self.panel_id} ({', '.join(changes)})")
             else:
                 # Create new panel entry
                 self.panel_id = self.config_manager.db.save_pinned_process_panel(
                     process_id=self.current_process.id,
-                    x_pos=self.x(),
-                    y_pos=self.y(),
-                    width=self.width(),
-                    height=self.height(),
-                    is_minimized=self.is_minimized
+                    x_pos=state['x_position'],
+                    y_pos=state['y_position'],
+                    width=state['width'],
+                    height=state['height'],
+                    is_minimized=state['is_minimized']
                 )
                 logger.info(f"Process panel saved to DB with ID: {self.panel_id}")
+                self._saved_panel_state = state
 
         except Exception as e:
             logger.error(f"Error saving process panel state: {e}", exc_info=True)
 
+    def _take_pending_state_row(self):
+        """
+        Cancel the debounced save and return its row for a batch update
+
+        Returns:
+            (x_position, y_position, width, height, is_minimized, panel_id) if a
+            save of an existing panel was pending with real changes, else None
+        """
+        if not self.update_timer.isActive():
+            return None
+        self.update_timer.stop()
+
+        if not self.is_pinned or not self.current_process:
+            return None
+        if not self.panel_id:
+            # Panel nuevo: requiere INSERT, se guarda por separado
+            self._save_panel_state_to_db()
+            return None
+
+        state = {
+            'x_position': self.x(),
+            'y_position': self.y(),
+            'width': self.width(),
+            'height': self.height(),
+            'is_minimized': self.is_minimized,
+        }
+        if not any(self._state_field_changed(k, v) for k, v in state.items()):
+            return None
+        self._saved_panel_state = state
+        return (state['x_position'], state['y_position'], state['width'],
+                state['height'], state['is_minimized'], self.panel_id)
+
+    @classmethod
+    def flush_pending_states(cls, db, panels):
+        """
+        Write the pending debounced saves of several panels in one transaction
+
+        Args:
+            db: DBManager instance
+            panels: Iterable of ProcessFloatingPanel
+        """
+        rows = [row for row in (panel._take_pending_state_row() for panel in panels) if row]
+        if not rows:
+            return
+        try:
+            db.update_pinned_process_panels_state(rows)
+            logger.info(f"Flushed pending state of {len(rows)} process panels")
+        except Exception as e:
+            logger.error(f"Error flushing process panels state: {e}", exc_info=True)
+
+    def _state_field_changed(self, field: str, value) -> bool:
+        """
+        Check if a panel state column differs from the value saved in DB
+
+        Args:
+            field: Column name (x_position, y_position, width, height, is_minimized)
+            value: Current value
+
+        Returns:
+            True if it must be written. Geometry deltas below GEOMETRY_JITTER_PX
+            (window manager jitter) do not count as changes.
+        """
+        saved = self._saved_panel_state.get(field)
+        if saved is None:
+            return True
+        if field == 'is_minimized':
+            return bool(saved) != bool(value)
+        return abs(saved - value) >= self.GEOMETRY_JITTER_PX
+
     def schedule_panel_update(self):
         """Schedule a debounced panel state update"""
         if not self.is_pinned:
@@ -1055,11 +1367,22 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                 self.config_manager.db.delete_pinned_process_panel(self.panel_id)
                 logger.info(f"Process panel {self.panel_id} deleted from database")
                 self.panel_id = None
+                self._saved_panel_state = {}
             except Exception as e:
                 logger.error(f"Error deleting process panel from database: {e}", exc_info=True)
 
     # ========== ACTION BUTTON HANDLERS ==========
 
+    @pyqtSlot()
+    def _on_action_button_clicked(self):
+        """Dispatch a step action button (URL/CODE/PATH) using its 'kind' and 'content' properties"""
+        button = self.sender()
+        if button is None:
+            return
+        handler = getattr(self, f"on_{button.property('kind')}_button_clicked", None)
+        if handler:
+            handler(button.property("content"))
+
     def on_embedded_url_button_clicked(self, url: str):
         """Handle embedded browser button click - open URL in embedded browser"""
         try:
@@ -1092,8 +1415,6 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
     def on_external_url_button_clicked(self, url: str):
         """Handle external URL button click - open in system default browser"""
         try:
-            import webbrowser
-
             # Ensure URL has proper protocol
             if not url.startswith(('http://', 'https://')):
                 if url.startswith('www.'):
@@ -1101,7 +1422,9 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                 else:
                     url = 'https://' + url
 
-            webbrowser.open(url)
+            # No bloquea la UI (webbrowser.open puede lanzar xdg-open de forma síncrona)
+            if not QDesktopServices.openUrl(QUrl(url)):
+                raise RuntimeError("No hay aplicación asociada para abrir la URL")
             logger.info(f"Opening URL in system browser: {url}")
         except Exception as e:
             logger.error(f"Error opening URL {url}: {e}", exc_info=True)
@@ -1112,36 +1435,48 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
             )
 
     def on_code_button_clicked(self, command: str):
-        """Handle CODE button click - execute command"""
-        try:
-            import subprocess
+        """Handle CODE button click - ask for confirmation and execute command"""
+        if not command.strip():
+            return
 
-            # Confirmation dialog
-            reply = QMessageBox.question(
-                self,
-                "Ejecutar Comando",
-                f"¿Ejecutar el siguiente comando?\n\n{command}",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
+        # Confirmación no modal: el handler retorna de inmediato y el comando
+        # se ejecuta desde _run_confirmed_command al elegir "Sí"
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Ejecutar Comando",
+            f"¿Ejecutar el siguiente comando?\n\n{command}",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self
+        )
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.buttonClicked.connect(
+            lambda button: self._run_confirmed_command(command, box.standardButton(button))
+        )
+        box.open()
 
-            if reply == QMessageBox.StandardButton.Yes:
-                # Execute command in shell
-                if command.strip():
-                    # Run command in background without waiting
-                    subprocess.Popen(
-                        command,
-                        shell=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                    )
-                    logger.info(f"Executing command: {command}")
+    def _run_confirmed_command(self, command: str, answer):
+        """
+        Execute a command once its confirmation dialog is answered
 
-                    # Show feedback
-                    QMessageBox.information(
-                        self,
-                        "Comando Ejecutado",
-                        f"Comando ejecutado:\n{command}"
-                    )
+        Args:
+            command: Shell command to execute
+            answer: StandardButton chosen in the confirmation dialog
+        """
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+
+        try:
+            # Run command in background without waiting
+            subprocess.Popen(
+                command,
+                shell=True,
+                creationflags=_CREATE_NO_WINDOW
+            )
+            logger.info(f"Executing command: {command}")
+
+            # Show feedback (sin diálogo modal)
+            self._show_toast(f"✓ Comando ejecutado:\n{command}")
         except Exception as e:
             logger.error(f"Error executing command {command}: {e}")
             QMessageBox.critical(
@@ -1153,9 +1488,6 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
     def on_path_button_clicked(self, path: str):
         """Handle PATH button click - open file or folder"""
         try:
-            import os
-            import subprocess
-
             # Check if path exists
             if not os.path.exists(path):
                 QMessageBox.warning(
@@ -1165,11 +1497,9 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                 )
                 return
 
-            # Open with default application
-            if os.name == 'nt':  # Windows
-                os.startfile(path)
-            elif os.name == 'posix':  # Linux/Mac
-                subprocess.Popen(['xdg-open', path])
+            # Open with default application (Windows/Linux/Mac, sin lanzar procesos)
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(path)):
+                raise RuntimeError("No hay aplicación asociada para abrir la ruta")
 
             logger.info(f"Opening path: {path}")
 
@@ -1181,6 +1511,7 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
                 f"No se pudo abrir la ruta:\n{path}\n\nError: {str(e)}"
             )
 
+    @pyqtSlot(int, int)
     def on_panel_resized(self, width: int, height: int):
         """Handle panel resize completion from PanelResizer"""
         logger.info(f"Process Panel resized to: {width}x{height}")
@@ -9,7 +9,7 @@ Layout:
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
                              QPushButton, QComboBox, QMessageBox, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent, QAbstractListModel, QModelIndex
 from PyQt6.QtGui import QCursor
 import sys
 import logging
@@ -24,6 +24,96 @@ from core.pinned_panels_manager import PinnedPanelsManager
 logger = logging.getLogger(__name__)
 
 
+class ProcessesModel(QAbstractListModel):
+    """
+    Lazy list model of processes
+
+    Rows are fetched from the database in pages of `page_size` via
+    canFetchMore()/fetchMore(), so opening the panel only materializes the
+    first page instead of every process (with all its steps). The state filter
+    and search text are applied in SQL (see set_filters), so filtered results
+    are paged too.
+    """
+
+    def __init__(self, process_controller=None, page_size: int = 100, parent=None):
+        super().__init__(parent)
+        self.process_controller = process_controller
+        self.page_size = page_size
+        self._buffer = []
+        self._has_more = process_controller is not None
+        self.state_filter = "normal"
+        self.search_query = ""
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._buffer)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._buffer):
+            return None
+        process = self._buffer[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return process.name
+        if role == Qt.ItemDataRole.UserRole:
+            return process
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Fetch the next page of processes from database"""
+        if parent.isValid() or not self._has_more:
+            return
+
+        page = self.process_controller.get_all_processes(
+            limit=self.page_size,
+            offset=len(self._buffer),
+            state=self.state_filter,
+            search=self.search_query or None
+        )
+        if len(page) < self.page_size:
+            self._has_more = False
+        if not page:
+            return
+
+        first = len(self._buffer)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._buffer.extend(page)
+        self.endInsertRows()
+
+    def fetch_all(self):
+        """Fetch every remaining page (needed before searching/filtering)"""
+        while self.canFetchMore():
+            self.fetchMore()
+
+    def set_filters(self, state_filter: str, search_query: str):
+        """
+        Change the SQL filters and drop loaded rows (next fetchMore() starts over)
+
+        Args:
+            state_filter: 'normal', 'archived', 'inactive' or 'all'
+            search_query: Text to search (empty for none)
+        """
+        self.state_filter = state_filter
+        self.search_query = search_query
+        self.reset()
+
+    def reset(self):
+        """Drop loaded rows so the next fetchMore() starts from the first page"""
+        self.beginResetModel()
+        self._buffer = []
+        self._has_more = self.process_controller is not None
+        self.endResetModel()
+
+    def processes(self) -> list:
+        """Processes loaded so far"""
+        return list(self._buffer)
+
+
 class ProcessesFloatingPanel(QWidget):
     """Floating panel for viewing, searching and executing processes"""
 
@@ -35,23 +125,31 @@ class ProcessesFloatingPanel(QWidget):
     pin_state_changed = pyqtSignal(bool)  # True = pinned, False = unpinned
 
     def __init__(self, db_manager=None, config_manager=None, process_controller=None,
-                 parent=None, main_window=None):
+                 parent=None, main_window=None, panels_manager=None):
         super().__init__(parent)
         self.db_manager = db_manager
         self.config_manager = config_manager
         self.process_controller = process_controller
         self.main_window = main_window
 
-        # Store all processes
+        # Store all processes (loaded lazily through ProcessesModel)
         self.all_processes = []
         self.visible_processes = []
+        self.processes_model = ProcessesModel(process_controller, parent=self)
+        self.processes_model.rowsInserted.connect(self._on_processes_fetched)
+        self._processes_loaded = False
+        self._empty_label = None
+        self._process_widgets = {}  # process.id -> ProcessWidget (reutilizado al filtrar)
+        self._shown_process_count = 0  # Widgets visibles al inicio del layout
+        self._total_count = 0  # Procesos en BD (todos los estados)
+        self._matching_count = 0  # Procesos que coinciden con los filtros activos
 
         # Current filters
         self.current_search_query = ""
         self.current_state_filter = "normal"  # normal, archived, inactive, all
 
         # Search timer for debouncing
-        self.search_timer = QTimer()
+        self.search_timer = QTimer(self)
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self._perform_search)
         self.pending_search_query = ""
@@ -73,10 +171,12 @@ class ProcessesFloatingPanel(QWidget):
         self.normal_height = None
         self.normal_width = None
         self.normal_position = None
+        self._normal_size_limits = None  # (minimumSize, maximumSize) antes de minimizar
 
-        # Pinned panels manager
-        self.panels_manager = None
-        if self.db_manager:
+        # Pinned panels manager (el compartido del controller, para que su
+        # revision refleje también los guardados de este panel)
+        self.panels_manager = panels_manager
+        if self.panels_manager is None and self.db_manager:
             self.panels_manager = PinnedPanelsManager(self.db_manager)
 
         # Get panel width from config
@@ -90,6 +190,18 @@ class ProcessesFloatingPanel(QWidget):
         self.resize_start_x = 0
         self.resize_start_width = 0
         self.resize_edge_width = 15
+        self.resize_start_right = 0  # Borde derecho fijo durante el redimensionado
+        self.resize_width_bounds = (0, 0)  # (min, max) de ancho, leídos al iniciar
+        self._cursor_shape = None  # Cursor aplicado por hover (ver event)
+        self._press_geometry = None  # Geometría al pulsar: solo se guarda si cambió
+
+        # Arrastre/redimensionado: el último destino se aplica a ~60 Hz en lugar
+        # de un move/resize (relayout + repaint) por cada evento del mouse
+        self._pending_geometry = None  # (x, y, width) o None
+        self._geometry_timer = QTimer(self)
+        self._geometry_timer.setSingleShot(True)
+        self._geometry_timer.setInterval(16)
+        self._geometry_timer.timeout.connect(self._apply_pending_geometry)
 
         self.init_ui()
 
@@ -488,6 +600,10 @@ class ProcessesFloatingPanel(QWidget):
         self.scroll_area.setWidget(self.processes_container)
         parent_layout.addWidget(self.scroll_area)
 
+        # Fetch the next page of processes when scrolling near the bottom
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_processes_scrolled)
+        self.scroll_area.verticalScrollBar().rangeChanged.connect(self._on_processes_range_changed)
+
     # ========== SEARCH AND FILTER ==========
 
     def on_search_triggered(self, query: str):
@@ -497,100 +613,111 @@ class ProcessesFloatingPanel(QWidget):
 
     def _perform_search(self):
         """Perform the actual search"""
+        # Escribir y borrar dentro de la ventana de debounce deja la misma query:
+        # no hace falta volver a filtrar ni guardar el estado
+        if self.pending_search_query == self.current_search_query:
+            return
         self.current_search_query = self.pending_search_query
         self.apply_filters()
+        self.schedule_panel_update()
 
     def on_state_filter_changed(self, index: int):
         """Handle state filter change"""
         self.current_state_filter = self.state_filter_combo.currentData()
         self.apply_filters()
+        self.schedule_panel_update()
 
     def apply_filters(self):
-        """Apply all active filters and update display"""
-        # Start with all processes
-        filtered = self.all_processes[:]
-
-        # Apply state filter
-        filtered = self.filter_by_state(filtered)
+        """Apply all active filters and update display
 
-        # Apply search filter
-        if self.current_search_query:
-            filtered = self.search_processes(self.current_search_query, filtered)
+        State and search are resolved in SQL by the model: only the first page
+        of matching processes is loaded here, the rest is fetched on scroll.
+        """
+        if not self.process_controller:
+            return
 
-        # Update visible processes
-        self.visible_processes = filtered
+        self.processes_model.blockSignals(True)
+        try:
+            self.processes_model.set_filters(self.current_state_filter, self.current_search_query)
+            self.processes_model.fetchMore()
+        finally:
+            self.processes_model.blockSignals(False)
+
+        # Every loaded row already matches the filters
+        self.all_processes = self.processes_model.processes()
+        self.visible_processes = self.all_processes[:]
+
+        self._total_count = self.process_controller.count_processes(state='all')
+        self._matching_count = self.process_controller.count_processes(
+            state=self.current_state_filter,
+            search=self.current_search_query or None
+        )
 
         # Update UI
         self.update_processes_display()
         self.update_header_counter()
 
-    def filter_by_state(self, processes: list) -> list:
-        """Filter processes by state"""
-        if self.current_state_filter == "normal":
-            return [p for p in processes if p.is_active and not p.is_archived]
-        elif self.current_state_filter == "archived":
-            return [p for p in processes if p.is_archived]
-        elif self.current_state_filter == "inactive":
-            return [p for p in processes if not p.is_active]
-        else:  # "all"
-            return processes
-
-    def search_processes(self, query: str, processes: list) -> list:
-        """Search processes by text"""
-        query_lower = query.lower()
-        results = []
-
-        for process in processes:
-            # Search in name
-            if query_lower in process.name.lower():
-                results.append(process)
-                continue
-
-            # Search in description
-            if process.description and query_lower in process.description.lower():
-                results.append(process)
-                continue
-
-            # Search in tags
-            if process.tags and any(query_lower in tag.lower() for tag in process.tags):
-                results.append(process)
-                continue
-
-            # Search in step labels
-            if process.steps and any(query_lower in step.item_label.lower() for step in process.steps):
-                results.append(process)
-                continue
-
-        return results
-
     # ========== DISPLAY UPDATES ==========
 
     def update_processes_display(self):
-        """Update the processes list display"""
-        # Clear existing widgets
-        while self.processes_layout.count():
-            item = self.processes_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Add process widgets
-        if not self.visible_processes:
-            # Show empty state
-            empty_label = QLabel("No se encontraron procesos")
-            empty_label.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 11pt;
-                    padding: 40px;
-                }
-            """)
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.processes_layout.addWidget(empty_label)
-        else:
-            # Import here to avoid circular import
-            from views.widgets.process_widget import ProcessWidget
+        """Update the processes list display
+
+        Widgets are kept per process and reused across filter changes: matching
+        processes are shown in order and the rest hidden, so only processes
+        without a widget yet are instantiated.
+        """
+        # Un solo relayout/paint al final en lugar de uno por proceso
+        self.processes_container.setUpdatesEnabled(False)
+        try:
+            for widget in self._process_widgets.values():
+                widget.hide()
+            self._shown_process_count = 0
+            self._remove_empty_label()
+
+            if not self.visible_processes:
+                # Show empty state
+                self._empty_label = QLabel("No se encontraron procesos")
+                self._empty_label.setStyleSheet("""
+                    QLabel {
+                        color: #888888;
+                        font-size: 11pt;
+                        padding: 40px;
+                    }
+                """)
+                self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.processes_layout.insertWidget(0, self._empty_label)
+            else:
+                self._add_process_widgets(self.visible_processes)
+        finally:
+            self.processes_container.setUpdatesEnabled(True)
+
+    def _remove_empty_label(self):
+        """Remove the empty-state label from the list, if shown"""
+        if self._empty_label:
+            self.processes_layout.removeWidget(self._empty_label)
+            self._empty_label.deleteLater()
+            self._empty_label = None
+
+    def _clear_process_widgets(self):
+        """Destroy every process widget (the processes were reloaded)"""
+        for widget in self._process_widgets.values():
+            self.processes_layout.removeWidget(widget)
+            widget.deleteLater()
+        self._process_widgets = {}
+        self._shown_process_count = 0
+
+    def _add_process_widgets(self, processes: list):
+        """Show the widgets of the given processes after the visible ones"""
+        # Import here to avoid circular import
+        from views.widgets.process_widget import ProcessWidget
+
+        if processes:
+            self._remove_empty_label()
 
-            for process in self.visible_processes:
+        for process in processes:
+            index = self._shown_process_count
+            process_widget = self._process_widgets.get(process.id)
+            if process_widget is None:
                 process_widget = ProcessWidget(process, parent=self)
 
                 # Connect signals
@@ -600,12 +727,37 @@ class ProcessesFloatingPanel(QWidget):
                 process_widget.process_pinned.connect(self.on_process_pinned)
                 process_widget.copy_all_requested.connect(self.on_copy_all_requested)
 
-                self.processes_layout.addWidget(process_widget)
+                self._process_widgets[process.id] = process_widget
+                self.processes_layout.insertWidget(index, process_widget)
+            else:
+                if self.processes_layout.indexOf(process_widget) != index:
+                    self.processes_layout.removeWidget(process_widget)
+                    self.processes_layout.insertWidget(index, process_widget)
+                process_widget.show()
+            self._shown_process_count += 1
+
+    def _on_processes_fetched(self, parent, first: int, last: int):
+        """Append widgets for a page of processes fetched by the model"""
+        # Rows come filtered from SQL: append them as they are
+        new_processes = self.processes_model.processes()[first:last + 1]
+        self.all_processes.extend(new_processes)
+        self.visible_processes.extend(new_processes)
+        self._add_process_widgets(new_processes)
+
+    def _on_processes_scrolled(self, value: int):
+        """Fetch more processes when the list is scrolled near the bottom"""
+        scrollbar = self.scroll_area.verticalScrollBar()
+        if value >= scrollbar.maximum() - 200 and self.processes_model.canFetchMore():
+            self.processes_model.fetchMore()
+
+    def _on_processes_range_changed(self, minimum: int, maximum: int):
+        """Fetch more processes while the loaded ones do not fill the list"""
+        self._on_processes_scrolled(self.scroll_area.verticalScrollBar().value())
 
     def update_header_counter(self):
         """Update process counter in header"""
-        total = len(self.all_processes)
-        visible = len(self.visible_processes)
+        total = self._total_count
+        visible = self._matching_count
 
         if visible == total:
             self.header_label.setText(f"⚙️ Procesos ({total})")
@@ -621,6 +773,10 @@ class ProcessesFloatingPanel(QWidget):
 
     def on_execute_all_clicked(self):
         """Execute all visible processes sequentially"""
+        # Todos los que coinciden con los filtros, no solo las páginas cargadas
+        if self.processes_model.canFetchMore():
+            self.processes_model.fetch_all()
+
         if not self.visible_processes:
             QMessageBox.warning(self, "Sin Procesos", "No hay procesos visibles para ejecutar")
             return
@@ -788,58 +944,62 @@ class ProcessesFloatingPanel(QWidget):
 
         self.is_minimized = not self.is_minimized
 
-        if self.is_minimized:
-            # Save current size and position
-            self.normal_height = self.height()
-            self.normal_width = self.width()
-            self.normal_position = self.pos()
-
-            # Hide content widgets
-            self.scroll_area.hide()
-            self.search_widget.hide()
-            self.action_widget.hide()
-
-            # Hide display options widget if it exists
-            if hasattr(self, 'display_options_widget'):
-                self.display_options_widget.setVisible(False)
-
-            # Resize to compact size with better button visibility (height: 50px, width: 250px)
-            minimized_height = 50  # Good height for button visibility
-            minimized_width = 250  # Width to show all buttons
-            self.resize(minimized_width, minimized_height)
-
-            # Set fixed size to prevent unwanted resizing
-            self.setFixedSize(minimized_width, minimized_height)
-
-            self.minimize_button.setText("🔼")
-            self.minimize_button.setToolTip("Restaurar panel")
-        else:
-            # Restore content widgets
-            self.scroll_area.show()
-            self.search_widget.show()
-            self.action_widget.show()
-
-            # Restore display options widget if it exists
-            if hasattr(self, 'display_options_widget'):
-                self.display_options_widget.setVisible(True)
-
-            # CRITICAL: Remove fixed size constraint first (set to maximum QWidget size)
-            self.setFixedSize(16777215, 16777215)  # Maximum allowed size for QWidget
+        # Un solo relayout/paint por transición
+        self.setUpdatesEnabled(False)
+        try:
+            if self.is_minimized:
+                # Save current size, position and size constraints
+                self.normal_height = self.height()
+                self.normal_width = self.width()
+                self.normal_position = self.pos()
+                self._normal_size_limits = (self.minimumSize(), self.maximumSize())
+
+                # Compact size with better button visibility (height: 50px, width: 250px);
+                # min == max prevents unwanted resizing
+                minimized_width = 250  # Width to show all buttons
+                minimized_height = 50  # Good height for button visibility
+                self.setMinimumSize(minimized_width, minimized_height)
+                self.setMaximumSize(minimized_width, minimized_height)
+                self.resize(minimized_width, minimized_height)
+
+                # Hide content widgets (last, once the size is already compact)
+                self.scroll_area.hide()
+                self.search_widget.hide()
+                self.action_widget.hide()
+                if hasattr(self, 'display_options_widget'):
+                    self.display_options_widget.setVisible(False)
+
+                self.minimize_button.setText("🔼")
+                self.minimize_button.setToolTip("Restaurar panel")
+            else:
+                # Restore content widgets
+                self.scroll_area.show()
+                self.search_widget.show()
+                self.action_widget.show()
+                if hasattr(self, 'display_options_widget'):
+                    self.display_options_widget.setVisible(True)
+
+                # Restore the size constraints saved when minimizing
+                if self._normal_size_limits:
+                    minimum_size, maximum_size = self._normal_size_limits
+                    self.setMaximumSize(maximum_size)
+                    self.setMinimumSize(minimum_size)
+                else:
+                    self.setMaximumSize(1000, 16777215)
+                    self.setMinimumSize(300, 400)
 
-            # CRITICAL: Restore proper size constraints for normal resizing
-            self.setMinimumWidth(300)
-            self.setMinimumHeight(400)
-            self.setMaximumWidth(16777215)  # No maximum width limit
-            self.setMaximumHeight(16777215)  # No maximum height limit
+                # Restore original size
+                if self.normal_height:
+                    self.resize(self.normal_width, self.normal_height)
+                if self.normal_position:
+                    self.move(self.normal_position)
 
-            # Restore original size
-            if self.normal_height:
-                self.resize(self.normal_width, self.normal_height)
-            if self.normal_position:
-                self.move(self.normal_position)
+                self.minimize_button.setText("➖")
+                self.minimize_button.setToolTip("Minimizar panel")
+        finally:
+            self.setUpdatesEnabled(True)
 
-            self.minimize_button.setText("➖")
-            self.minimize_button.setToolTip("Minimizar panel")
+        self.schedule_panel_update()
 
     def show_panel_configuration(self):
         """Show panel configuration dialog"""
@@ -848,6 +1008,12 @@ class ProcessesFloatingPanel(QWidget):
 
     # ========== PERSISTENCE ==========
 
+    def schedule_panel_update(self):
+        """Schedule a debounced panel state update (a burst of changes → one write)"""
+        if not self.is_pinned:
+            return
+        self.update_timer.start(self.update_delay_ms)
+
     def _save_panel_state_to_db(self):
         """Save panel state to database"""
         if not self.is_pinned or not self.panels_manager:
@@ -891,12 +1057,14 @@ class ProcessesFloatingPanel(QWidget):
     # ========== DATA LOADING ==========
 
     def load_all_processes(self):
-        """Load all processes from database"""
+        """Load processes from database (first page; the rest is fetched on scroll)"""
         try:
             if self.process_controller:
-                self.all_processes = self.process_controller.get_all_processes()
-                logger.info(f"Loaded {len(self.all_processes)} processes")
+                self._processes_loaded = True
+                # Los procesos se recargan: los widgets existentes quedan obsoletos
+                self._clear_process_widgets()
                 self.apply_filters()
+                logger.info(f"Loaded {len(self.all_processes)} of {self._matching_count} processes")
             else:
                 logger.error("No process controller available")
         except Exception as e:
@@ -922,35 +1090,46 @@ class ProcessesFloatingPanel(QWidget):
 
     # ========== WINDOW EVENTS ==========
 
+    def showEvent(self, event):
+        """Load the first page of processes lazily, after the panel is painted"""
+        super().showEvent(event)
+        if not self._processes_loaded:
+            self._processes_loaded = True
+            QTimer.singleShot(0, self.load_all_processes)
+
     def is_on_left_edge(self, pos):
         """Check if mouse position is on the left edge for resizing"""
         return pos.x() <= self.resize_edge_width
 
     def event(self, event):
         """Override event to handle hover for cursor changes"""
-        from PyQt6.QtCore import QEvent
-        from PyQt6.QtGui import QCursor
-
         if event.type() == QEvent.Type.HoverMove:
-            pos = event.position().toPoint()
-            if self.is_on_left_edge(pos):
-                self.setCursor(QCursor(Qt.CursorShape.SizeHorCursor))
+            if event.position().x() <= self.resize_edge_width:
+                shape = Qt.CursorShape.SizeHorCursor
             else:
-                self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+                shape = Qt.CursorShape.ArrowCursor
+            # Solo al cruzar el borde: setCursor notifica al sistema de ventanas
+            if shape != self._cursor_shape:
+                self._cursor_shape = shape
+                self.setCursor(QCursor(shape))
         return super().event(event)
 
     def mousePressEvent(self, event):
         """Handle mouse press for dragging or resizing"""
         if event.button() == Qt.MouseButton.LeftButton:
+            self._press_geometry = self.geometry()
             if self.is_on_left_edge(event.pos()):
                 # Start resizing
                 self.resizing = True
+                width = self.width()
                 self.resize_start_x = event.globalPosition().toPoint().x()
-                self.resize_start_width = self.width()
+                self.resize_start_width = width
+                self.resize_start_right = self.x() + width
+                self.resize_width_bounds = (self.minimumWidth(), self.maximumWidth())
                 event.accept()
             else:
-                # Start dragging
-                self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+                # Start dragging (ventana sin marco: pos() == esquina del frame)
+                self.drag_position = event.globalPosition().toPoint() - self.pos()
                 event.accept()
 
     def mouseMoveEvent(self, event):
@@ -963,34 +1142,66 @@ class ProcessesFloatingPanel(QWidget):
                 new_width = self.resize_start_width - delta_x  # Subtract because we're dragging from left edge
 
                 # Apply constraints
-                new_width = max(self.minimumWidth(), min(new_width, self.maximumWidth()))
-
-                # Resize and reposition
-                old_width = self.width()
-                old_x = self.x()
-                self.resize(new_width, self.height())
-
-                # Adjust position to keep right edge fixed
-                width_diff = self.width() - old_width
-                self.move(old_x - width_diff, self.y())
+                min_width, max_width = self.resize_width_bounds
+                new_width = max(min_width, min(new_width, max_width))
 
+                # Keep right edge fixed
+                self._queue_geometry(self.resize_start_right - new_width, self.y(), new_width)
                 event.accept()
             else:
                 # Dragging
-                self.move(event.globalPosition().toPoint() - self.drag_position)
+                new_pos = event.globalPosition().toPoint() - self.drag_position
+                self._queue_geometry(new_pos.x(), new_pos.y(), None)
                 event.accept()
 
+    def _queue_geometry(self, x: int, y: int, width):
+        """
+        Store the target geometry of a drag/resize and apply it on the next tick
+
+        Args:
+            x: Target x position
+            y: Target y position
+            width: Target width (None to keep the current one)
+        """
+        self._pending_geometry = (x, y, width)
+        if not self._geometry_timer.isActive():
+            self._geometry_timer.start()
+
+    def _apply_pending_geometry(self):
+        """Apply the last queued drag/resize geometry"""
+        if self._pending_geometry is None:
+            return
+        x, y, width = self._pending_geometry
+        self._pending_geometry = None
+        if width is None:
+            self.move(x, y)
+        else:
+            # Frameless: un solo cambio de geometría para tamaño y posición
+            self.setGeometry(x, y, width, self.height())
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release to end resizing"""
         if event.button() == Qt.MouseButton.LeftButton:
+            # Aplicar ya la posición/tamaño final pendiente
+            self._geometry_timer.stop()
+            self._apply_pending_geometry()
+            moved = self._press_geometry is not None and self.geometry() != self._press_geometry
+            self._press_geometry = None
             if self.resizing:
                 self.resizing = False
                 # Save new width to config
-                if self.config_manager:
+                if moved and self.config_manager:
                     self.config_manager.set_setting('panel_width', self.width())
                 event.accept()
+            # Solo un arrastre o redimensionado real guarda la geometría (debounced)
+            if moved:
+                self.schedule_panel_update()
 
     def closeEvent(self, event):
         """Handle window close"""
+        # No perder un guardado pendiente del debounce
+        if self.update_timer.isActive():
+            self.update_timer.stop()
+            self._save_panel_state_to_db()
         self.window_closed.emit()
         event.accept()
@@ -108,6 +108,7 @@ class Sidebar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.category_buttons = {}
+        self._category_order = {}  # category_id -> (order_index, id), orden de los botones
         self.active_button = None
         self.scroll_area = None
         self.theme = get_theme()  # Obtener tema futurista
@@ -652,6 +653,7 @@ class Sidebar(QWidget):
             button.clicked.connect(lambda checked, cat_id=category.id: self.on_category_clicked(cat_id))
 
             self.category_buttons[category.id] = button
+            self._category_order[category.id] = (category.order_index, category.id)
             # Insert before the stretch
             self.buttons_layout.insertWidget(self.buttons_layout.count() - 1, button)
 
@@ -659,11 +661,73 @@ class Sidebar(QWidget):
         self.scroll_area.verticalScrollBar().valueChanged.connect(self.update_scroll_buttons)
         self.update_scroll_buttons()
 
+    def update_category(self, category: Category):
+        """Update (or add) the button of a single category without rebuilding the list"""
+        button = self.category_buttons.get(category.id)
+
+        if not category.is_active:
+            if button:
+                button.deleteLater()
+                del self.category_buttons[category.id]
+                self._category_order.pop(category.id, None)
+            return
+
+        sort_key = (category.order_index, category.id)
+
+        if button:
+            button.category_name = category.name
+            button.setText(category.name)
+            button.setToolTip(category.name)
+            if self._category_order.get(category.id) == sort_key:
+                return
+            # Cambió el orden: recolocar el botón en su posición
+            self.buttons_layout.removeWidget(button)
+        else:
+            button = CategoryButton(category.id, category.name)
+            button.clicked.connect(lambda checked, cat_id=category.id: self.on_category_clicked(cat_id))
+            self.category_buttons[category.id] = button
+
+        self._category_order[category.id] = sort_key
+        self.buttons_layout.insertWidget(self._category_insert_index(category.id, sort_key), button)
+        self.update_scroll_buttons()
+
+    def _category_insert_index(self, category_id: int, sort_key) -> int:
+        """
+        Get the layout index where a category button belongs by its sort order
+
+        Args:
+            category_id: ID of the category being placed
+            sort_key: (order_index, id) of the category
+
+        Returns:
+            Layout index just before the first category button that sorts after it,
+            or right after the last category button (before the stretch if none)
+        """
+        first_after = None
+        last_index = None
+        for other_id, other_button in self.category_buttons.items():
+            if other_id == category_id:
+                continue
+            index = self.buttons_layout.indexOf(other_button)
+            if index < 0:
+                continue
+            if self._category_order.get(other_id, (0, other_id)) > sort_key:
+                first_after = index if first_after is None else min(first_after, index)
+            else:
+                last_index = index if last_index is None else max(last_index, index)
+
+        if first_after is not None:
+            return first_after
+        if last_index is None:
+            return self.buttons_layout.count() - 1
+        return last_index + 1
+
     def clear_buttons(self):
         """Clear all category buttons"""
         for button in self.category_buttons.values():
             button.deleteLater()
         self.category_buttons.clear()
+        self._category_order.clear()
         self.active_button = None
 
     def load_active_processes(self, processes):